@@ -83,6 +83,7 @@ with st.sidebar:
     st.page_link("pages/4Intervalos_Mitad.py", label="✂️ Intervalos por la mitad")
     st.page_link("pages/5Fibonacci.py", label="🔢 Fibonacci")
     st.page_link("pages/6Busqueda_dorada.py", label="🌟 Búsqueda Dorada")
+    st.page_link("pages/21Brent.py", label="🪄 Brent")
     st.page_link("pages/7Newton_Raphson.py", label="📉 Newton-Raphson")
     st.page_link("pages/8Biseccion.py", label="🪓 Bisección")
     st.page_link("pages/9Secante.py", label="➗ Secante")
@@ -95,3 +96,5 @@ with st.sidebar:
     st.page_link("pages/16Metodos_De_Gradiente.py", label="📈 Métodos basados en gradiente")
     st.page_link("pages/17Cauchy.py", label="🎯 Método de Cauchy")
     st.page_link("pages/18Newton.py", label="⚙️ Método de Newton")
+    st.page_link("pages/19BFGS.py", label="🧮 BFGS")
+    st.page_link("pages/20LBFGS.py", label="🪶 L-BFGS")
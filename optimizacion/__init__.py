@@ -0,0 +1 @@
+from .funciones import FUNCIONES, FUNCIONES_1D, FuncionPrueba
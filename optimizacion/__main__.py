@@ -0,0 +1,62 @@
+import argparse
+import json
+
+from .funciones import FUNCIONES, FUNCIONES_1D
+from .metodos import METODOS_1D, METODOS_ND, ejecutar
+
+
+# Parámetros de `ejecutar` que tienen su propio argumento en la línea de comandos.
+RESERVADAS = ("metodo", "funcion", "dimension", "semilla", "x0")
+
+
+def _valor(texto):
+    try:
+        return json.loads(texto)
+    except json.JSONDecodeError:
+        return texto
+
+
+def _opciones(pares):
+    opciones = {}
+    for par in pares:
+        clave, igual, texto = par.partition("=")
+        if not igual or not clave:
+            raise ValueError(f"la opción {par!r} no tiene la forma CLAVE=VALOR")
+        if clave in RESERVADAS:
+            raise ValueError(f"{clave} no es una opción del método; usa --{clave}")
+        opciones[clave] = _valor(texto)
+    return opciones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m optimizacion",
+                                     description="Ejecuta un método de optimización e imprime el resultado en JSON.")
+    parser.add_argument("metodo", nargs="?", help="método a ejecutar; sin argumentos lista métodos y funciones")
+    parser.add_argument("funcion", nargs="?", help="nombre de la función registrada")
+    parser.add_argument("-d", "--dimension", type=int, help="dimensión para funciones N-D de dimensión libre")
+    parser.add_argument("-s", "--semilla", type=int, help="semilla del punto inicial y de los métodos aleatorios")
+    parser.add_argument("--x0", type=json.loads, help="punto inicial como JSON, p. ej. '[1.5, -2]' o '3.0'")
+    parser.add_argument("-o", "--opcion", action="append", default=[], metavar="CLAVE=VALOR",
+                        help="parámetro del método; el valor se interpreta como JSON si es posible")
+    args = parser.parse_args(argv)
+
+    if args.metodo is None:
+        salida = {
+            "metodos_1d": list(METODOS_1D),
+            "metodos_nd": list(METODOS_ND),
+            "funciones_1d": list(FUNCIONES_1D),
+            "funciones_nd": list(FUNCIONES),
+        }
+    else:
+        if args.funcion is None:
+            parser.error("falta el nombre de la función")
+        try:
+            salida = ejecutar(args.metodo, args.funcion, dimension=args.dimension, semilla=args.semilla,
+                              x0=args.x0, **_opciones(args.opcion))
+        except ValueError as error:
+            parser.error(str(error))
+    print(json.dumps(salida, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import numpy as np
+
+TAM_BLOQUE = 65536
+
+
+class GeneradorBloques:
+    """Capa sobre `np.random.Generator` que pre-genera muestras por bloques.
+
+    Las muestras normales y uniformes estándar se sacan de búferes de
+    `tam_bloque` valores, de modo que pedir un número o un vector pequeño en
+    cada paso no paga el costo de una llamada al generador. Con la misma
+    `semilla` (entero o `SeedSequence`) la secuencia es reproducible, y
+    `spawn` crea flujos hijos independientes para procesos trabajadores.
+    """
+
+    def __init__(self, semilla=None, tam_bloque=TAM_BLOQUE):
+        if isinstance(semilla, np.random.SeedSequence):
+            self.secuencia = semilla
+        else:
+            self.secuencia = np.random.SeedSequence(semilla)
+        self.generador = np.random.default_rng(self.secuencia)
+        self.tam_bloque = tam_bloque
+        self._bloques = {"normal": np.empty(0), "uniforme": np.empty(0)}
+        self._posiciones = {"normal": 0, "uniforme": 0}
+
+    def _generar(self, tipo, n):
+        if tipo == "normal":
+            return self.generador.standard_normal(n)
+        return self.generador.random(n)
+
+    def _tomar(self, tipo, n):
+        if n > self.tam_bloque:
+            return self._generar(tipo, n)
+        bloque, posicion = self._bloques[tipo], self._posiciones[tipo]
+        if posicion + n > len(bloque):
+            bloque = self._bloques[tipo] = self._generar(tipo, self.tam_bloque)
+            posicion = 0
+        self._posiciones[tipo] = posicion + n
+        return bloque[posicion:posicion + n]
+
+    def _muestras(self, tipo, size):
+        if size is None:
+            return self._tomar(tipo, 1)[0]
+        forma = (size,) if np.isscalar(size) else tuple(size)
+        return self._tomar(tipo, int(np.prod(forma))).reshape(forma)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        return loc + scale * self._muestras("normal", size)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return low + (high - low) * self._muestras("uniforme", size)
+
+    def spawn(self, n):
+        return [GeneradorBloques(hija, self.tam_bloque) for hija in self.secuencia.spawn(n)]
+
+
+def como_generador(rng=None, semilla=None):
+    if rng is not None:
+        return rng
+    return GeneradorBloques(semilla)
@@ -0,0 +1,229 @@
+"""Banco de pruebas reproducible: todos los métodos sobre todas las funciones registradas.
+
+Uso:
+    python -m optimizacion.benchmark correr -o reporte.json
+    python -m optimizacion.benchmark comparar base.json nuevo.json
+"""
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from time import perf_counter
+
+import numpy as np
+
+from .funciones import FUNCIONES, FUNCIONES_1D
+from .metodos import METODOS_1D, METODOS_ND, ejecutar
+
+DIMENSIONES = (2, 5, 10)
+SEMILLAS = (0, 1, 2)
+VERSION_REPORTE = 1
+
+
+def casos(metodos=None, funciones=None, dimensiones=DIMENSIONES, semillas=SEMILLAS):
+    """Genera (metodo, funcion, dimension, semilla) para cada corrida del banco.
+
+    Los métodos 1D son deterministas y se corren una sola vez por función; los
+    N-D se corren en cada dimensión (si la función la admite) y cada semilla.
+    """
+    for metodo in METODOS_1D:
+        if metodos and metodo not in metodos:
+            continue
+        for funcion in FUNCIONES_1D:
+            if not funciones or funcion in funciones:
+                yield metodo, funcion, 1, None
+    for metodo in METODOS_ND:
+        if metodos and metodo not in metodos:
+            continue
+        for funcion, prueba in FUNCIONES.items():
+            if funciones and funcion not in funciones:
+                continue
+            for dimension in ((prueba.dimension,) if prueba.dimension else dimensiones):
+                for semilla in semillas:
+                    yield metodo, funcion, dimension, semilla
+
+
+def medir(metodo, funcion, dimension, semilla, repeticiones=1, memoria=True):
+    """Corre un caso y devuelve su registro: el mejor tiempo de `repeticiones` y el pico de memoria.
+
+    El pico se mide en una corrida aparte bajo `tracemalloc`, que no cuenta
+    para el tiempo.
+    """
+    registro = {"metodo": metodo, "funcion": funcion, "dimension": dimension, "semilla": semilla}
+    try:
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = perf_counter()
+            resultado = ejecutar(metodo, funcion, dimension=dimension, semilla=semilla)
+            tiempos.append(perf_counter() - inicio)
+
+        pico = None
+        if memoria:
+            tracemalloc.start()
+            try:
+                ejecutar(metodo, funcion, dimension=dimension, semilla=semilla)
+                _, pico = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    except Exception as error:
+        registro["error"] = f"{type(error).__name__}: {error}"
+        return registro
+
+    metricas = resultado["metricas"]
+    registro.update({
+        "tiempo_s": min(tiempos),
+        "nfev": metricas["nfev"],
+        "ngev": metricas["ngev"],
+        "nhev": metricas["nhev"],
+        "iteraciones": metricas["iteraciones"],
+        "f": resultado["f"],
+        "error_f": resultado["error_f"],
+        "error_x": resultado["error_x"],
+        "memoria_pico_kb": None if pico is None else pico / 1024,
+        "avisos": len(resultado["avisos"]),
+    })
+    return registro
+
+
+def correr(metodos=None, funciones=None, dimensiones=DIMENSIONES, semillas=SEMILLAS, repeticiones=1,
+           memoria=True, progreso=None):
+    lista = list(casos(metodos, funciones, dimensiones, semillas))
+    resultados = []
+    for i, caso in enumerate(lista, 1):
+        resultados.append(medir(*caso, repeticiones=repeticiones, memoria=memoria))
+        if progreso:
+            progreso(i, len(lista), resultados[-1])
+    return {
+        "version": VERSION_REPORTE,
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "entorno": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "procesador": platform.processor() or platform.machine(),
+        },
+        "configuracion": {
+            "dimensiones": list(dimensiones),
+            "semillas": list(semillas),
+            "repeticiones": repeticiones,
+            "memoria": memoria,
+        },
+        "resultados": resultados,
+    }
+
+
+def _clave(registro):
+    return registro["metodo"], registro["funcion"], registro["dimension"], registro["semilla"]
+
+
+def comparar(base, nuevo, tolerancia_tiempo=0.25, piso_tiempo=5e-3, tolerancia_nfev=0.0, tolerancia_error=1e-6,
+             tolerancia_memoria=0.25):
+    """Compara dos reportes caso por caso y devuelve las regresiones y mejoras encontradas.
+
+    Hay regresión de tiempo si el nuevo supera al base en más de
+    `tolerancia_tiempo` (relativo) y de `piso_tiempo` segundos; de nfev si crece
+    más de `tolerancia_nfev` (relativo); de error si `error_f` crece más de
+    `tolerancia_error`; de memoria si el pico crece más de `tolerancia_memoria`
+    (relativo) y de 64 KB; y de estado si un caso que corría ahora falla.
+    """
+    casos_base = {_clave(r): r for r in base["resultados"]}
+    regresiones, mejoras, sin_par = [], [], []
+    for registro in nuevo["resultados"]:
+        clave = _clave(registro)
+        anterior = casos_base.get(clave)
+        if anterior is None:
+            sin_par.append(clave)
+            continue
+        if "error" in registro or "error" in anterior:
+            if "error" in registro and "error" not in anterior:
+                regresiones.append({"caso": clave, "medida": "estado", "base": "ok", "nuevo": registro["error"]})
+            continue
+
+        for medida, peor, mejor in (
+            ("tiempo_s",
+             lambda b, n: n > b * (1 + tolerancia_tiempo) and n - b > piso_tiempo,
+             lambda b, n: b > n * (1 + tolerancia_tiempo) and b - n > piso_tiempo),
+            ("nfev",
+             lambda b, n: n > b * (1 + tolerancia_nfev),
+             lambda b, n: n < b / (1 + tolerancia_nfev)),
+            ("error_f",
+             lambda b, n: n > b + tolerancia_error,
+             lambda b, n: n < b - tolerancia_error),
+            ("memoria_pico_kb",
+             lambda b, n: b is not None and n is not None and n > b * (1 + tolerancia_memoria) and n - b > 64,
+             lambda b, n: b is not None and n is not None and b > n * (1 + tolerancia_memoria) and b - n > 64),
+        ):
+            b, n = anterior[medida], registro[medida]
+            cambio = {"caso": clave, "medida": medida, "base": b, "nuevo": n}
+            if peor(b, n):
+                regresiones.append(cambio)
+            elif mejor(b, n):
+                mejoras.append(cambio)
+    return {"regresiones": regresiones, "mejoras": mejoras, "sin_par": sin_par}
+
+
+def _resumen(reporte):
+    validos = [r for r in reporte["resultados"] if "error" not in r]
+    return {
+        "casos": len(reporte["resultados"]),
+        "fallidos": len(reporte["resultados"]) - len(validos),
+        "tiempo_total_s": round(sum(r["tiempo_s"] for r in validos), 4),
+        "nfev_total": sum(r["nfev"] for r in validos),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m optimizacion.benchmark", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="orden", required=True)
+
+    p_correr = subparsers.add_parser("correr", help="ejecuta el banco y escribe el reporte JSON")
+    p_correr.add_argument("-o", "--salida", default="-", help="archivo del reporte; '-' para stdout")
+    p_correr.add_argument("-m", "--metodos", nargs="+", help="limitar a estos métodos")
+    p_correr.add_argument("-f", "--funciones", nargs="+", help="limitar a estas funciones")
+    p_correr.add_argument("-d", "--dimensiones", nargs="+", type=int, default=list(DIMENSIONES))
+    p_correr.add_argument("-s", "--semillas", nargs="+", type=int, default=list(SEMILLAS))
+    p_correr.add_argument("-r", "--repeticiones", type=int, default=1, help="se reporta el mejor tiempo")
+    p_correr.add_argument("--sin-memoria", action="store_true", help="omite la corrida extra bajo tracemalloc")
+
+    p_comparar = subparsers.add_parser("comparar", help="compara dos reportes y marca regresiones")
+    p_comparar.add_argument("base")
+    p_comparar.add_argument("nuevo")
+    p_comparar.add_argument("--tolerancia-tiempo", type=float, default=0.25)
+    p_comparar.add_argument("--piso-tiempo", type=float, default=5e-3, help="segundos")
+    p_comparar.add_argument("--tolerancia-nfev", type=float, default=0.0)
+    p_comparar.add_argument("--tolerancia-error", type=float, default=1e-6)
+    p_comparar.add_argument("--tolerancia-memoria", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    if args.orden == "correr":
+        def progreso(i, total, registro):
+            print(f"[{i}/{total}] {registro['metodo']} {registro['funcion']} d={registro['dimension']} "
+                  f"semilla={registro['semilla']}", file=sys.stderr)
+
+        reporte = correr(args.metodos, args.funciones, args.dimensiones, args.semillas, args.repeticiones,
+                         memoria=not args.sin_memoria, progreso=progreso)
+        texto = json.dumps(reporte, ensure_ascii=False, indent=2)
+        if args.salida == "-":
+            print(texto)
+        else:
+            with open(args.salida, "w", encoding="utf-8") as archivo:
+                archivo.write(texto)
+            print(json.dumps(_resumen(reporte), ensure_ascii=False), file=sys.stderr)
+        return 0
+
+    with open(args.base, encoding="utf-8") as archivo:
+        base = json.load(archivo)
+    with open(args.nuevo, encoding="utf-8") as archivo:
+        nuevo = json.load(archivo)
+    comparacion = comparar(base, nuevo, args.tolerancia_tiempo, args.piso_tiempo, args.tolerancia_nfev,
+                           args.tolerancia_error, args.tolerancia_memoria)
+    comparacion["resumen"] = {"base": _resumen(base), "nuevo": _resumen(nuevo)}
+    print(json.dumps(comparacion, ensure_ascii=False, indent=2))
+    return 1 if comparacion["regresiones"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
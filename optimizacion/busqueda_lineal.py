@@ -0,0 +1,118 @@
+"""Búsquedas de línea para los métodos con gradiente.
+
+Trabajan sobre φ(α) = f(x + α·d) y su derivada φ'(α) = ∇f(x + α·d)·d, y
+devuelven el paso α junto con φ(α). `BUSQUEDAS` las reúne con una firma común
+para que los optimizadores las elijan por nombre.
+"""
+import warnings
+
+from .evaluador import memoizar
+from .unidimensional import fase_acotamiento, reducir_intervalo
+
+
+def _interpolar(lo, hi, f_lo, d_lo, f_hi):
+    """Mínimo de la cuadrática con φ(lo), φ'(lo) y φ(hi), acotado al centro del intervalo."""
+    ancho = hi - lo
+    denominador = 2 * (f_hi - f_lo - d_lo * ancho)
+    alpha = lo - d_lo * ancho**2 / denominador if denominador > 0 else lo + ancho / 2
+    izquierda, derecha = sorted((lo + 0.1 * ancho, hi - 0.1 * ancho))
+    return min(max(alpha, izquierda), derecha)
+
+
+def _zoom(phi, dphi, phi0, dphi0, lo, hi, f_lo, d_lo, f_hi, c1, c2, max_iter):
+    alpha, f_alpha = lo, f_lo
+    for _ in range(max_iter):
+        alpha = _interpolar(lo, hi, f_lo, d_lo, f_hi)
+        f_alpha = phi(alpha)
+        if f_alpha > phi0 + c1 * alpha * dphi0 or f_alpha >= f_lo:
+            hi, f_hi = alpha, f_alpha
+            continue
+        d_alpha = dphi(alpha)
+        if abs(d_alpha) <= -c2 * dphi0:
+            return alpha, f_alpha
+        if d_alpha * (hi - lo) >= 0:
+            hi, f_hi = lo, f_lo
+        lo, f_lo, d_lo = alpha, f_alpha, d_alpha
+        if abs(hi - lo) < 1e-12:
+            break
+    return lo, f_lo
+
+
+def wolfe_fuerte(phi, dphi, phi0, dphi0, alpha=1.0, c1=1e-4, c2=0.9, alpha_max=1e3, max_iter=25):
+    """Paso que cumple las condiciones fuertes de Wolfe (Nocedal y Wright, algoritmos 3.5 y 3.6).
+
+    Suficiente descenso, φ(α) ≤ φ(0) + c1·α·φ'(0), y curvatura, |φ'(α)| ≤ c2·|φ'(0)|.
+    Amplía α hasta acotar un intervalo con un paso aceptable y luego lo reduce
+    por interpolación cuadrática. `dphi0` debe ser negativo (dirección de descenso).
+    """
+    alpha_previo, f_previo, d_previo = 0.0, phi0, dphi0
+    for i in range(max_iter):
+        f_alpha = phi(alpha)
+        if f_alpha > phi0 + c1 * alpha * dphi0 or (i > 0 and f_alpha >= f_previo):
+            return _zoom(phi, dphi, phi0, dphi0, alpha_previo, alpha, f_previo, d_previo, f_alpha, c1, c2, max_iter)
+        d_alpha = dphi(alpha)
+        if abs(d_alpha) <= -c2 * dphi0:
+            return alpha, f_alpha
+        if d_alpha >= 0:
+            return _zoom(phi, dphi, phi0, dphi0, alpha, alpha_previo, f_alpha, d_alpha, f_previo, c1, c2, max_iter)
+        alpha_previo, f_previo, d_previo = alpha, f_alpha, d_alpha
+        alpha = min(2 * alpha, alpha_max)
+    # Sin acotar en `max_iter` ampliaciones: el último paso evaluado, no el siguiente.
+    return alpha_previo, f_previo
+
+
+def acotar(phi, phi0, delta):
+    """Intervalo [a, b] de α ≥ 0 que contiene un mínimo de φ, con la fase de acotamiento.
+
+    Si el primer paso δ ya empeora, se reduce a la mitad hasta que mejore y el
+    mínimo queda en [0, 2δ]; si no, se duplica el paso desde 0 hasta que φ
+    vuelva a crecer. `phi` debe estar memoizada para que los puntos del
+    acotamiento no se evalúen de nuevo.
+    """
+    if phi(delta) >= phi0:
+        for _ in range(60):
+            delta /= 2
+            if phi(delta) < phi0:
+                break
+        return 0.0, 2 * delta
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        (a, b), _, _ = fase_acotamiento(0.0, delta, 2, phi)
+    return max(a, 0.0), b
+
+
+def seccion_dorada(phi, a, b, epsilon):
+    """Sección dorada del motor común de `unidimensional` hasta `epsilon`·(b - a); devuelve el mejor punto evaluado."""
+    _, puntos, _, _ = reducir_intervalo(phi, a, b, epsilon * (b - a), "dorada")
+    if not puntos:
+        return (a + b) / 2, phi((a + b) / 2)
+    return min(puntos, key=lambda punto: punto[1])
+
+
+def dorada(phi, dphi, phi0, dphi0, alpha=1.0, epsilon=1e-3):
+    """Minimización exacta aproximada: acotamiento desde `alpha` y sección dorada dentro del intervalo."""
+    phi = memoizar(phi)
+    a, b = acotar(phi, phi0, alpha)
+    paso, f_paso = seccion_dorada(phi, a, b, epsilon)
+    return (paso, f_paso) if f_paso < phi0 else (0.0, phi0)
+
+
+def armijo(phi, dphi, phi0, dphi0, alpha=1.0, c1=1e-4, rho=0.5, max_iter=60):
+    """Retroceso: reduce α por `rho` hasta cumplir φ(α) ≤ φ(0) + c1·α·φ'(0)."""
+    for _ in range(max_iter):
+        f_alpha = phi(alpha)
+        if f_alpha <= phi0 + c1 * alpha * dphi0:
+            return alpha, f_alpha
+        alpha *= rho
+    return 0.0, phi0
+
+
+def wolfe(phi, dphi, phi0, dphi0, alpha=1.0, **opciones):
+    return wolfe_fuerte(phi, dphi, phi0, dphi0, alpha, **opciones)
+
+
+BUSQUEDAS = {
+    "dorada": dorada,
+    "armijo": armijo,
+    "wolfe": wolfe,
+}
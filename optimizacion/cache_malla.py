@@ -0,0 +1,126 @@
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from .malla import evaluar_malla
+
+DIRECTORIO_CACHE = os.environ.get(
+    "OJTS_CACHE_MALLAS",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "mallas"),
+)
+
+
+def clave_funcion(funcion) -> str | None:
+    """Identificador estable entre procesos: módulo, nombre y huella del bytecode.
+
+    Devuelve None para lambdas y funciones locales, que no se pueden reconocer
+    de un proceso a otro y por tanto no se guardan en caché.
+    """
+    funcion = getattr(funcion, "f", funcion)
+    modulo = getattr(funcion, "__module__", None)
+    nombre = getattr(funcion, "__qualname__", "")
+    codigo = getattr(funcion, "__code__", None)
+    if not modulo or not nombre or "<" in nombre or codigo is None:
+        return None
+    huella = hashlib.sha1(codigo.co_code + repr(codigo.co_consts).encode()).hexdigest()[:16]
+    return f"{modulo}.{nombre}:{huella}"
+
+
+class CacheMallas:
+    """Caché LRU de mallas Z evaluadas, respaldada por archivos .npy en disco.
+
+    En memoria se guardan a lo sumo `capacidad` mallas; en disco, a lo sumo
+    `capacidad_disco` archivos, y se borran primero los de fecha de
+    modificación más antigua (un acierto en disco la actualiza).
+    """
+
+    def __init__(self, capacidad=16, directorio=DIRECTORIO_CACHE, capacidad_disco=256):
+        self.capacidad = capacidad
+        self.directorio = directorio
+        self.capacidad_disco = capacidad_disco
+        self._memoria = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, f"{clave}.npy")
+
+    def _cargar_disco(self, clave):
+        if self.directorio is None:
+            return None
+        ruta = self._ruta(clave)
+        try:
+            Z = np.load(ruta, mmap_mode="r")
+            os.utime(ruta)
+        except (OSError, ValueError):
+            return None
+        return Z
+
+    def _guardar_disco(self, clave, Z):
+        if self.directorio is None:
+            return
+        try:
+            os.makedirs(self.directorio, exist_ok=True)
+            fd, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+            with os.fdopen(fd, "wb") as archivo:
+                np.save(archivo, Z)
+            os.replace(temporal, self._ruta(clave))
+        except OSError:
+            return
+        self._podar_disco()
+
+    def _podar_disco(self):
+        try:
+            with os.scandir(self.directorio) as entradas:
+                archivos = [(e.stat().st_mtime_ns, e.path) for e in entradas if e.name.endswith(".npy")]
+        except OSError:
+            return
+        archivos.sort()
+        for _, ruta in archivos[:max(0, len(archivos) - self.capacidad_disco)]:
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+
+    def _recordar(self, clave, Z):
+        self._memoria[clave] = Z
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.capacidad:
+            self._memoria.popitem(last=False)
+
+    def obtener(self, x_min, x_max, y_min, y_max, funcion, n_puntos=200):
+        clave_f = clave_funcion(funcion)
+        if clave_f is None:
+            return evaluar_malla(x_min, x_max, y_min, y_max, funcion, n_puntos=n_puntos)
+
+        limites = tuple(float(v) for v in (x_min, x_max, y_min, y_max))
+        clave = hashlib.sha1(repr((clave_f, limites, int(n_puntos))).encode()).hexdigest()
+
+        Z = self._memoria.get(clave)
+        if Z is None:
+            Z = self._cargar_disco(clave)
+        if Z is None:
+            self.fallos += 1
+            X, Y, Z = evaluar_malla(x_min, x_max, y_min, y_max, funcion, n_puntos=n_puntos)
+            Z.setflags(write=False)
+            self._guardar_disco(clave, Z)
+            self._recordar(clave, Z)
+            return X, Y, Z
+
+        self.aciertos += 1
+        self._recordar(clave, Z)
+        X, Y = np.meshgrid(np.linspace(x_min, x_max, n_puntos), np.linspace(y_min, y_max, n_puntos))
+        return X, Y, Z
+
+    def vaciar(self):
+        self._memoria.clear()
+
+
+CACHE_MALLAS = CacheMallas()
+
+
+def malla_cacheada(x_min, x_max, y_min, y_max, funcion, n_puntos=200):
+    return CACHE_MALLAS.obtener(x_min, x_max, y_min, y_max, funcion, n_puntos=n_puntos)
@@ -0,0 +1,99 @@
+import numpy as np
+
+from .aleatorio import como_generador
+from .evaluador import memoizar
+from .graficas import dibujar_contorno_trayectoria
+from .metricas import Metricas
+from .submuestreo import reducir_trayectoria
+from .trayectoria import Trayectoria
+
+
+class BuscadorAleatorio:
+    def __init__(self, funcion, punto_inicial, sigma=0.1, iteraciones=1000, rng=None, semilla=None, registro=None):
+        self.metricas = Metricas()
+        self.f = memoizar(funcion, metricas=self.metricas)
+        self.x_actual = np.array(punto_inicial, dtype=float)
+        self.sigma = sigma
+        self.max_iter = iteraciones
+        self.rng = como_generador(rng, semilla)
+        self.trayectoria = Trayectoria(len(self.x_actual), **(registro or {"solo_aceptados": True}))
+
+    def paso(self):
+        return self.x_actual + self.rng.normal(0, self.sigma, size=len(self.x_actual))
+
+    def ejecutar(self):
+        with self.metricas.ejecucion():
+            mejor_x = self.x_actual.copy()
+            mejor_valor = self.f(mejor_x)
+            self.trayectoria.registrar(mejor_x, mejor_valor)
+
+            for _ in range(self.max_iter):
+                nuevo_x = self.paso()
+                nuevo_valor = self.f(nuevo_x)
+
+                mejora = nuevo_valor < mejor_valor
+                if mejora:
+                    mejor_x = nuevo_x
+                    mejor_valor = nuevo_valor
+                    self.x_actual = nuevo_x
+
+                self.trayectoria.registrar(mejor_x, mejor_valor, aceptado=mejora)
+                self.metricas.iteraciones += 1
+
+            self.trayectoria.cerrar()
+            return mejor_x, mejor_valor, self.metricas
+
+    def ejecutar_caminantes(self, caminantes=100):
+        with self.metricas.ejecucion():
+            d = len(self.x_actual)
+            posiciones = np.tile(self.x_actual, (caminantes, 1))
+            valores = np.repeat(self.f.evaluar_lote_directo(posiciones[:1]), caminantes)
+            aceptados = np.zeros(caminantes, dtype=int)
+
+            mejor_x = posiciones[0].copy()
+            mejor_valor = valores[0]
+            self.trayectoria.registrar(mejor_x, mejor_valor)
+
+            for _ in range(self.max_iter):
+                candidatos = posiciones + self.rng.normal(0, self.sigma, size=(caminantes, d))
+                nuevos = self.f.evaluar_lote_directo(candidatos)
+
+                mejora = nuevos < valores
+                posiciones[mejora] = candidatos[mejora]
+                valores[mejora] = nuevos[mejora]
+                aceptados += mejora
+
+                i = np.argmin(valores)
+                nuevo_mejor = valores[i] < mejor_valor
+                if nuevo_mejor:
+                    mejor_x = posiciones[i].copy()
+                    mejor_valor = valores[i]
+
+                self.trayectoria.registrar(mejor_x, mejor_valor, aceptado=nuevo_mejor)
+                self.metricas.iteraciones += 1
+
+            self.trayectoria.cerrar()
+
+            self.x_actual = mejor_x
+            estadisticas = {
+                "mejores_valores": valores,
+                "posiciones": posiciones,
+                "aceptados": aceptados,
+            }
+            return mejor_x, mejor_valor, estadisticas, self.metricas
+
+    def graficar(self, titulo="Recorrido"):
+        import matplotlib.pyplot as plt
+
+        coords = reducir_trayectoria(self.trayectoria)
+        fig, ax = plt.subplots(figsize=(6, 5))
+        dibujar_contorno_trayectoria(fig, ax, self.f.f, coords)
+        ax.plot(coords[:, 0], coords[:, 1], marker='o', linestyle='-', markersize=2, label='Trayectoria')
+        ax.scatter(coords[0, 0], coords[0, 1], c='green', label='Inicio', s=50)
+        ax.scatter(coords[-1, 0], coords[-1, 1], c='red', label='Fin', s=50)
+        ax.set_title(titulo)
+        ax.set_xlabel("x₁")
+        ax.set_ylabel("x₂")
+        ax.grid(True)
+        ax.legend()
+        return fig
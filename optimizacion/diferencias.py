@@ -0,0 +1,115 @@
+"""Plantillas de diferencias finitas evaluadas en un solo lote.
+
+Cada plantilla reúne en un arreglo (k, N) todos los puntos perturbados que
+necesita una derivada, ordenados por bloques, de modo que el gradiente o el
+hessiano cuestan una llamada por lotes a la función (o un reparto entre
+procesos) en vez de 2N llamadas sueltas. Los valores se combinan por bloques
+con el mismo orden de operaciones que las fórmulas escalares.
+"""
+import numpy as np
+
+from .malla import evaluar_lote
+
+# Desplazamientos (en múltiplos de h) y pesos de la primera derivada.
+ESQUEMAS = {
+    "adelante": ((0, 1), (-1.0, 1.0)),
+    "atras": ((-1, 0), (-1.0, 1.0)),
+    "central": ((-1, 1), (-1 / 2, 1 / 2)),
+    "central4": ((-2, -1, 1, 2), (1 / 12, -2 / 3, 2 / 3, -1 / 12)),
+    "central6": ((-3, -2, -1, 1, 2, 3), (-1 / 60, 3 / 20, -3 / 4, 3 / 4, -3 / 20, 1 / 60)),
+}
+
+
+def _esquema(esquema):
+    if esquema not in ESQUEMAS:
+        raise ValueError(f"Esquema desconocido: {esquema!r}. Opciones: {', '.join(ESQUEMAS)}")
+    return ESQUEMAS[esquema]
+
+
+def plantilla_gradiente(x, h=1e-6, esquema="central"):
+    """Puntos (k, N) del gradiente: x (si el esquema lo usa) y un bloque x + s·h·I por desplazamiento s ≠ 0."""
+    desplazamientos, _ = _esquema(esquema)
+    x = np.asarray(x, dtype=float)
+    identidad = np.eye(len(x))
+    bloques = [x[None, :]] if 0 in desplazamientos else []
+    bloques += [x + s * h * identidad for s in desplazamientos if s != 0]
+    return np.vstack(bloques)
+
+
+def combinar_gradiente(valores, n, h=1e-6, esquema="central"):
+    desplazamientos, coeficientes = _esquema(esquema)
+    valores = np.asarray(valores, dtype=float)
+    centro = valores[0] if 0 in desplazamientos else None
+    bloques = iter(valores[1:].reshape(-1, n) if centro is not None else valores.reshape(-1, n))
+    suma = 0.0
+    for s, c in zip(desplazamientos, coeficientes):
+        suma = suma + c * (centro if s == 0 else next(bloques))
+    return suma / h
+
+
+def plantilla_derivadas(x, delta=1e-5):
+    """Puntos (k, N) compartidos por el gradiente central y el hessiano: N² + N + 1 en total.
+
+    Bloques: x; x + δeᵢ; x - δeᵢ; y, solo para el triángulo superior i < j,
+    x + δ(eᵢ+eⱼ) y x - δ(eᵢ+eⱼ). El gradiente central y la diagonal del
+    hessiano usan los mismos f(x ± δeᵢ), que también entran en los términos
+    cruzados, y H[j, i] se copia de H[i, j] por simetría.
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    identidad = np.eye(n)
+    i, j = np.triu_indices(n, k=1)
+    suma = identidad[i] + identidad[j]
+    return np.vstack([x[None, :], x + delta * identidad, x - delta * identidad, x + delta * suma, x - delta * suma])
+
+
+def combinar_derivadas(valores, n, delta=1e-5):
+    """Gradiente y hessiano a partir de los valores de `plantilla_derivadas`.
+
+    Los términos cruzados salen de
+    Hᵢⱼ = [f(x+δ(eᵢ+eⱼ)) + f(x-δ(eᵢ+eⱼ)) - f(x±δeᵢ) - f(x±δeⱼ) + 2f(x)] / 2δ²,
+    con error O(δ²) como la diagonal.
+    """
+    valores = np.asarray(valores, dtype=float)
+    fx = valores[0]
+    adelante, atras = valores[1:1 + n], valores[1 + n:1 + 2 * n]
+    pp, mm = valores[1 + 2 * n:].reshape(2, -1)
+
+    grad = (adelante - atras) / (2 * delta)
+    H = np.empty((n, n))
+    ejes = adelante + atras
+    H[np.diag_indices(n)] = (ejes - 2 * fx) / (delta**2)
+    i, j = np.triu_indices(n, k=1)
+    H[i, j] = H[j, i] = (pp + mm - ejes[i] - ejes[j] + 2 * fx) / (2 * delta**2)
+    return grad, H
+
+
+def plantilla_hessiano(x, delta=1e-5):
+    return plantilla_derivadas(x, delta)
+
+
+def evaluar(funcion, puntos, procesos=None):
+    """f en cada fila de `puntos` con una sola llamada por lotes.
+
+    Con un `EvaluadorMemo` se cuenta la evaluación pero no se guarda en la
+    caché: los puntos de una plantilla no se repiten y en dimensión alta la
+    llenarían.
+    """
+    if hasattr(funcion, "evaluar_lote_directo"):
+        return funcion.evaluar_lote_directo(puntos)
+    return evaluar_lote(funcion, puntos, procesos=procesos)
+
+
+def gradiente(funcion, x, h=1e-6, esquema="central", procesos=None):
+    valores = evaluar(funcion, plantilla_gradiente(x, h, esquema), procesos)
+    return combinar_gradiente(valores, len(x), h, esquema)
+
+
+def gradiente_hessiano(funcion, x, delta=1e-5, procesos=None):
+    """Gradiente y hessiano a partir de una única plantilla compartida."""
+    valores = evaluar(funcion, plantilla_derivadas(x, delta), procesos)
+    return combinar_derivadas(valores, len(x), delta)
+
+
+def hessiano(funcion, x, delta=1e-5, procesos=None):
+    return gradiente_hessiano(funcion, x, delta, procesos)[1]
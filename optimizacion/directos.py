@@ -0,0 +1,96 @@
+import numpy as np
+
+from .evaluador import memoizar
+from .metricas import instrumentado
+
+
+def createSimplex(x0: np.ndarray, alpha: float, N: int):
+    delta1 = ((np.sqrt(N+1) + N - 1) / (N * np.sqrt(2))) * alpha
+    delta2 = ((np.sqrt(N+1) - 1) / (N * np.sqrt(2))) * alpha
+    xn = [np.array([x0[i] + delta1 if i == j else x0[i] + delta2 for i in range(N)]) for j in range(N)]
+    xn.insert(0, x0)
+    return np.array(xn)
+
+
+def terminar(fx, fc, N, epsilon=0.001):
+    return np.sqrt(np.sum(((fx - fc)**2)/(N+1))) < epsilon
+
+
+@instrumentado
+def nelder_mead(funcion, x0, alpha=1.0, gamma=1.2, beta=0.5, epsilon=0.001, max_iter=100, metricas=None):
+    f = memoizar(funcion, metricas=metricas)
+    x0 = np.asarray(x0, dtype=float)
+    N = len(x0)
+    simplex = createSimplex(x0, alpha, N)
+    trayectoria = [simplex.copy()]
+    final = False
+    iteracion = 0
+
+    while not final and iteracion < max_iter:
+        fx = np.array([f(x) for x in simplex])
+        indices = np.argsort(fx)
+        i_xl, i_xg, i_xh = indices[0], indices[-2], indices[-1]
+
+        xc = (np.sum(simplex, axis=0) - simplex[i_xh]) / N
+        xr = 2 * xc - simplex[i_xh]
+        fxr = f(xr)
+        fxc = f(xc)
+        xnew = xr
+
+        if fxr < fx[i_xl]:
+            xnew = (1 + gamma)*xc - gamma*simplex[i_xh]
+        elif fxr >= fx[i_xh]:
+            xnew = (1 - beta)*xc + beta*simplex[i_xh]
+        elif fx[i_xg] < fxr < fx[i_xh]:
+            xnew = (1 + beta)*xc - beta*simplex[i_xh]
+
+        simplex[i_xh] = xnew
+        trayectoria.append(simplex.copy())
+        final = terminar(fx, fxc, N, epsilon)
+        iteracion += 1
+    metricas.iteraciones = iteracion
+
+    mejor = simplex[np.argmin([f(x) for x in simplex])]
+    return mejor, simplex, trayectoria, metricas
+
+
+def movimiento_exploratorio(x, delta, funcion, N, fx=None):
+    xc = np.array(x)
+    fx = funcion(x) if fx is None else fx
+    for i in range(N):
+        x_plus = np.array(x)
+        x_minus = np.array(x)
+        x_plus[i] = x[i] + delta[i]
+        x_minus[i] = x[i] - delta[i]
+        xs = [x_minus, x, x_plus]
+        fxs = [funcion(x_minus), fx, funcion(x_plus)]
+        k = np.argmin(fxs)
+        x, fx = xs[k], fxs[k]
+    if np.allclose(x, xc):
+        return xc, fx, False
+    return x, fx, True
+
+
+@instrumentado
+def hooke_jeeves(funcion, x0, delta, epsilon=1e-5, alpha=2.0, N=2, max_iter=100, metricas=None):
+    funcion = memoizar(funcion, metricas=metricas)
+    x = np.array(x0, dtype=float)
+    delta = np.asarray(delta, dtype=float)
+    fx = funcion(x)
+    historial = [x.copy()]
+    for _ in range(max_iter):
+        metricas.iteraciones += 1
+        xn, fxn, mov = movimiento_exploratorio(x, delta, funcion, N, fx)
+        if not mov:
+            delta = delta / 2.0
+            if np.all(delta < epsilon):
+                break
+        else:
+            xp = xn + alpha * (xn - x)
+            fxp = funcion(xp)
+            if fxp < fx:
+                x, fx = xp, fxp
+            else:
+                x, fx = xn, fxn
+        historial.append(x.copy())
+    return x, historial, metricas
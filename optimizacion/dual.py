@@ -0,0 +1,376 @@
+"""Diferenciación automática hacia adelante con números duales e hiper-duales.
+
+Un `Dual` lleva, junto a su valor `v`, la derivada respecto de las N variables
+de entrada `d` (forma `v.shape + (N,)`) y, si es de segundo orden, la matriz
+de segundas derivadas `h` (forma `v.shape + (N, N)`). Las operaciones de
+Python y los ufuncs de NumPy propagan las tres partes, así que una sola
+evaluación de una función escrita con NumPy da el gradiente y el hessiano
+exactos, también por lotes de puntos.
+
+El código que usa el módulo `math` se adapta con `con_math_dual`, que cambia
+`math` por `math_dual` en los globales de la función.
+"""
+import functools
+import math
+import types
+
+import numpy as np
+
+# Fallos de una función que no admite números duales (usa algo que `Dual` no
+# implementa); quien llama debe recurrir a diferencias finitas.
+NO_DIFERENCIABLE = (TypeError, ValueError, AttributeError)
+
+
+def _exterior(a, b):
+    return a[..., :, None] * b[..., None, :]
+
+
+def _col(c, extra=1):
+    return np.asarray(c, dtype=float)[(...,) + (None,) * extra]
+
+
+class Dual:
+    __array_priority__ = 1000
+    __hash__ = None
+
+    def __init__(self, v, d, h=None):
+        self.v = np.asarray(v, dtype=float)
+        self.d = np.asarray(d, dtype=float)
+        self.h = None if h is None else np.asarray(h, dtype=float)
+
+    @property
+    def shape(self):
+        return self.v.shape
+
+    @property
+    def ndim(self):
+        return self.v.ndim
+
+    @property
+    def dtype(self):
+        return self.v.dtype
+
+    @property
+    def size(self):
+        return self.v.size
+
+    def __len__(self):
+        return len(self.v)
+
+    def __repr__(self):
+        return f"Dual(v={self.v!r}, d={self.d!r}{'' if self.h is None else f', h={self.h!r}'})"
+
+    def __float__(self):
+        raise TypeError("Un Dual no se convierte a float sin perder sus derivadas")
+
+    def __getitem__(self, indice):
+        indice = indice if isinstance(indice, tuple) else (indice,)
+        if any(i is Ellipsis for i in indice):
+            # `...` debe cubrir solo los ejes del valor, no los de las derivadas.
+            k = indice.index(Ellipsis)
+            ocupados = sum(i is not None for i in indice) - 1
+            indice = indice[:k] + (slice(None),) * (self.ndim - ocupados) + indice[k + 1:]
+        return Dual(self.v[indice], self.d[indice], None if self.h is None else self.h[indice])
+
+    def _forma(self, v):
+        """Extiende d y h a la forma de un resultado `v` obtenido por broadcasting."""
+        n = self.d.shape[-1]
+        d = np.broadcast_to(self.d, np.shape(v) + (n,))
+        h = None if self.h is None else np.broadcast_to(self.h, np.shape(v) + (n, n))
+        return d, h
+
+    def aplicar(self, g, dg, d2g):
+        """Regla de la cadena para g escalar con derivadas dg y d2g."""
+        g1 = dg(self.v)
+        d = _col(g1) * self.d
+        h = None
+        if self.h is not None:
+            h = _col(g1, 2) * self.h + _col(d2g(self.v), 2) * _exterior(self.d, self.d)
+        return Dual(g(self.v), d, h)
+
+    def __add__(self, otro):
+        if isinstance(otro, Dual):
+            h = None if self.h is None or otro.h is None else self.h + otro.h
+            return Dual(self.v + otro.v, self.d + otro.d, h)
+        v = self.v + np.asarray(otro, dtype=float)
+        return Dual(v, *self._forma(v))
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Dual(-self.v, -self.d, None if self.h is None else -self.h)
+
+    def __pos__(self):
+        return self
+
+    def __sub__(self, otro):
+        return self + (-otro)
+
+    def __rsub__(self, otro):
+        return (-self) + otro
+
+    def __mul__(self, otro):
+        if isinstance(otro, Dual):
+            d = _col(otro.v) * self.d + _col(self.v) * otro.d
+            h = None
+            if self.h is not None and otro.h is not None:
+                h = (_col(otro.v, 2) * self.h + _col(self.v, 2) * otro.h
+                     + _exterior(self.d, otro.d) + _exterior(otro.d, self.d))
+            return Dual(self.v * otro.v, d, h)
+        c = np.asarray(otro, dtype=float)
+        return Dual(self.v * c, _col(c) * self.d, None if self.h is None else _col(c, 2) * self.h)
+
+    __rmul__ = __mul__
+
+    def reciproco(self):
+        return self.aplicar(lambda x: 1 / x, lambda x: -1 / x**2, lambda x: 2 / x**3)
+
+    def __truediv__(self, otro):
+        if isinstance(otro, Dual):
+            return self * otro.reciproco()
+        return self * (1 / np.asarray(otro, dtype=float))
+
+    def __rtruediv__(self, otro):
+        return self.reciproco() * otro
+
+    def __pow__(self, otro):
+        if isinstance(otro, Dual):
+            return exp(otro * log(self))
+        p = float(otro)
+        if p == 0:
+            v = np.ones_like(self.v)
+            return Dual(v, np.zeros_like(self.d), None if self.h is None else np.zeros_like(self.h))
+        if p == 1:
+            return self
+        if p == 2:
+            return self * self
+        return self.aplicar(lambda x: x**p, lambda x: p * x**(p - 1), lambda x: p * (p - 1) * x**(p - 2))
+
+    def __rpow__(self, otro):
+        return exp(self * np.log(np.asarray(otro, dtype=float)))
+
+    def __abs__(self):
+        return self.aplicar(np.abs, np.sign, np.zeros_like)
+
+    def _valor(self, otro):
+        return otro.v if isinstance(otro, Dual) else otro
+
+    def __lt__(self, otro):
+        return self.v < self._valor(otro)
+
+    def __le__(self, otro):
+        return self.v <= self._valor(otro)
+
+    def __gt__(self, otro):
+        return self.v > self._valor(otro)
+
+    def __ge__(self, otro):
+        return self.v >= self._valor(otro)
+
+    def __eq__(self, otro):
+        return self.v == self._valor(otro)
+
+    def __ne__(self, otro):
+        return self.v != self._valor(otro)
+
+    def sum(self, axis=None):
+        return _sumar(self, axis)
+
+    def __array_ufunc__(self, ufunc, metodo, *entradas, **kwargs):
+        if metodo != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc in _BINARIOS:
+            a, b = entradas
+            return _BINARIOS[ufunc](a, b)
+        if ufunc in _COMPARACIONES:
+            a, b = (e.v if isinstance(e, Dual) else e for e in entradas)
+            return ufunc(a, b)
+        if ufunc in _UNARIOS:
+            return _UNARIOS[ufunc](entradas[0])
+        return NotImplemented
+
+    def __array_function__(self, funcion, tipos, args, kwargs):
+        if funcion not in _FUNCIONES_NUMPY:
+            return NotImplemented
+        return _FUNCIONES_NUMPY[funcion](*args, **kwargs)
+
+
+def _constante(x):
+    return x.v if isinstance(x, Dual) else np.asarray(x, dtype=float)
+
+
+def _unario(g, dg, d2g):
+    def aplicar(x):
+        if isinstance(x, Dual):
+            return x.aplicar(g, dg, d2g)
+        return g(np.asarray(x, dtype=float))
+    return aplicar
+
+
+sin = _unario(np.sin, np.cos, lambda x: -np.sin(x))
+cos = _unario(np.cos, lambda x: -np.sin(x), lambda x: -np.cos(x))
+tan = _unario(np.tan, lambda x: 1 / np.cos(x)**2, lambda x: 2 * np.tan(x) / np.cos(x)**2)
+exp = _unario(np.exp, np.exp, np.exp)
+expm1 = _unario(np.expm1, np.exp, np.exp)
+log = _unario(np.log, lambda x: 1 / x, lambda x: -1 / x**2)
+log1p = _unario(np.log1p, lambda x: 1 / (1 + x), lambda x: -1 / (1 + x)**2)
+sqrt = _unario(np.sqrt, lambda x: 0.5 / np.sqrt(x), lambda x: -0.25 / x**1.5)
+arctan = _unario(np.arctan, lambda x: 1 / (1 + x**2), lambda x: -2 * x / (1 + x**2)**2)
+sinh = _unario(np.sinh, np.cosh, np.sinh)
+cosh = _unario(np.cosh, np.sinh, np.cosh)
+tanh = _unario(np.tanh, lambda x: 1 / np.cosh(x)**2, lambda x: -2 * np.tanh(x) / np.cosh(x)**2)
+absoluto = _unario(np.abs, np.sign, np.zeros_like)
+
+
+def _donde(condicion, a, b):
+    condicion = np.asarray(condicion.v if isinstance(condicion, Dual) else condicion, dtype=bool)
+    base = a if isinstance(a, Dual) else b
+    n = base.d.shape[-1]
+    segundo = all(x.h is not None for x in (a, b) if isinstance(x, Dual))
+
+    def partes(x):
+        if isinstance(x, Dual):
+            return x.v, x.d, x.h
+        x = np.asarray(x, dtype=float)
+        return x, np.zeros(x.shape + (n,)), np.zeros(x.shape + (n, n)) if segundo else None
+
+    va, da, ha = partes(a)
+    vb, db, hb = partes(b)
+    h = np.where(condicion[..., None, None], ha, hb) if segundo else None
+    return Dual(np.where(condicion, va, vb), np.where(condicion[..., None], da, db), h)
+
+
+def _maximo(a, b):
+    return _donde(_constante(a) >= _constante(b), a, b)
+
+
+def _minimo(a, b):
+    return _donde(_constante(a) <= _constante(b), a, b)
+
+
+def _sumar(x, axis=None, **kwargs):
+    if not isinstance(x, Dual):
+        return np.sum(x, axis=axis, **kwargs)
+    if axis is None:
+        ejes = tuple(range(x.ndim))
+    else:
+        ejes = tuple(e % x.ndim for e in np.atleast_1d(axis))
+    return Dual(x.v.sum(axis=ejes), x.d.sum(axis=ejes), None if x.h is None else x.h.sum(axis=ejes))
+
+
+def _promedio(x, axis=None, **kwargs):
+    total = _sumar(x, axis)
+    return total * (np.size(total.v) / np.size(x.v))
+
+
+def _apilar(arreglos, axis=0):
+    duales = [a for a in arreglos if isinstance(a, Dual)]
+    n = duales[0].d.shape[-1]
+    segundo = all(a.h is not None for a in duales)
+    piezas = [a if isinstance(a, Dual) else Dual(a, np.zeros(np.shape(a) + (n,)),
+                                                 np.zeros(np.shape(a) + (n, n)) if segundo else None)
+              for a in arreglos]
+    eje = axis % (piezas[0].ndim + 1)
+    h = np.stack([p.h for p in piezas], axis=eje) if segundo else None
+    return Dual(np.stack([p.v for p in piezas], axis=eje), np.stack([p.d for p in piezas], axis=eje), h)
+
+
+_BINARIOS = {
+    np.add: lambda a, b: a + b if isinstance(a, Dual) else b + a,
+    np.subtract: lambda a, b: a - b if isinstance(a, Dual) else -(b - a),
+    np.multiply: lambda a, b: a * b if isinstance(a, Dual) else b * a,
+    np.true_divide: lambda a, b: a / b if isinstance(a, Dual) else b.__rtruediv__(a),
+    np.power: lambda a, b: a ** b if isinstance(a, Dual) else b.__rpow__(a),
+    np.maximum: _maximo,
+    np.minimum: _minimo,
+}
+_COMPARACIONES = {np.less, np.less_equal, np.greater, np.greater_equal, np.equal, np.not_equal}
+_UNARIOS = {
+    np.negative: lambda x: -x,
+    np.positive: lambda x: x,
+    np.square: lambda x: x * x,
+    np.reciprocal: lambda x: x.reciproco(),
+    np.absolute: absoluto,
+    np.sin: sin, np.cos: cos, np.tan: tan,
+    np.exp: exp, np.expm1: expm1, np.log: log, np.log1p: log1p, np.sqrt: sqrt,
+    np.arctan: arctan, np.sinh: sinh, np.cosh: cosh, np.tanh: tanh,
+}
+_FUNCIONES_NUMPY = {
+    np.sum: _sumar,
+    np.mean: _promedio,
+    np.where: _donde,
+    np.stack: _apilar,
+}
+
+
+def _pow(x, y):
+    return x ** y
+
+
+math_dual = types.SimpleNamespace(**{nombre: getattr(math, nombre) for nombre in dir(math)
+                                     if not nombre.startswith("_")})
+math_dual.__dict__.update(sin=sin, cos=cos, tan=tan, exp=exp, expm1=expm1, log1p=log1p, sqrt=sqrt,
+                          atan=arctan, sinh=sinh, cosh=cosh, tanh=tanh, fabs=absoluto, pow=_pow,
+                          log=lambda x, base=math.e: log(x) / math.log(base) if base != math.e else log(x))
+
+
+@functools.lru_cache(maxsize=256)
+def con_math_dual(funcion):
+    """Copia de `funcion` con `math` cambiado por `math_dual` en sus globales, si lo usa."""
+    if not isinstance(funcion, types.FunctionType) or funcion.__globals__.get("math") is not math:
+        return funcion
+    globales = dict(funcion.__globals__, math=math_dual)
+    copia = types.FunctionType(funcion.__code__, globales, funcion.__name__, funcion.__defaults__,
+                               funcion.__closure__)
+    copia.__kwdefaults__ = funcion.__kwdefaults__
+    return copia
+
+
+def _original(funcion):
+    while hasattr(funcion, "f"):
+        funcion = funcion.f
+    return funcion
+
+
+def variables(x, orden=1):
+    """Siembra duales para x (N,) o un lote (n, N): cada coordenada es una variable independiente."""
+    x = np.asarray(x, dtype=float)
+    n = x.shape[-1]
+    d = np.broadcast_to(np.eye(n), x.shape + (n,)).copy()
+    h = np.zeros(x.shape + (n, n)) if orden == 2 else None
+    return Dual(x, d, h)
+
+
+def evaluar(funcion, x, orden=1):
+    """Evalúa `funcion` sobre duales sembrados en x y devuelve el `Dual` resultante."""
+    with np.errstate(all="ignore"):
+        resultado = con_math_dual(_original(funcion))(variables(x, orden))
+    if not isinstance(resultado, Dual):
+        raise TypeError("La función no propagó los números duales")
+    return resultado
+
+
+def gradiente(funcion, x):
+    """Gradiente exacto en x (N,) o por fila en un lote (n, N)."""
+    return evaluar(funcion, x).d
+
+
+def segundo_orden(funcion, x):
+    """(valor, gradiente, hessiano) exactos de `funcion` en x con una sola evaluación hiper-dual."""
+    resultado = evaluar(funcion, x, orden=2)
+    return resultado.v, resultado.d, resultado.h
+
+
+def hessiano(funcion, x):
+    return segundo_orden(funcion, x)[2]
+
+
+def derivada(funcion, x, orden=1):
+    """f'(x) (u (f'(x), f''(x)) con `orden=2`) de una función escalar de una variable."""
+    with np.errstate(all="ignore"):
+        resultado = con_math_dual(_original(funcion))(Dual(float(x), [1.0], [[0.0]] if orden == 2 else None))
+    if not isinstance(resultado, Dual):
+        raise TypeError("La función no propagó los números duales")
+    if orden == 2:
+        return float(resultado.d[0]), float(resultado.h[0, 0])
+    return float(resultado.d[0])
@@ -0,0 +1,218 @@
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+import numpy as np
+
+from .malla import evaluar_lote, evaluar_sondeando
+
+
+class PresupuestoAgotado(RuntimeError):
+    """Se pidió una evaluación más allá del presupuesto del evaluador."""
+
+
+class EvaluadorMemo:
+    """Envuelve una función objetivo y memoriza sus valores por punto.
+
+    La clave es el contenido binario exacto del punto (float64). Con `paso`
+    las coordenadas se cuantizan a múltiplos de `paso` antes de evaluar, de
+    modo que puntos casi iguales comparten una sola evaluación. Con `procesos`
+    los lotes de una función escalar se reparten en un pool de procesos que se
+    crea con el primer lote y se reutiliza hasta `cerrar()` (o el fin del
+    bloque `with`).
+    Con `max_evaluaciones` nunca se llama a la función más de esas veces:
+    la llamada que no cabe lanza `PresupuestoAgotado` antes de evaluar.
+    """
+
+    def __init__(self, funcion, capacidad=100_000, paso=None, vectorizada=None, metricas=None, procesos=None,
+                 max_evaluaciones=None):
+        self.f = funcion
+        self.capacidad = capacidad
+        self.paso = paso
+        self.vectorizada = vectorizada
+        self.metricas = metricas
+        self.procesos = procesos
+        self.max_evaluaciones = max_evaluaciones
+        self._cache = OrderedDict()
+        self._pool = None
+        self.nfev = 0
+        self.aciertos = 0
+
+    @property
+    def pool(self):
+        """Pool de procesos de los lotes, o None si se evalúa en serie."""
+        if self._pool is None and self.procesos and self.procesos > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.procesos)
+            weakref.finalize(self, self._pool.shutdown, wait=False)
+        return self._pool
+
+    def cerrar(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def __getstate__(self):
+        estado = self.__dict__.copy()
+        estado["_pool"] = None
+        return estado
+
+    @property
+    def restantes(self):
+        """Llamadas que aún caben en el presupuesto (infinitas si no hay)."""
+        if self.max_evaluaciones is None:
+            return float("inf")
+        return self.max_evaluaciones - self.nfev
+
+    def _exigir(self, n=1):
+        if n > self.restantes:
+            raise PresupuestoAgotado(f"Se agotó el presupuesto de {self.max_evaluaciones} evaluaciones.")
+
+    def evaluar_fuera(self, evaluacion):
+        """Corre `evaluacion()`, una llamada a la función que no pasa por la caché (p. ej. con números duales).
+
+        Se exige que quepa en el presupuesto antes de correrla y se cuenta en
+        `nfev` solo si termina; si lanza una excepción no gasta nada.
+        """
+        self._exigir()
+        inicio = perf_counter()
+        resultado = evaluacion()
+        self._contar(1, inicio)
+        return resultado
+
+    def _contar(self, n, inicio, contadas=()):
+        """Suma `n` evaluaciones; `contadas` son las métricas que ya las registraron."""
+        self.nfev += n
+        if self.metricas is not None and all(self.metricas is not m for m in contadas):
+            self.metricas.registrar_evaluaciones(n, perf_counter() - inicio)
+            contadas += (self.metricas,)
+        return contadas
+
+    def _normalizar(self, x):
+        punto = np.asarray(x, dtype=float)
+        if self.paso:
+            punto = np.round(punto / self.paso) * self.paso
+        return punto
+
+    def _guardar(self, clave, valor):
+        self._cache[clave] = valor
+        if len(self._cache) > self.capacidad:
+            self._cache.popitem(last=False)
+
+    def __call__(self, x):
+        punto = self._normalizar(x)
+        if punto.ndim == 2:
+            return self.evaluar_lote(punto)
+
+        clave = punto.tobytes()
+        valor = self._cache.get(clave)
+        if valor is not None:
+            self._cache.move_to_end(clave)
+            self.aciertos += 1
+            return valor
+
+        self._exigir()
+        inicio = perf_counter()
+        valor = self.f(float(punto) if punto.ndim == 0 else punto)
+        self._contar(1, inicio)
+        self._guardar(clave, valor)
+        return valor
+
+    def evaluar_lote(self, puntos):
+        puntos = self._normalizar(puntos)
+        claves = [p.tobytes() for p in puntos]
+        valores = np.empty(len(puntos))
+        pendientes = {}
+        for i, clave in enumerate(claves):
+            valor = self._cache.get(clave)
+            if valor is None:
+                pendientes.setdefault(clave, []).append(i)
+            else:
+                self._cache.move_to_end(clave)
+                self.aciertos += 1
+                valores[i] = valor
+
+        if pendientes:
+            primeros = [indices[0] for indices in pendientes.values()]
+            nuevos = self.evaluar_lote_directo(puntos[primeros])
+            for (clave, indices), valor in zip(pendientes.items(), nuevos):
+                valores[indices] = valor
+                self._guardar(clave, float(valor))
+        return valores
+
+    def evaluar_lote_directo(self, puntos):
+        """Evalúa un lote sin pasar por la caché; útil para puntos aleatorios que no se repiten.
+
+        El primer lote averigua si la función es vectorizada; esa prueba repite
+        los primeros puntos y se cuenta como evaluaciones adicionales.
+        """
+        puntos = np.asarray(puntos, dtype=float)
+        sonda = len(puntos[:3]) if self.vectorizada is None else 0
+        self._exigir(len(puntos) + sonda)
+        inicio = perf_counter()
+        if sonda:
+            self.vectorizada, valores = evaluar_sondeando(self.f, puntos, procesos=self.procesos, pool=self.pool)
+        else:
+            valores = evaluar_lote(self.f, puntos, vectorizada=self.vectorizada, procesos=self.procesos,
+                                   pool=self.pool)
+        self._contar(len(puntos) + sonda, inicio)
+        return valores
+
+    def vaciar(self):
+        self._cache.clear()
+
+
+class VistaEvaluador(EvaluadorMemo):
+    """Evaluador que comparte la caché de `base` con métricas y presupuesto propios.
+
+    Cada evaluación cuenta también en `base` (y en sus métricas, si son
+    otras) y debe caber en ambos presupuestos, así que `base` no se modifica.
+    Usa el pool de `base` salvo que se pida otro número de `procesos`.
+    """
+
+    def __init__(self, base, metricas=None, max_evaluaciones=None, procesos=None):
+        super().__init__(base.f, capacidad=base.capacidad, paso=base.paso, vectorizada=base.vectorizada,
+                         metricas=metricas, procesos=base.procesos if procesos is None else procesos,
+                         max_evaluaciones=max_evaluaciones)
+        self.base = base
+        self._cache = base._cache
+
+    @property
+    def pool(self):
+        return self.base.pool if self.procesos == self.base.procesos else super().pool
+
+    @property
+    def restantes(self):
+        return min(super().restantes, self.base.restantes)
+
+    def _contar(self, n, inicio, contadas=()):
+        return self.base._contar(n, inicio, super()._contar(n, inicio, contadas))
+
+    def evaluar_lote_directo(self, puntos):
+        self.vectorizada = self.base.vectorizada if self.vectorizada is None else self.vectorizada
+        valores = super().evaluar_lote_directo(puntos)
+        self.base.vectorizada = self.vectorizada
+        return valores
+
+
+def memoizar(funcion, metricas=None, max_evaluaciones=None, **opciones):
+    """`funcion` envuelta en un `EvaluadorMemo`.
+
+    Si ya es uno y se piden métricas, un presupuesto u otros `procesos`, se
+    devuelve una `VistaEvaluador` que comparte su caché en lugar de
+    modificarlo; cualquier otra opción lanza ValueError.
+    """
+    if isinstance(funcion, EvaluadorMemo):
+        procesos = opciones.pop("procesos", None)
+        if opciones:
+            raise ValueError(f"Un EvaluadorMemo ya configurado no admite {', '.join(opciones)}.")
+        if metricas is None and max_evaluaciones is None and procesos in (None, funcion.procesos):
+            return funcion
+        return VistaEvaluador(funcion, metricas=metricas, max_evaluaciones=max_evaluaciones, procesos=procesos)
+    return EvaluadorMemo(funcion, metricas=metricas, max_evaluaciones=max_evaluaciones, **opciones)
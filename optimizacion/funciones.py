@@ -0,0 +1,339 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+
+def _como_lote(x):
+    X = x if hasattr(x, "ndim") else np.asarray(x, dtype=float)
+    if getattr(X, "dtype", None) is not None and X.dtype.kind in "biu":
+        X = X.astype(float)
+    escalar = X.ndim == 1
+    return (X[None, :] if escalar else X), escalar
+
+
+def _resultado(valores, escalar):
+    return valores[0] if escalar else valores
+
+
+def _diagonal(diagonal):
+    n, d = diagonal.shape
+    H = np.zeros((n, d, d))
+    H[:, np.arange(d), np.arange(d)] = diagonal
+    return H
+
+
+def rastrigin(x):
+    X, escalar = _como_lote(x)
+    A = 10
+    valores = A * X.shape[1] + np.sum(X**2 - A * np.cos(2 * np.pi * X), axis=1)
+    return _resultado(valores, escalar)
+
+
+def rastrigin_gradiente(x):
+    X, escalar = _como_lote(x)
+    return _resultado(2 * X + 20 * np.pi * np.sin(2 * np.pi * X), escalar)
+
+
+def rastrigin_hessiano(x):
+    X, escalar = _como_lote(x)
+    return _resultado(_diagonal(2 + 40 * np.pi**2 * np.cos(2 * np.pi * X)), escalar)
+
+
+def rosenbrock(x):
+    X, escalar = _como_lote(x)
+    valores = np.sum(100 * (X[:, 1:] - X[:, :-1]**2)**2 + (1 - X[:, :-1])**2, axis=1)
+    return _resultado(valores, escalar)
+
+
+def rosenbrock_gradiente(x):
+    X, escalar = _como_lote(x)
+    G = np.zeros_like(X)
+    residuo = X[:, 1:] - X[:, :-1]**2
+    G[:, :-1] = -400 * X[:, :-1] * residuo - 2 * (1 - X[:, :-1])
+    G[:, 1:] += 200 * residuo
+    return _resultado(G, escalar)
+
+
+def rosenbrock_hessiano(x):
+    X, escalar = _como_lote(x)
+    d = X.shape[1]
+    diagonal = np.zeros_like(X)
+    diagonal[:, :-1] = 1200 * X[:, :-1]**2 - 400 * X[:, 1:] + 2
+    diagonal[:, 1:] += 200
+    H = _diagonal(diagonal)
+    i = np.arange(d - 1)
+    H[:, i, i + 1] = H[:, i + 1, i] = -400 * X[:, :-1]
+    return _resultado(H, escalar)
+
+
+def ackley(x):
+    X, escalar = _como_lote(x)
+    a, b, c = 20, 0.2, 2 * np.pi
+    d = X.shape[1]
+    sum1 = np.sum(X**2, axis=1)
+    sum2 = np.sum(np.cos(c * X), axis=1)
+    valores = -a * np.exp(-b * np.sqrt(sum1 / d)) - np.exp(sum2 / d) + a + np.exp(1)
+    return _resultado(valores, escalar)
+
+
+def _ackley_terminos(X):
+    a, b, c = 20, 0.2, 2 * np.pi
+    d = X.shape[1]
+    r = np.sqrt(np.sum(X**2, axis=1) / d)[:, None]
+    E = np.exp(np.sum(np.cos(c * X), axis=1) / d)[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        A = np.where(r > 0, a * b * np.exp(-b * r) / (d * r), 0.0)
+        dA = np.where(r > 0, -a * b * np.exp(-b * r) * (b * r + 1) / (d * r**2), 0.0)
+    return c, d, r, E, A, dA
+
+
+def ackley_gradiente(x):
+    """En el origen la función no es diferenciable; ahí se devuelve el subgradiente 0."""
+    X, escalar = _como_lote(x)
+    c, d, _, E, A, _ = _ackley_terminos(X)
+    return _resultado(A * X + (c / d) * np.sin(c * X) * E, escalar)
+
+
+def ackley_hessiano(x):
+    X, escalar = _como_lote(x)
+    c, d, r, E, A, dA = _ackley_terminos(X)
+    S = np.sin(c * X)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        radial = np.where(r > 0, dA / (d * r), 0.0)[:, :, None]
+    H = _diagonal(A + (c**2 / d) * np.cos(c * X) * E)
+    H += radial * X[:, :, None] * X[:, None, :]
+    H -= (c**2 / d**2) * E[:, :, None] * S[:, :, None] * S[:, None, :]
+    return _resultado(H, escalar)
+
+
+def sphere(x):
+    X, escalar = _como_lote(x)
+    return _resultado(np.sum(X**2, axis=1), escalar)
+
+
+def sphere_gradiente(x):
+    X, escalar = _como_lote(x)
+    return _resultado(2 * X, escalar)
+
+
+def sphere_hessiano(x):
+    X, escalar = _como_lote(x)
+    return _resultado(_diagonal(np.full_like(X, 2.0)), escalar)
+
+
+def beale(x):
+    X, escalar = _como_lote(x)
+    x1, x2 = X[:, 0], X[:, 1]
+    valores = ((1.5 - x1 + x1 * x2)**2 +
+               (2.25 - x1 + x1 * x2**2)**2 +
+               (2.625 - x1 + x1 * x2**3)**2)
+    return _resultado(valores, escalar)
+
+
+_BEALE_C = (1.5, 2.25, 2.625)
+
+
+def beale_gradiente(x):
+    X, escalar = _como_lote(x)
+    x1, x2 = X[:, 0], X[:, 1]
+    G = np.zeros_like(X)
+    for k, c in enumerate(_BEALE_C, 1):
+        t = c - x1 + x1 * x2**k
+        G[:, 0] += 2 * t * (x2**k - 1)
+        G[:, 1] += 2 * t * k * x1 * x2**(k - 1)
+    return _resultado(G, escalar)
+
+
+def beale_hessiano(x):
+    X, escalar = _como_lote(x)
+    x1, x2 = X[:, 0], X[:, 1]
+    H = np.zeros((len(X), 2, 2))
+    for k, c in enumerate(_BEALE_C, 1):
+        t = c - x1 + x1 * x2**k
+        dt1 = x2**k - 1
+        dt2 = k * x1 * x2**(k - 1)
+        H[:, 0, 0] += 2 * dt1**2
+        H[:, 0, 1] += 2 * (dt1 * dt2 + t * k * x2**(k - 1))
+        H[:, 1, 1] += 2 * (dt2**2 + t * k * (k - 1) * x1 * x2**max(k - 2, 0))
+    H[:, 1, 0] = H[:, 0, 1]
+    return _resultado(H, escalar)
+
+
+def booth(x):
+    X, escalar = _como_lote(x)
+    x1, x2 = X[:, 0], X[:, 1]
+    return _resultado((x1 + 2*x2 - 7)**2 + (2*x1 + x2 - 5)**2, escalar)
+
+
+def booth_gradiente(x):
+    X, escalar = _como_lote(x)
+    u = X[:, 0] + 2 * X[:, 1] - 7
+    v = 2 * X[:, 0] + X[:, 1] - 5
+    return _resultado(np.stack((2 * u + 4 * v, 4 * u + 2 * v), axis=1), escalar)
+
+
+def booth_hessiano(x):
+    X, escalar = _como_lote(x)
+    return _resultado(np.broadcast_to(np.array([[10.0, 8.0], [8.0, 10.0]]), (len(X), 2, 2)).copy(), escalar)
+
+
+def himmelblau(x):
+    X, escalar = _como_lote(x)
+    x1, x2 = X[:, 0], X[:, 1]
+    return _resultado((x1**2 + x2 - 11)**2 + (x1 + x2**2 - 7)**2, escalar)
+
+
+def himmelblau_gradiente(x):
+    X, escalar = _como_lote(x)
+    x1, x2 = X[:, 0], X[:, 1]
+    u = x1**2 + x2 - 11
+    v = x1 + x2**2 - 7
+    return _resultado(np.stack((4 * x1 * u + 2 * v, 2 * u + 4 * x2 * v), axis=1), escalar)
+
+
+def himmelblau_hessiano(x):
+    X, escalar = _como_lote(x)
+    x1, x2 = X[:, 0], X[:, 1]
+    H = np.empty((len(X), 2, 2))
+    H[:, 0, 0] = 12 * x1**2 + 4 * x2 - 42
+    H[:, 0, 1] = H[:, 1, 0] = 4 * x1 + 4 * x2
+    H[:, 1, 1] = 4 * x1 + 12 * x2**2 - 26
+    return _resultado(H, escalar)
+
+
+def mccormick(x):
+    X, escalar = _como_lote(x)
+    x1, x2 = X[:, 0], X[:, 1]
+    valores = np.sin(x1 + x2) + (x1 - x2)**2 - 1.5 * x1 + 2.5 * x2 + 1
+    return _resultado(valores, escalar)
+
+
+def mccormick_gradiente(x):
+    X, escalar = _como_lote(x)
+    x1, x2 = X[:, 0], X[:, 1]
+    coseno = np.cos(x1 + x2)
+    return _resultado(np.stack((coseno + 2 * (x1 - x2) - 1.5, coseno - 2 * (x1 - x2) + 2.5), axis=1), escalar)
+
+
+def mccormick_hessiano(x):
+    X, escalar = _como_lote(x)
+    seno = np.sin(X[:, 0] + X[:, 1])
+    H = np.empty((len(X), 2, 2))
+    H[:, 0, 0] = H[:, 1, 1] = 2 - seno
+    H[:, 0, 1] = H[:, 1, 0] = -2 - seno
+    return _resultado(H, escalar)
+
+
+def lata(r):
+    return 2 * math.pi * r * r + (500 / r)
+
+
+def caja(l):
+    return -(4 * l**3 - 60 * l**2 + 200 * l)
+
+
+def funcion_00(x):
+    return x**2 + 3
+
+
+def funcion_0(x):
+    if not isinstance(x, np.ndarray) or x.ndim == 0:
+        return float('inf') if x == 0 else x**2 + (54 / x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(x == 0, np.inf, x**2 + 54 / np.where(x == 0, 1, x))
+
+
+def funcion_1(x):
+    return x**3 + 2 * x - 3
+
+
+def funcion_2(x):
+    return x**4 + x**2 - 33
+
+
+def funcion_3(x):
+    return 3 * x**4 - 8 * x**3 - 6 * x**2 + 12 * x
+
+
+@dataclass(frozen=True)
+class FuncionPrueba:
+    """Función de prueba N-D evaluable por lotes: f((n_puntos, d)) -> (n_puntos,).
+
+    Con `dimension=None` la función admite cualquier d y `limites`/`x_optimo`
+    se repiten en cada coordenada. Las de `FUNCIONES_1D` son escalares,
+    f(x: float) -> float, con `dimension=1` y `limites` como intervalo de búsqueda.
+    `gradiente` y `hessiano`, si existen, son analíticos y vectorizados:
+    (n_puntos, d) -> (n_puntos, d) y (n_puntos, d, d).
+    """
+    nombre: str
+    f: callable
+    limites: tuple
+    x_optimo: tuple
+    f_optimo: float
+    dimension: int | None = None
+    gradiente: callable = None
+    hessiano: callable = None
+
+    def __call__(self, x):
+        return self.f(x)
+
+    def dimension_por_defecto(self) -> int:
+        return self.dimension or 2
+
+    def limites_en(self, d: int | None = None) -> np.ndarray:
+        d = d or self.dimension_por_defecto()
+        limites = np.asarray(self.limites, dtype=float)
+        return np.tile(limites, (d, 1)) if len(limites) == 1 else limites[:d]
+
+    def optimo_en(self, d: int | None = None) -> np.ndarray:
+        d = d or self.dimension_por_defecto()
+        x = np.asarray(self.x_optimo, dtype=float)
+        return np.full(d, x[0]) if len(x) == 1 else x[:d]
+
+
+FUNCIONES = {
+    "Rastrigin": FuncionPrueba("Rastrigin", rastrigin, ((-5.12, 5.12),), (0.0,), 0.0, None,
+                               rastrigin_gradiente, rastrigin_hessiano),
+    "Rosenbrock": FuncionPrueba("Rosenbrock", rosenbrock, ((-2.0, 2.0),), (1.0,), 0.0, None,
+                                rosenbrock_gradiente, rosenbrock_hessiano),
+    "Ackley": FuncionPrueba("Ackley", ackley, ((-5.0, 5.0),), (0.0,), 0.0, None,
+                            ackley_gradiente, ackley_hessiano),
+    "Sphere": FuncionPrueba("Sphere", sphere, ((-5.12, 5.12),), (0.0,), 0.0, None,
+                            sphere_gradiente, sphere_hessiano),
+    "Beale": FuncionPrueba("Beale", beale, ((-4.5, 4.5),), (3.0, 0.5), 0.0, 2,
+                           beale_gradiente, beale_hessiano),
+    "Booth": FuncionPrueba("Booth", booth, ((-10.0, 10.0),), (1.0, 3.0), 0.0, 2,
+                           booth_gradiente, booth_hessiano),
+    "Himmelblau": FuncionPrueba("Himmelblau", himmelblau, ((-5.0, 5.0),), (3.0, 2.0), 0.0, 2,
+                                himmelblau_gradiente, himmelblau_hessiano),
+    "McCormick": FuncionPrueba("McCormick", mccormick, ((-1.5, 4.0), (-3.0, 4.0)),
+                               (-0.54719, -1.54719), -1.9133, 2, mccormick_gradiente, mccormick_hessiano),
+}
+
+
+def derivadas(funcion):
+    """(gradiente, hessiano) analíticos de una función registrada, o (None, None).
+
+    Acepta la `FuncionPrueba`, su `f` o un envoltorio con atributo `f`
+    (como `EvaluadorMemo`).
+    """
+    while not isinstance(funcion, FuncionPrueba) and hasattr(funcion, "f"):
+        funcion = funcion.f
+    if isinstance(funcion, FuncionPrueba):
+        return funcion.gradiente, funcion.hessiano
+    for prueba in FUNCIONES.values():
+        if prueba.f is funcion:
+            return prueba.gradiente, prueba.hessiano
+    return None, None
+
+FUNCIONES_1D = {
+    "Lata": FuncionPrueba("Lata", lata, ((0.1, 10.0),), (3.4139203,), 219.6887831, 1),
+    "Caja": FuncionPrueba("Caja", caja, ((2.0, 3.0),), (2.1132487,), -192.4500897, 1),
+    "x² + 3": FuncionPrueba("x² + 3", funcion_00, ((-5.0, 5.0),), (0.0,), 3.0, 1),
+    "x² + 54/x": FuncionPrueba("x² + 54/x", funcion_0, ((0.1, 10.0),), (3.0,), 27.0, 1),
+    "x³ + 2x - 3": FuncionPrueba("x³ + 2x - 3", funcion_1, ((0.0, 5.0),), (0.0,), -3.0, 1),
+    "x⁴ + x² - 33": FuncionPrueba("x⁴ + x² - 33", funcion_2, ((-2.5, 2.5),), (0.0,), -33.0, 1),
+    "3x⁴ - 8x³ - 6x² + 12x": FuncionPrueba("3x⁴ - 8x³ - 6x² + 12x", funcion_3, ((-1.5, 3.0),),
+                                            (2.2469796,), -17.6135642, 1),
+}
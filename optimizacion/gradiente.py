@@ -0,0 +1,323 @@
+import warnings
+from collections import deque
+
+import numpy as np
+
+from . import busqueda_lineal, diferencias, dual
+from .evaluador import memoizar
+from .funciones import derivadas
+from .metricas import Metricas
+
+
+class Optimizador:
+    """Base de los métodos con derivadas.
+
+    Si `funcion` es una función registrada (o se pasan `gradiente`/`hessiano`)
+    se usan sus derivadas analíticas; si no, diferenciación automática con
+    números duales y, si la función no los admite, diferencias finitas
+    (`esquema` elige la plantilla del gradiente; con `procesos` los puntos de
+    cada plantilla se reparten en un pool de procesos, el mismo para toda la
+    corrida, que se libera con `cerrar()` o al salir de un bloque `with`).
+    """
+
+    def __init__(self, funcion, epsilon1=1e-3, epsilon2=1e-3, max_iter=100, gradiente=None, hessiano=None,
+                 automatica=True, esquema="central", procesos=None):
+        self.metricas = Metricas()
+        self.funcion = memoizar(funcion, metricas=self.metricas, procesos=procesos)
+        gradiente_registrado, hessiano_registrado = derivadas(funcion)
+        self.gradiente_exacto = gradiente or gradiente_registrado
+        self.hessiano_exacto = hessiano or hessiano_registrado
+        self.automatica = automatica
+        self.esquema = esquema
+        self.epsilon1 = epsilon1
+        self.epsilon2 = epsilon2
+        self.max_iter = max_iter
+        self.ruta = []
+
+    def cerrar(self):
+        self.funcion.cerrar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def gradiente(self, x, h=1e-6):
+        self.metricas.ngev += 1
+        if self.gradiente_exacto is not None:
+            return np.asarray(self.gradiente_exacto(x), dtype=float)
+        grad = self._automatica(dual.gradiente, x)
+        if grad is not None:
+            return grad
+        return diferencias.gradiente(self.funcion, x, h, self.esquema)
+
+    def hessiano(self, x, delta=1e-5):
+        self.metricas.nhev += 1
+        if self.hessiano_exacto is not None:
+            return np.asarray(self.hessiano_exacto(x), dtype=float)
+        H = self._automatica(dual.hessiano, x)
+        if H is not None:
+            return H
+        return diferencias.hessiano(self.funcion, x, delta)
+
+    def gradiente_hessiano(self, x, delta=1e-5):
+        """Gradiente y hessiano en el mismo punto, compartiendo la evaluación que haga falta."""
+        self.metricas.ngev += 1
+        self.metricas.nhev += 1
+        if self.gradiente_exacto is not None and self.hessiano_exacto is not None:
+            return (np.asarray(self.gradiente_exacto(x), dtype=float),
+                    np.asarray(self.hessiano_exacto(x), dtype=float))
+        derivadas_ad = self._automatica(lambda f, x: dual.segundo_orden(f, x)[1:], x)
+        if derivadas_ad is not None:
+            return derivadas_ad
+        return diferencias.gradiente_hessiano(self.funcion, x, delta)
+
+    def busqueda_linea(self, x, d, fx, grad, alpha=1.0, estrategia="wolfe", **opciones):
+        """Paso sobre x + α·d con una estrategia de `busqueda_lineal.BUSQUEDAS`.
+
+        Devuelve (α, f, gradiente) en el punto aceptado; el gradiente se reutiliza
+        si la búsqueda ya lo calculó.
+        """
+        gradientes = {}
+
+        def phi(a):
+            return self.funcion(x + a * d)
+
+        def dphi(a):
+            gradientes[a] = self.gradiente(x + a * d)
+            return gradientes[a] @ d
+
+        alpha, f_alpha = busqueda_lineal.BUSQUEDAS[estrategia](phi, dphi, fx, grad @ d, alpha, **opciones)
+        grad_alpha = gradientes[alpha] if alpha in gradientes else self.gradiente(x + alpha * d)
+        return alpha, f_alpha, grad_alpha
+
+    def _automatica(self, derivar, x):
+        """Derivada por números duales, o None si no aplica; un fallo la desactiva para el resto de la corrida.
+
+        Cada pasada que termina cuenta como una evaluación de f, igual que en
+        `unidimensional.calcular_derivada`.
+        """
+        if not self.automatica:
+            return None
+        x = np.asarray(x, dtype=float)
+        try:
+            resultado = self.funcion.evaluar_fuera(lambda: derivar(self.funcion.f, x))
+        except dual.NO_DIFERENCIABLE:
+            self.automatica = False
+            return None
+        partes = resultado if isinstance(resultado, tuple) else (resultado,)
+        return resultado if all(np.all(np.isfinite(p)) for p in partes) else None
+
+
+class CauchyOptimizer(Optimizador):
+    """Descenso por el gradiente con búsqueda de línea intercambiable.
+
+    `busqueda` es "dorada" (intervalo de α por la fase de acotamiento y sección
+    dorada que reutiliza un punto por iteración, hasta `epsilon2` del
+    intervalo), "armijo" o "wolfe". El primer α de prueba es `paso_inicial`/‖∇f‖
+    y después el doble de α_{k-1}·‖∇f_{k-1}‖²/‖∇f_k‖², que mantiene el descenso
+    de primer orden α·‖∇f‖² de la iteración anterior.
+    """
+
+    def __init__(self, funcion, epsilon1=1e-3, epsilon2=1e-3, max_iter=100, busqueda="dorada", paso_inicial=1.0,
+                 **opciones):
+        super().__init__(funcion, epsilon1=epsilon1, epsilon2=epsilon2, max_iter=max_iter, **opciones)
+        if busqueda not in busqueda_lineal.BUSQUEDAS:
+            raise ValueError(f"Búsqueda desconocida: {busqueda!r}. Opciones: {', '.join(busqueda_lineal.BUSQUEDAS)}")
+        self.busqueda = busqueda
+        self.paso_inicial = paso_inicial
+
+    def optimizar(self, x_inicial):
+        with self.metricas.ejecucion():
+            xk = np.asarray(x_inicial, dtype=float).copy()
+            self.ruta = [xk.copy()]
+            fx = self.funcion(xk)
+            grad = self.gradiente(xk)
+            alpha = self.paso_inicial / (np.linalg.norm(grad) + 1e-12)
+            opciones = {"epsilon": self.epsilon2} if self.busqueda == "dorada" else {}
+            k = 0
+            while np.linalg.norm(grad) >= self.epsilon1 and k <= self.max_iter:
+                alpha, fx1, grad1 = self.busqueda_linea(xk, -grad, fx, grad, alpha, self.busqueda, **opciones)
+                xk1 = xk - alpha * grad
+                self.ruta.append(xk1.copy())
+                cambio = np.linalg.norm(xk1 - xk) / (np.linalg.norm(xk) + 1e-10)
+                alpha = 2 * alpha * (grad @ grad) / (grad1 @ grad1 + 1e-300)
+                xk, fx, grad = xk1, fx1, grad1
+                k += 1
+                if cambio < self.epsilon2:
+                    break
+            self.metricas.iteraciones = k
+            return xk, self.ruta, self.metricas
+
+
+def cholesky_modificado(H, beta=1e-3, max_intentos=60):
+    """Factor L de H + τI con el menor τ ≥ 0 (en la escala de `beta`) que la hace definida positiva.
+
+    Devuelve (L, τ); τ = 0 si H ya es definida positiva.
+    """
+    H = (H + H.T) / 2
+    minimo_diagonal = np.min(np.diag(H))
+    tau = 0.0 if minimo_diagonal > 0 else beta - minimo_diagonal
+    identidad = np.eye(len(H))
+    for _ in range(max_intentos):
+        try:
+            return np.linalg.cholesky(H + tau * identidad), tau
+        except np.linalg.LinAlgError:
+            tau = max(2 * tau, beta)
+    raise np.linalg.LinAlgError("No se pudo hacer definido positivo el hessiano")
+
+
+def resolver_cholesky(L, b):
+    """x tal que L Lᵀ x = b, por sustitución hacia adelante y hacia atrás (O(N²))."""
+    n = len(b)
+    y = np.empty(n)
+    for i in range(n):
+        y[i] = (b[i] - L[i, :i] @ y[:i]) / L[i, i]
+    x = np.empty(n)
+    for i in range(n - 1, -1, -1):
+        x[i] = (y[i] - L[i + 1:, i] @ x[i + 1:]) / L[i, i]
+    return x
+
+
+class NewtonOptimizer(Optimizador):
+    """Newton con pasos por Cholesky.
+
+    Si el hessiano no es definido positivo (puntos silla, zonas cóncavas) se
+    factoriza H + τI (Cholesky modificado), de modo que el paso siempre es de
+    descenso; si aun así no mejora f se acorta a la mitad hasta que lo haga, y
+    si tras 30 mitades sigue sin mejorar se detiene en el punto actual.
+    Con `refresco` = m > 1 la factorización se reutiliza m iteraciones antes de
+    volver a evaluar el hessiano (Newton-Shamanskii).
+    """
+
+    def __init__(self, funcion, epsilon1=1e-3, epsilon2=1e-3, max_iter=100, refresco=1, **opciones):
+        super().__init__(funcion, epsilon1=epsilon1, epsilon2=epsilon2, max_iter=max_iter, **opciones)
+        self.refresco = max(1, int(refresco))
+        self.desplazamientos = 0
+
+    def optimizar(self, x_inicial):
+        with self.metricas.ejecucion():
+            xk = np.asarray(x_inicial, dtype=float)
+            k = 0
+            self.ruta = [xk.copy()]
+            self.desplazamientos = 0
+            L = None
+
+            while True:
+                if L is None or k % self.refresco == 0:
+                    grad, hess = self.gradiente_hessiano(xk)
+                    L, tau = cholesky_modificado(hess)
+                    self.desplazamientos += tau > 0
+                else:
+                    grad = self.gradiente(xk)
+
+                if np.linalg.norm(grad) < self.epsilon1 or k > self.max_iter:
+                    break
+
+                paso = -resolver_cholesky(L, grad)
+                fx = self.funcion(xk)
+                for _ in range(30):
+                    if self.funcion(xk + paso) <= fx:
+                        break
+                    paso = paso / 2
+                else:
+                    break
+                xk1 = xk + paso
+
+                if np.linalg.norm(xk1 - xk) / (np.linalg.norm(xk) + 1e-10) < self.epsilon2:
+                    break
+
+                xk = xk1
+                self.ruta.append(xk.copy())
+                k += 1
+
+            if self.desplazamientos:
+                warnings.warn(f"Hessiano no definido positivo en {self.desplazamientos} factorizaciones; "
+                              "se usó Cholesky modificado (H + τI).", RuntimeWarning)
+            self.metricas.iteraciones = k
+            return xk, self.ruta, self.metricas
+
+
+class BFGSOptimizer(Optimizador):
+    """Quasi-Newton BFGS: actualiza una aproximación de la inversa del hessiano con los gradientes.
+
+    No evalúa el hessiano; el paso se elige con búsqueda de línea de Wolfe
+    fuerte, que garantiza sᵀy > 0 y mantiene la aproximación definida positiva.
+    """
+
+    def direccion(self, grad):
+        return -self.H @ grad
+
+    def reiniciar(self, n):
+        self.H = np.eye(n)
+
+    def actualizar(self, s, y, primera):
+        sy = s @ y
+        if sy <= 1e-12:
+            return
+        if primera:
+            self.H = (sy / (y @ y)) * np.eye(len(s))
+        rho = 1 / sy
+        Hy = self.H @ y
+        self.H += (rho**2 * (y @ Hy) + rho) * np.outer(s, s) - rho * (np.outer(Hy, s) + np.outer(s, Hy))
+
+    def optimizar(self, x_inicial):
+        with self.metricas.ejecucion():
+            xk = np.asarray(x_inicial, dtype=float).copy()
+            self.ruta = [xk.copy()]
+            self.reiniciar(len(xk))
+            fx = self.funcion(xk)
+            grad = self.gradiente(xk)
+            k = 0
+            while np.linalg.norm(grad) >= self.epsilon1 and k < self.max_iter:
+                d = self.direccion(grad)
+                if grad @ d >= 0:
+                    self.reiniciar(len(xk))
+                    d = -grad
+                alpha, fx1, grad1 = self.busqueda_linea(xk, d, fx, grad)
+                xk1 = xk + alpha * d
+                self.actualizar(xk1 - xk, grad1 - grad, primera=k == 0)
+                self.ruta.append(xk1.copy())
+                k += 1
+                cambio = np.linalg.norm(xk1 - xk) / (np.linalg.norm(xk) + 1e-10)
+                xk, fx, grad = xk1, fx1, grad1
+                if cambio < self.epsilon2:
+                    break
+            self.metricas.iteraciones = k
+            return xk, self.ruta, self.metricas
+
+
+class LBFGSOptimizer(BFGSOptimizer):
+    """BFGS de memoria limitada: guarda solo los últimos `memoria` pares (s, y).
+
+    La dirección sale de la recursión de dos ciclos, con costo y memoria
+    O(m·N) por iteración, así que sirve para miles de variables.
+    """
+
+    def __init__(self, funcion, epsilon1=1e-3, epsilon2=1e-3, max_iter=100, memoria=10, **opciones):
+        super().__init__(funcion, epsilon1=epsilon1, epsilon2=epsilon2, max_iter=max_iter, **opciones)
+        self.memoria = memoria
+
+    def reiniciar(self, n):
+        self.pares = deque(maxlen=self.memoria)
+
+    def actualizar(self, s, y, primera):
+        sy = s @ y
+        if sy > 1e-12:
+            self.pares.append((s, y, 1 / sy))
+
+    def direccion(self, grad):
+        q = grad.copy()
+        alphas = []
+        for s, y, rho in reversed(self.pares):
+            a = rho * (s @ q)
+            q -= a * y
+            alphas.append(a)
+        if self.pares:
+            s, y, _ = self.pares[-1]
+            q *= (s @ y) / (y @ y)
+        for (s, y, rho), a in zip(self.pares, reversed(alphas)):
+            b = rho * (y @ q)
+            q += (a - b) * s
+        return -q
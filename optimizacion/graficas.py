@@ -0,0 +1,99 @@
+import numpy as np
+
+from .malla import evaluar_malla, limites_trayectoria
+from .submuestreo import PUNTOS_GRAFICA, submuestrear
+
+
+def dibujar_contorno(fig, ax, funcion, limites, n_puntos=200, niveles=30, relleno=True):
+    X, Y, Z = evaluar_malla(*limites, funcion, n_puntos=n_puntos)
+    if relleno:
+        contorno = ax.contourf(X, Y, Z, levels=niveles, cmap='viridis')
+        fig.colorbar(contorno, ax=ax)
+    else:
+        contorno = ax.contour(X, Y, Z, levels=niveles, cmap='viridis', alpha=0.6)
+    return contorno
+
+
+def dibujar_contorno_trayectoria(fig, ax, funcion, puntos, n_puntos=200, niveles=30):
+    limites = limites_trayectoria(np.asarray(puntos))
+    dibujar_contorno(fig, ax, funcion, limites, n_puntos=n_puntos, niveles=niveles, relleno=False)
+    ax.set_xlim(limites[0], limites[1])
+    ax.set_ylim(limites[2], limites[3])
+
+
+def graficar_rutas(funcion, rutas, indice_mejor=None, titulo="Rutas"):
+    import matplotlib.pyplot as plt
+
+    n = max(PUNTOS_GRAFICA // len(rutas), 50)
+    rutas = [ruta[submuestrear(ruta[:, :2], PUNTOS_GRAFICA if i == indice_mejor else n)] for i, ruta in enumerate(rutas)]
+    fig, ax = plt.subplots(figsize=(6, 5))
+    dibujar_contorno_trayectoria(fig, ax, funcion, np.vstack(rutas))
+    for i, ruta in enumerate(rutas):
+        if i == indice_mejor:
+            continue
+        ax.plot(ruta[:, 0], ruta[:, 1], linewidth=0.8, alpha=0.5, color='gray')
+        ax.scatter(ruta[-1, 0], ruta[-1, 1], color='gray', s=12)
+    if indice_mejor is not None:
+        mejor = rutas[indice_mejor]
+        ax.plot(mejor[:, 0], mejor[:, 1], linewidth=1.5, color='teal', label='Mejor ruta')
+        ax.scatter(mejor[0, 0], mejor[0, 1], color='limegreen', s=50, label='Inicio')
+        ax.scatter(mejor[-1, 0], mejor[-1, 1], color='crimson', s=50, label='Mejor punto')
+        ax.legend()
+    ax.set_title(titulo)
+    ax.set_xlabel("x₁")
+    ax.set_ylabel("x₂")
+    ax.grid(True)
+    return fig
+
+
+def graficar_funcion_1d(funcion, a, b, puntos, titulo, n_puntos=1000, etiqueta='Puntos evaluados'):
+    import matplotlib.pyplot as plt
+
+    x = np.linspace(a, b, n_puntos)
+    y = [funcion(xi) for xi in x]
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(x, y, label='Función', color='black')
+    if puntos:
+        x_puntos, y_puntos = zip(*puntos)
+        ax.scatter(x_puntos, y_puntos, color='red', label=etiqueta)
+    ax.set_title(titulo)
+    ax.set_xlabel('x')
+    ax.set_ylabel('f(x)')
+    ax.legend()
+    ax.grid(True)
+    return fig
+
+
+def graficar_trayectoria(funcion, puntos, titulo="Trayectoria", etiqueta='Ruta'):
+    import matplotlib.pyplot as plt
+
+    puntos = np.asarray(puntos)
+    fig, ax = plt.subplots(figsize=(6, 5))
+    dibujar_contorno_trayectoria(fig, ax, funcion, puntos)
+    ax.plot(puntos[:, 0], puntos[:, 1], marker='o', linestyle='-', markersize=3, color='blue', label=etiqueta)
+    ax.scatter(puntos[0, 0], puntos[0, 1], color='green', s=60, label='Inicio')
+    ax.scatter(puntos[-1, 0], puntos[-1, 1], color='red', s=60, label='Fin')
+    ax.set_title(titulo)
+    ax.set_xlabel("x₀")
+    ax.set_ylabel("x₁")
+    ax.grid(True)
+    ax.legend()
+    return fig
+
+
+def graficar_convergencia(funcion, puntos, titulo="Convergencia", etiqueta='f(xₖ)'):
+    """f en cada punto de la ruta por iteración; para rutas de más de dos dimensiones."""
+    import matplotlib.pyplot as plt
+
+    valores = np.array([funcion(p) for p in np.asarray(puntos, dtype=float)])
+    fig, ax = plt.subplots(figsize=(6, 4))
+    ax.plot(np.arange(len(valores)), valores, marker='o', markersize=3, color='blue', label=etiqueta)
+    if np.all(valores > 0):
+        ax.set_yscale('log')
+    ax.set_title(titulo)
+    ax.set_xlabel("Iteración")
+    ax.set_ylabel("f(x)")
+    ax.grid(True)
+    ax.legend()
+    return fig
@@ -0,0 +1,111 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .aleatorio import GeneradorBloques, como_generador
+from .evaluador import EvaluadorMemo, memoizar
+from .graficas import dibujar_contorno_trayectoria
+from .metricas import Metricas
+from .submuestreo import reducir_trayectoria
+from .trayectoria import Trayectoria
+
+
+class Explorador:
+    def __init__(self, funcion_objetivo, punto_inicio, sigma=0.1, pasos=1000, rng=None, semilla=None, registro=None):
+        self.metricas = Metricas()
+        self.f = memoizar(funcion_objetivo, metricas=self.metricas)
+        self.punto = np.array(punto_inicio, dtype=float)
+        self.sigma = sigma
+        self.pasos = pasos
+        self.rng = como_generador(rng, semilla)
+        self.trayectoria = Trayectoria(len(self.punto), **(registro or {"solo_aceptados": True}))
+
+    def vecino(self):
+        return self.punto + self.rng.normal(0, self.sigma, size=len(self.punto))
+
+    def optimizar(self):
+        with self.metricas.ejecucion():
+            actual = self.punto.copy()
+            valor = self.f(actual)
+            self.trayectoria.registrar(actual, valor)
+
+            for _ in range(self.pasos):
+                candidato = self.vecino()
+                val_candidato = self.f(candidato)
+
+                mejora = val_candidato < valor
+                if mejora:
+                    actual = candidato
+                    valor = val_candidato
+                    self.punto = candidato
+
+                self.trayectoria.registrar(actual, valor, aceptado=mejora)
+                self.metricas.iteraciones += 1
+
+            self.trayectoria.cerrar()
+            return actual, valor, self.metricas
+
+    def graficar(self, titulo="Ruta del algoritmo"):
+        import matplotlib.pyplot as plt
+
+        puntos = reducir_trayectoria(self.trayectoria)
+        fig, ax = plt.subplots(figsize=(6, 5))
+        dibujar_contorno_trayectoria(fig, ax, self.f.f, puntos)
+        ax.plot(puntos[:, 0], puntos[:, 1], marker='o', linestyle='-', markersize=2, color='teal', label='Ruta')
+        ax.scatter(puntos[0, 0], puntos[0, 1], color='limegreen', s=50, label='Inicio')
+        ax.scatter(puntos[-1, 0], puntos[-1, 1], color='crimson', s=50, label='Fin')
+        ax.set_title(titulo)
+        ax.set_xlabel("x₁")
+        ax.set_ylabel("x₂")
+        ax.legend()
+        ax.grid(True)
+        return fig
+
+
+def _escalar(funcion, inicio, sigma, pasos, rng, registro):
+    explorador = Explorador(funcion, inicio, sigma=sigma, pasos=pasos, rng=rng, registro=registro)
+    x, valor, metricas = explorador.optimizar()
+    return x, valor, explorador.trayectoria.puntos, metricas
+
+
+def multiarranque(funcion, limites, arranques=8, sigma=0.1, pasos=1000, semilla=None, procesos=None,
+                  registro=None):
+    """Hill Climbing desde `arranques` puntos uniformes dentro de `limites` (d, 2).
+
+    Cada arranque usa su propio flujo aleatorio, derivado de `semilla` con
+    `SeedSequence.spawn`, y los arranques se reparten en un pool de procesos
+    del tamaño del número de núcleos.
+    """
+    if isinstance(funcion, EvaluadorMemo):
+        funcion = funcion.f
+    limites = np.asarray(limites, dtype=float)
+    raiz = GeneradorBloques(semilla)
+    generadores = raiz.spawn(arranques)
+    inicios = raiz.uniform(limites[:, 0], limites[:, 1], size=(arranques, len(limites)))
+
+    procesos = min(procesos or os.cpu_count() or 1, arranques)
+    argumentos = ([funcion] * arranques, inicios, [sigma] * arranques, [pasos] * arranques, generadores,
+                  [registro] * arranques)
+    if procesos == 1:
+        resultados = list(map(_escalar, *argumentos))
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(_escalar, *argumentos))
+
+    metricas = Metricas()
+    for _, _, _, metricas_arranque in resultados:
+        metricas.acumular(metricas_arranque)
+
+    valores = np.array([valor for _, valor, _, _ in resultados])
+    i_mejor = int(np.argmin(valores))
+    return {
+        "mejor_x": resultados[i_mejor][0],
+        "mejor_valor": valores[i_mejor],
+        "indice_mejor": i_mejor,
+        "inicios": inicios,
+        "finales": np.array([x for x, _, _, _ in resultados]),
+        "valores": valores,
+        "rutas": [ruta for _, _, ruta, _ in resultados],
+        "metricas": metricas,
+    }
@@ -0,0 +1,97 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+TAM_BLOQUE = 4096
+
+
+def sondear(funcion, muestra: np.ndarray):
+    """Comprueba si `funcion` acepta un lote (k, d) y devuelve k valores correctos.
+
+    Devuelve (vectorizada, valores): los valores punto a punto de `muestra`,
+    que sirven como resultado de esos puntos, o None si no se pudieron calcular.
+    """
+    try:
+        with np.errstate(all="ignore"):
+            uno_a_uno = np.array([funcion(p) for p in muestra], dtype=float)
+    except Exception:
+        return False, None
+    try:
+        with np.errstate(all="ignore"):
+            lote = np.asarray(funcion(muestra), dtype=float)
+    except Exception:
+        return False, uno_a_uno
+    return lote.shape == (len(muestra),) and np.allclose(lote, uno_a_uno, equal_nan=True), uno_a_uno
+
+
+def es_vectorizada(funcion, muestra: np.ndarray) -> bool:
+    return sondear(funcion, muestra)[0]
+
+
+def evaluar_sondeando(funcion, puntos: np.ndarray, tam_bloque=TAM_BLOQUE, procesos=None, pool=None):
+    """Como `evaluar_lote` sin saber si la función es vectorizada: la muestra de la prueba no se repite.
+
+    Devuelve (vectorizada, valores). La prueba evalúa los primeros puntos dos
+    veces (uno a uno y en lote), así que el costo es len(puntos) + len(muestra).
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    muestra = puntos[:3]
+    vectorizada, valores_muestra = sondear(funcion, muestra)
+    if valores_muestra is None:
+        return vectorizada, evaluar_lote(funcion, puntos, vectorizada, tam_bloque, procesos, pool)
+    resto = puntos[len(muestra):]
+    if len(resto) == 0:
+        return vectorizada, valores_muestra
+    valores_resto = evaluar_lote(funcion, resto, vectorizada, tam_bloque, procesos, pool)
+    return vectorizada, np.concatenate([valores_muestra, valores_resto])
+
+
+def evaluar_lote(funcion, puntos: np.ndarray, vectorizada=None, tam_bloque=TAM_BLOQUE, procesos=None,
+                 pool=None) -> np.ndarray:
+    """Valores de `funcion` en cada fila de `puntos`.
+
+    Una función vectorizada se llama una sola vez con el lote; una escalar se
+    evalúa punto a punto o, con `procesos` > 1, repartida en un pool de procesos
+    (conviene solo si cada evaluación es costosa y la función es serializable).
+    Quien evalúa muchos lotes pasa su propio `pool` para no crear uno por llamada.
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    if vectorizada is None:
+        return evaluar_sondeando(funcion, puntos, tam_bloque, procesos, pool)[1]
+
+    if vectorizada:
+        with np.errstate(all="ignore"):
+            return np.asarray(funcion(puntos), dtype=float)
+
+    if pool is not None and procesos and len(puntos) > 1:
+        valores = pool.map(funcion, puntos, chunksize=max(1, len(puntos) // (4 * procesos)))
+        return np.fromiter(valores, dtype=float, count=len(puntos))
+
+    if procesos and procesos > 1 and len(puntos) > 1:
+        procesos = min(procesos, len(puntos))
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            return evaluar_lote(funcion, puntos, False, tam_bloque, procesos, pool)
+
+    valores = np.empty(len(puntos))
+    for inicio in range(0, len(puntos), tam_bloque):
+        bloque = puntos[inicio:inicio + tam_bloque]
+        valores[inicio:inicio + len(bloque)] = np.fromiter(
+            (funcion(p) for p in bloque), dtype=float, count=len(bloque))
+    return valores
+
+
+def evaluar_malla(x_min, x_max, y_min, y_max, funcion, n_puntos=200, vectorizada=None):
+    x_vals = np.linspace(x_min, x_max, n_puntos)
+    y_vals = np.linspace(y_min, y_max, n_puntos)
+    X, Y = np.meshgrid(x_vals, y_vals)
+    puntos = np.column_stack([X.ravel(), Y.ravel()])
+    Z = evaluar_lote(funcion, puntos, vectorizada=vectorizada).reshape(X.shape)
+    return X, Y, Z
+
+
+def limites_trayectoria(puntos, margen=0.25, ancho_minimo=1.0):
+    puntos = np.asarray(puntos, dtype=float)[:, :2]
+    bajo, alto = puntos.min(axis=0), puntos.max(axis=0)
+    centro = (bajo + alto) / 2
+    ancho = np.maximum((alto - bajo) * (1 + 2 * margen), ancho_minimo)
+    return centro[0] - ancho[0] / 2, centro[0] + ancho[0] / 2, centro[1] - ancho[1] / 2, centro[1] + ancho[1] / 2
@@ -0,0 +1,240 @@
+import inspect
+import warnings
+
+import numpy as np
+
+from . import directos, unidimensional
+from .aleatorio import GeneradorBloques
+from .caminata import BuscadorAleatorio
+from .funciones import FUNCIONES, FUNCIONES_1D
+from .gradiente import BFGSOptimizer, CauchyOptimizer, LBFGSOptimizer, NewtonOptimizer
+from .hill_climbing import Explorador
+from .recocido import RecocidoSimulado
+
+
+def _intervalo(prueba, a=None, b=None):
+    limite_a, limite_b = prueba.limites_en(1)[0]
+    return (limite_a if a is None else a), (limite_b if b is None else b)
+
+
+def _exhaustiva(prueba, a=None, b=None, n=100, epsilon=None, max_evaluaciones=None):
+    a, b = _intervalo(prueba, a, b)
+    (x1, x3), metricas = unidimensional.busqueda_exhaustiva(a, b, n, prueba.f, epsilon=epsilon,
+                                                            max_evaluaciones=max_evaluaciones)
+    return (x1 + x3) / 2, metricas
+
+
+def _acotamiento(prueba, x0=None, delta=0.01, lambda_=2.0, max_evaluaciones=None):
+    x0 = np.mean(_intervalo(prueba)) if x0 is None else x0
+    (a, b), _, metricas = unidimensional.fase_acotamiento(x0, delta, lambda_, prueba.f,
+                                                          max_evaluaciones=max_evaluaciones)
+    return (a + b) / 2, metricas
+
+
+def _intervalos_mitad(prueba, a=None, b=None, epsilon=0.01, max_evaluaciones=None):
+    a, b = _intervalo(prueba, a, b)
+    x, _, _, metricas = unidimensional.interval_halving_method(prueba.f, a, b, epsilon,
+                                                               max_evaluaciones=max_evaluaciones)
+    return x, metricas
+
+
+def _fibonacci(prueba, a=None, b=None, n=15, epsilon=0.01, max_evaluaciones=None):
+    a, b = _intervalo(prueba, a, b)
+    n = n if max_evaluaciones is None else max_evaluaciones
+    x, _, _, metricas = unidimensional.fibonacci_search(a, b, n, epsilon, prueba.f)
+    return x, metricas
+
+
+def _dorada(prueba, a=None, b=None, epsilon=0.01, max_evaluaciones=None):
+    a, b = _intervalo(prueba, a, b)
+    x, _, _, metricas = unidimensional.golden_section_search(a, b, epsilon, prueba.f,
+                                                             max_evaluaciones=max_evaluaciones)
+    return x, metricas
+
+
+def _brent(prueba, a=None, b=None, epsilon=0.01, max_evaluaciones=None):
+    a, b = _intervalo(prueba, a, b)
+    x, _, _, metricas = unidimensional.brent(prueba.f, a, b, epsilon, max_evaluaciones=max_evaluaciones)
+    return x, metricas
+
+
+def _newton_raphson(prueba, x0=None, a=None, b=None, epsilon=0.001, delta=1e-5, max_evaluaciones=None):
+    a, b = _intervalo(prueba, a, b)
+    x0 = (a + b) / 2 if x0 is None else x0
+    x, _, metricas = unidimensional.metodo_newton_raphson(prueba.f, x0, epsilon, delta=delta, a=a, b=b,
+                                                          max_evaluaciones=max_evaluaciones)
+    return x, metricas
+
+
+def _biseccion(prueba, a=None, b=None, epsilon=0.001, max_evaluaciones=None):
+    a, b = _intervalo(prueba, a, b)
+    x, _, metricas = unidimensional.Biseccion(a, b, epsilon, prueba.f, max_evaluaciones=max_evaluaciones)
+    return x, metricas
+
+
+def _secante(prueba, a=None, b=None, epsilon=0.001, delta=0.01, max_evaluaciones=None):
+    a, b = _intervalo(prueba, a, b)
+    x, _, metricas = unidimensional.Secante(a, b, epsilon, prueba.f, delta=delta, max_evaluaciones=max_evaluaciones)
+    return x, metricas
+
+
+def _unidireccional(prueba, a=None, b=None, epsilon=0.01, max_evaluaciones=None):
+    a, b = _intervalo(prueba, a, b)
+    x, _, _, metricas = unidimensional.busqueda_unidireccional(prueba.f, a, b, epsilon,
+                                                               max_evaluaciones=max_evaluaciones)
+    return x, metricas
+
+
+def _caminata(prueba, x0, semilla=None, sigma=0.1, iteraciones=1000, caminantes=1):
+    buscador = BuscadorAleatorio(prueba.f, x0, sigma=sigma, iteraciones=iteraciones, semilla=semilla)
+    if caminantes > 1:
+        x, _, _, metricas = buscador.ejecutar_caminantes(caminantes)
+    else:
+        x, _, metricas = buscador.ejecutar()
+    return x, metricas
+
+
+def _hill_climbing(prueba, x0, semilla=None, sigma=0.1, pasos=1000):
+    x, _, metricas = Explorador(prueba.f, x0, sigma=sigma, pasos=pasos, semilla=semilla).optimizar()
+    return x, metricas
+
+
+def _recocido(prueba, x0, semilla=None, sigma=0.1, max_iter=500, w=20, alpha=0.95, cadenas=1, t_max=10.0,
+              intercambio=10):
+    algoritmo = RecocidoSimulado(prueba.f, x0, sigma=sigma, max_iter=max_iter, w=w, alpha=alpha,
+                                 cadenas=cadenas, t_max=t_max, intercambio=intercambio, semilla=semilla)
+    x, _, metricas = algoritmo.optimizar()
+    return x, metricas
+
+
+def _nelder_mead(prueba, x0, semilla=None, alpha=1.0, gamma=1.2, beta=0.5, epsilon=0.001, max_iter=100):
+    x, _, _, metricas = directos.nelder_mead(prueba.f, x0, alpha=alpha, gamma=gamma, beta=beta,
+                                             epsilon=epsilon, max_iter=max_iter)
+    return x, metricas
+
+
+def _hooke_jeeves(prueba, x0, semilla=None, delta=1.0, epsilon=0.001, alpha=2.0, max_iter=100):
+    delta = np.broadcast_to(np.asarray(delta, dtype=float), x0.shape)
+    x, _, metricas = directos.hooke_jeeves(prueba.f, x0, delta, epsilon=epsilon, alpha=alpha, N=len(x0),
+                                           max_iter=max_iter)
+    return x, metricas
+
+
+def _cauchy(prueba, x0, semilla=None, epsilon1=0.001, epsilon2=0.001, max_iter=100, busqueda="dorada"):
+    x, _, metricas = CauchyOptimizer(prueba.f, epsilon1=epsilon1, epsilon2=epsilon2, max_iter=max_iter,
+                                     busqueda=busqueda).optimizar(x0)
+    return x, metricas
+
+
+def _newton(prueba, x0, semilla=None, epsilon1=0.001, epsilon2=0.001, max_iter=100, refresco=1):
+    x, _, metricas = NewtonOptimizer(prueba.f, epsilon1=epsilon1, epsilon2=epsilon2, max_iter=max_iter,
+                                     refresco=refresco).optimizar(x0)
+    return x, metricas
+
+
+def _bfgs(prueba, x0, semilla=None, epsilon1=0.001, epsilon2=0.001, max_iter=100):
+    x, _, metricas = BFGSOptimizer(prueba.f, epsilon1=epsilon1, epsilon2=epsilon2, max_iter=max_iter).optimizar(x0)
+    return x, metricas
+
+
+def _lbfgs(prueba, x0, semilla=None, epsilon1=0.001, epsilon2=0.001, max_iter=100, memoria=10):
+    x, _, metricas = LBFGSOptimizer(prueba.f, epsilon1=epsilon1, epsilon2=epsilon2, max_iter=max_iter,
+                                    memoria=memoria).optimizar(x0)
+    return x, metricas
+
+
+METODOS_1D = {
+    "exhaustiva": _exhaustiva,
+    "acotamiento": _acotamiento,
+    "intervalos_mitad": _intervalos_mitad,
+    "fibonacci": _fibonacci,
+    "dorada": _dorada,
+    "brent": _brent,
+    "newton_raphson": _newton_raphson,
+    "biseccion": _biseccion,
+    "secante": _secante,
+    "unidireccional": _unidireccional,
+}
+
+METODOS_ND = {
+    "caminata": _caminata,
+    "hill_climbing": _hill_climbing,
+    "recocido": _recocido,
+    "nelder_mead": _nelder_mead,
+    "hooke_jeeves": _hooke_jeeves,
+    "cauchy": _cauchy,
+    "newton": _newton,
+    "bfgs": _bfgs,
+    "lbfgs": _lbfgs,
+}
+
+
+def punto_inicial(prueba, dimension=None, semilla=None):
+    """Punto uniforme dentro de los límites de `prueba`, reproducible con `semilla`."""
+    limites = prueba.limites_en(dimension)
+    return GeneradorBloques(semilla).uniform(limites[:, 0], limites[:, 1], size=len(limites))
+
+
+def _validar_opciones(adaptador, opciones, metodo):
+    parametros = inspect.signature(adaptador).parameters
+    sobrantes = [clave for clave in opciones if clave not in parametros or clave in ("prueba", "x0", "semilla")]
+    if sobrantes:
+        validas = [clave for clave in parametros if clave not in ("prueba", "x0", "semilla")]
+        raise ValueError(f"Opciones desconocidas para {metodo}: {', '.join(sobrantes)}. "
+                         f"Válidas: {', '.join(validas)}.")
+
+
+def ejecutar(metodo, funcion, dimension=None, semilla=None, x0=None, **opciones):
+    """Corre `metodo` sobre la función registrada `funcion` y devuelve un dict serializable a JSON.
+
+    Los métodos N-D arrancan en `x0` o, si no se da, en `punto_inicial`; en 1D
+    `x0` solo se pasa a los métodos que parten de un punto. Los avisos que
+    emita el algoritmo se devuelven en la clave `avisos`. Un método, función u
+    opción que no corresponda lanza ValueError antes de correr nada.
+    """
+    if metodo in METODOS_1D:
+        if funcion not in FUNCIONES_1D:
+            raise ValueError(f"{metodo} es un método 1D y {funcion!r} no es una función 1D registrada. "
+                             f"Funciones 1D: {', '.join(FUNCIONES_1D)}.")
+        adaptador = METODOS_1D[metodo]
+        _validar_opciones(adaptador, opciones, metodo)
+        prueba = FUNCIONES_1D[funcion]
+        dimension = 1
+        if x0 is not None and "x0" in inspect.signature(adaptador).parameters:
+            opciones = dict(opciones, x0=x0)
+        correr = lambda: adaptador(prueba, **opciones)
+    elif metodo in METODOS_ND:
+        if funcion not in FUNCIONES:
+            raise ValueError(f"{metodo} es un método N-D y {funcion!r} no es una función N-D registrada. "
+                             f"Funciones N-D: {', '.join(FUNCIONES)}.")
+        adaptador = METODOS_ND[metodo]
+        _validar_opciones(adaptador, opciones, metodo)
+        prueba = FUNCIONES[funcion]
+        dimension = prueba.dimension or dimension or prueba.dimension_por_defecto()
+        if x0 is None:
+            inicio = punto_inicial(prueba, dimension, semilla)
+        else:
+            inicio = np.atleast_1d(np.asarray(x0, dtype=float))
+            if inicio.shape != (dimension,):
+                raise ValueError(f"x0 tiene {inicio.size} componentes y {funcion} se evalúa en dimensión {dimension}.")
+        correr = lambda: adaptador(prueba, inicio, semilla=semilla, **opciones)
+    else:
+        raise ValueError(f"Método desconocido: {metodo!r}. Métodos: {', '.join([*METODOS_1D, *METODOS_ND])}.")
+
+    with warnings.catch_warnings(record=True) as avisos:
+        warnings.simplefilter("always")
+        x, metricas = correr()
+
+    f = float(prueba.f(x))
+    x = np.atleast_1d(np.asarray(x, dtype=float))
+    return {
+        "metodo": metodo,
+        "funcion": funcion,
+        "dimension": dimension,
+        "x": x.tolist(),
+        "f": f,
+        "error_x": float(np.linalg.norm(x - prueba.optimo_en(dimension))),
+        "error_f": abs(f - prueba.f_optimo),
+        "metricas": metricas.como_dict(),
+        "avisos": [str(aviso.message) for aviso in avisos],
+    }
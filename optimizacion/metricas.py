@@ -0,0 +1,73 @@
+import functools
+from contextlib import contextmanager
+from time import perf_counter
+
+FASES = ("algoritmo", "evaluacion", "graficacion")
+
+
+class Metricas:
+    """Conteo de evaluaciones y reparto del tiempo de una ejecución.
+
+    El tiempo de `evaluacion` es el pasado dentro de la función objetivo; el de
+    `algoritmo` es el resto del tiempo de la ejecución.
+    """
+
+    def __init__(self):
+        self.nfev = 0
+        self.ngev = 0
+        self.nhev = 0
+        self.iteraciones = 0
+        self.tiempos = dict.fromkeys(FASES, 0.0)
+
+    @contextmanager
+    def medir(self, fase):
+        inicio = perf_counter()
+        try:
+            yield self
+        finally:
+            self.tiempos[fase] += perf_counter() - inicio
+
+    @contextmanager
+    def ejecucion(self):
+        inicio = perf_counter()
+        evaluacion_previa = self.tiempos["evaluacion"]
+        try:
+            yield self
+        finally:
+            total = perf_counter() - inicio
+            self.tiempos["algoritmo"] += total - (self.tiempos["evaluacion"] - evaluacion_previa)
+
+    def acumular(self, otra):
+        self.nfev += otra.nfev
+        self.ngev += otra.ngev
+        self.nhev += otra.nhev
+        self.iteraciones += otra.iteraciones
+        for fase, segundos in otra.tiempos.items():
+            self.tiempos[fase] += segundos
+        return self
+
+    def registrar_evaluaciones(self, n, segundos):
+        self.nfev += n
+        self.tiempos["evaluacion"] += segundos
+
+    def como_dict(self):
+        return {
+            "nfev": self.nfev,
+            "ngev": self.ngev,
+            "nhev": self.nhev,
+            "iteraciones": self.iteraciones,
+            **{f"tiempo_{fase}_s": round(segundos, 6) for fase, segundos in self.tiempos.items()},
+        }
+
+    def __repr__(self):
+        return f"Metricas({self.como_dict()})"
+
+
+def instrumentado(algoritmo):
+    """Garantiza un objeto `metricas` y mide la ejecución completa del algoritmo."""
+    @functools.wraps(algoritmo)
+    def envoltura(*args, metricas=None, **kwargs):
+        metricas = Metricas() if metricas is None else metricas
+        with metricas.ejecucion():
+            return algoritmo(*args, metricas=metricas, **kwargs)
+    return envoltura
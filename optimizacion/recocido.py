@@ -0,0 +1,122 @@
+import numpy as np
+
+from .aleatorio import como_generador
+from .evaluador import memoizar
+from .graficas import dibujar_contorno_trayectoria
+from .metricas import Metricas
+from .submuestreo import reducir_trayectoria
+from .trayectoria import Trayectoria
+
+
+def escalera_temperaturas(cadenas, t_min=1.0, t_max=10.0):
+    if cadenas == 1:
+        return np.array([t_min])
+    return t_min * (t_max / t_min) ** (np.arange(cadenas) / (cadenas - 1))
+
+
+class RecocidoSimulado:
+    """Recocido simulado con `cadenas` cadenas evaluadas como arreglos (M, d).
+
+    Cada cadena tiene su propia temperatura en una escalera geométrica entre
+    1 y `t_max`; todas se enfrían con `alpha` y cada `intercambio` pasos las
+    cadenas vecinas proponen intercambiar sus estados (parallel tempering).
+    Con `cadenas=1` es el recocido simulado clásico de una sola cadena.
+    La trayectoria del mejor punto se guarda, por omisión, sólo cuando mejora
+    o cambia la temperatura (ver `Trayectoria`).
+    """
+
+    def __init__(self, funcion_objetivo, punto_inicio, sigma=0.1, max_iter=1000, w=20, alpha=0.95,
+                 cadenas=1, t_max=10.0, intercambio=10, rng=None, semilla=None, registro=None):
+        self.metricas = Metricas()
+        self.f = memoizar(funcion_objetivo, metricas=self.metricas)
+        self.x_actual = np.array(punto_inicio, dtype=float)
+        self.sigma = sigma
+        self.max_iter = max_iter
+        self.w = w
+        self.alpha = alpha
+        self.cadenas = cadenas
+        self.t_max = t_max
+        self.intercambio = intercambio
+        self.rng = como_generador(rng, semilla)
+        self.trayectoria = Trayectoria(len(self.x_actual), extras=("valor", "temperatura"),
+                                       **(registro or {"solo_aceptados": True}))
+        self.intercambios_propuestos = 0
+        self.intercambios_aceptados = 0
+
+    def tweak(self, X):
+        return X + self.rng.normal(0, self.sigma, size=X.shape)
+
+    def intercambiar(self, X, fX, T, paridad):
+        for m in range(paridad, self.cadenas - 1, 2):
+            self.intercambios_propuestos += 1
+            log_p = (fX[m] - fX[m + 1]) * (1 / T[m] - 1 / T[m + 1])
+            if log_p >= 0 or np.exp(log_p) >= self.rng.uniform():
+                X[[m, m + 1]] = X[[m + 1, m]]
+                fX[[m, m + 1]] = fX[[m + 1, m]]
+                self.intercambios_aceptados += 1
+
+    def optimizar(self):
+        with self.metricas.ejecucion():
+            M = self.cadenas
+            X = np.tile(self.x_actual, (M, 1))
+            fX = np.repeat(self.f(self.x_actual), M)
+            mejores = X.copy()
+            f_mejores = fX.copy()
+            T = escalera_temperaturas(M, 1.0, self.t_max)
+
+            mejor = self.x_actual.copy()
+            f_mejor = fX[0]
+            self.trayectoria.registrar(mejor, f_mejor, T[0])
+
+            iteracion = 0
+            paso = 0
+            while iteracion < self.max_iter and T[0] > 1e-8:
+                for j in range(self.w):
+                    vecinos = self.tweak(X)
+                    f_vecinos = self.f.evaluar_lote_directo(vecinos)
+
+                    with np.errstate(over="ignore"):
+                        acepta = np.exp(-(f_vecinos - fX) / T) >= self.rng.uniform(size=M)
+                    X[acepta] = vecinos[acepta]
+                    fX[acepta] = f_vecinos[acepta]
+
+                    mejora = fX < f_mejores
+                    mejores[mejora] = X[mejora]
+                    f_mejores[mejora] = fX[mejora]
+                    i = np.argmin(f_mejores)
+                    nuevo_mejor = f_mejores[i] < f_mejor
+                    if nuevo_mejor:
+                        mejor = mejores[i].copy()
+                        f_mejor = f_mejores[i]
+
+                    paso += 1
+                    if M > 1 and paso % self.intercambio == 0:
+                        self.intercambiar(X, fX, T, (paso // self.intercambio) % 2)
+
+                    self.trayectoria.registrar(mejor, f_mejor, T[0], aceptado=nuevo_mejor or j == 0)
+
+                T = T * self.alpha
+                iteracion += 1
+
+            self.trayectoria.cerrar()
+            self.x_actual = X[0].copy()
+            self.mejores_cadenas = mejores
+            self.f_mejores_cadenas = f_mejores
+            self.metricas.iteraciones = iteracion
+            return mejor, f_mejor, self.metricas
+
+    def graficar(self, titulo="Recorrido Recocido Simulado"):
+        import matplotlib.pyplot as plt
+
+        puntos = reducir_trayectoria(self.trayectoria)
+        fig, ax = plt.subplots(figsize=(6, 5))
+        dibujar_contorno_trayectoria(fig, ax, self.f.f, puntos)
+        ax.plot(puntos[:, 0], puntos[:, 1], marker='o', linestyle='-', markersize=2, color='purple', label='Ruta')
+        ax.scatter(puntos[0, 0], puntos[0, 1], color='limegreen', s=50, label='Inicio')
+        ax.scatter(puntos[-1, 0], puntos[-1, 1], color='crimson', s=50, label='Fin')
+        ax.set_title(titulo)
+        ax.set_xlabel("x₁")
+        ax.set_ylabel("x₂")
+        ax.legend()
+        ax.grid(True)
+        return fig
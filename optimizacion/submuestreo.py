@@ -0,0 +1,67 @@
+import numpy as np
+
+PUNTOS_GRAFICA = 1500
+
+
+def lttb(puntos, n):
+    """Índices de `n` filas de `puntos` (m, 2) elegidas con Largest-Triangle-Three-Buckets.
+
+    Sirve para series (t, y) y para rutas en el plano: conserva el primer y el
+    último punto y, en cada cubeta, el que forma el triángulo de mayor área
+    con el punto elegido antes y el promedio de la cubeta siguiente.
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    m = len(puntos)
+    if n >= m:
+        return np.arange(m)
+    if n < 3:
+        return np.array([0, m - 1])
+
+    bordes = np.linspace(1, m - 1, n - 1).astype(int)
+    indices = np.empty(n, dtype=int)
+    indices[0], indices[-1] = 0, m - 1
+    a = puntos[0]
+    for k in range(n - 2):
+        cubeta = puntos[bordes[k]:bordes[k + 1]]
+        siguiente = puntos[bordes[k + 1]:bordes[k + 2]] if k + 2 < len(bordes) else puntos[-1:]
+        c = siguiente.mean(axis=0)
+        areas = np.abs((a[0] - c[0]) * (cubeta[:, 1] - a[1]) - (a[0] - cubeta[:, 0]) * (c[1] - a[1]))
+        indices[k + 1] = bordes[k] + int(np.argmax(areas))
+        a = puntos[indices[k + 1]]
+    return indices
+
+
+def eventos(trayectoria):
+    """Índices que no deben perderse: inicio, fin, mejoras del valor y cambios de temperatura."""
+    n = len(trayectoria)
+    marcados = [0, n - 1]
+    if "valor" in trayectoria.extras:
+        marcados.extend(np.flatnonzero(np.diff(trayectoria.columna("valor")) < 0) + 1)
+    if "temperatura" in trayectoria.extras:
+        marcados.extend(np.flatnonzero(np.diff(trayectoria.columna("temperatura")) != 0) + 1)
+    return np.unique(np.asarray(marcados, dtype=int))
+
+
+def submuestrear(puntos, n=PUNTOS_GRAFICA, obligatorios=None):
+    """Índices de a lo más `n` filas de una ruta, incluyendo `obligatorios`.
+
+    Si los obligatorios ya superan `n`, se reducen ellos mismos con LTTB; si
+    no, el resto del presupuesto se reparte con LTTB sobre la ruta completa.
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    m = len(puntos)
+    if m <= n:
+        return np.arange(m)
+    obligatorios = np.array([0, m - 1]) if obligatorios is None else np.asarray(obligatorios, dtype=int)
+    if len(obligatorios) >= n:
+        return obligatorios[lttb(puntos[obligatorios], n)]
+    libres = lttb(puntos, n - len(obligatorios))
+    return np.union1d(obligatorios, libres)
+
+
+def reducir_trayectoria(trayectoria, n=PUNTOS_GRAFICA):
+    """Filas de `trayectoria.datos` a dibujar, conservando sus eventos."""
+    datos = trayectoria.datos
+    if len(datos) <= n:
+        return datos
+    return datos[submuestrear(trayectoria.puntos[:, :2], n, eventos(trayectoria))]
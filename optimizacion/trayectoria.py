@@ -0,0 +1,80 @@
+import numpy as np
+
+
+class Trayectoria:
+    """Registro de una trayectoria en un arreglo 2D preasignado.
+
+    Cada fila guarda un punto de `dimension` coordenadas seguido de las
+    columnas `extras` (por ejemplo el valor o la temperatura). El arreglo
+    crece al doble cuando se llena, o, con `anillo=n`, conserva sólo las
+    últimas `n` filas. Con `cada=k` se guarda uno de cada k pasos y con
+    `solo_aceptados=True` sólo los pasos marcados como aceptados; el último
+    paso descartado se puede recuperar con `cerrar()`.
+    """
+
+    def __init__(self, dimension, extras=("valor",), capacidad=1024, cada=1, solo_aceptados=False, anillo=None):
+        self.dimension = dimension
+        self.extras = tuple(extras)
+        self.cada = max(int(cada), 1)
+        self.solo_aceptados = solo_aceptados
+        self.anillo = anillo
+        capacidad = anillo if anillo else capacidad
+        self._datos = np.empty((max(int(capacidad), 1), dimension + len(self.extras)))
+        self._n = 0
+        self._inicio = 0
+        self._pasos = 0
+        self._pendiente = None
+
+    def _guardar(self, fila):
+        capacidad = len(self._datos)
+        if self.anillo:
+            self._datos[(self._inicio + self._n) % capacidad] = fila
+            if self._n < capacidad:
+                self._n += 1
+            else:
+                self._inicio = (self._inicio + 1) % capacidad
+            return
+        if self._n == capacidad:
+            self._datos = np.resize(self._datos, (2 * capacidad, self._datos.shape[1]))
+        self._datos[self._n] = fila
+        self._n += 1
+
+    def registrar(self, punto, *extras, aceptado=True):
+        """Ofrece un paso al registro; el primero siempre se guarda."""
+        primero = self._pasos == 0
+        self._pasos += 1
+        fila = np.concatenate((np.ravel(punto), extras))
+        if primero or (self._pasos - 1) % self.cada == 0 and (aceptado or not self.solo_aceptados):
+            self._guardar(fila)
+            self._pendiente = None
+        else:
+            self._pendiente = fila
+
+    def cerrar(self):
+        """Guarda el último paso si quedó fuera del registro, para conservar el punto final."""
+        if self._pendiente is not None:
+            self._guardar(self._pendiente)
+            self._pendiente = None
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def pasos(self):
+        return self._pasos
+
+    @property
+    def datos(self):
+        if self.anillo and self._inicio:
+            return np.roll(self._datos[:self._n], -self._inicio, axis=0)
+        return self._datos[:self._n]
+
+    @property
+    def puntos(self):
+        return self.datos[:, :self.dimension]
+
+    def columna(self, nombre):
+        return self.datos[:, self.dimension + self.extras.index(nombre)]
+
+    def nbytes(self):
+        return self._datos.nbytes
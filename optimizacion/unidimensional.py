@@ -0,0 +1,495 @@
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import dual
+from .evaluador import EvaluadorMemo, PresupuestoAgotado, memoizar
+from .metricas import Metricas, instrumentado
+
+
+def _exigir_presupuesto(max_evaluaciones, minimo, metodo):
+    """Los métodos con un costo fijo de arranque rechazan de entrada un presupuesto que no lo cubre."""
+    if max_evaluaciones is not None and max_evaluaciones < minimo:
+        raise ValueError(f"{metodo} necesita un presupuesto de al menos {minimo} evaluaciones "
+                         f"(se dieron {max_evaluaciones}).")
+
+
+def _muestrear(funcion, a, b, n):
+    """Malla de n + 1 puntos equiespaciados en [a, b] y sus valores, evaluados en un solo lote."""
+    x = np.linspace(a, b, n + 1)
+    return x, funcion.evaluar_lote_directo(x)
+
+
+def _tercias(fx):
+    """Índices i de los tríos de la malla con f(x[i-1]) ≥ f(x[i]) ≤ f(x[i+1])."""
+    centro = fx[1:-1]
+    return np.flatnonzero((fx[:-2] >= centro) & (centro <= fx[2:])) + 1
+
+
+@instrumentado
+def busqueda_exhaustiva(a: float, b: float, n: int, funcion: callable, epsilon=None, max_niveles=50,
+                        max_evaluaciones=None, metricas=None):
+    """Búsqueda exhaustiva vectorizada con refinamiento multirresolución.
+
+    Evalúa la malla de n + 1 puntos de [a, b] en una sola llamada por lotes y
+    toma el primer trío x1 < x2 < x3 con f(x1) ≥ f(x2) ≤ f(x3); si no hay
+    ninguno, el mejor punto de la malla y sus vecinos. Con `epsilon` vuelve a
+    mallar [x1, x3] con n particiones hasta que mida menos de `epsilon`: cada
+    nivel reduce el ancho n/2 veces, así que k niveles equivalen a una malla
+    de n·(n/2)^(k-1) particiones con solo k·(n + 1) evaluaciones. Con
+    `max_evaluaciones` sigue refinando mientras quepa una malla de al menos
+    tres particiones, acortando la última si hace falta; un presupuesto que
+    no alcanza para la primera (más la prueba de vectorización) da ValueError.
+    """
+    funcion = memoizar(funcion, metricas=metricas, max_evaluaciones=max_evaluaciones)
+    _exigir_presupuesto(funcion.restantes, 4 + (3 if funcion.vectorizada is None else 0), "busqueda_exhaustiva")
+    n = max(int(n), 3)
+    x1, x3 = a, b
+    for _ in range(max_niveles):
+        sonda = 3 if funcion.vectorizada is None else 0
+        particiones = int(min(n, funcion.restantes - sonda - 1))
+        if particiones < 3:
+            break
+        x, fx = _muestrear(funcion, x1, x3, particiones)
+        tercias = _tercias(fx)
+        i = tercias[0] if len(tercias) else int(np.argmin(np.where(np.isnan(fx), np.inf, fx)))
+        x1, x3 = x[max(i - 1, 0)], x[min(i + 1, particiones)]
+        metricas.iteraciones += 1
+        if epsilon is None and max_evaluaciones is None or epsilon is not None and x3 - x1 <= epsilon:
+            break
+
+    return (x1, x3), metricas
+
+
+@instrumentado
+def fase_acotamiento(x0, delta, lambda_, funcion, max_iter=1000, max_x=1e6, max_evaluaciones=None, metricas=None):
+    _exigir_presupuesto(max_evaluaciones, 3, "fase_acotamiento")
+    funcion = memoizar(funcion, metricas=metricas, max_evaluaciones=max_evaluaciones)
+    x1 = x0
+    x2 = x1 + delta if funcion(x1 + delta) < funcion(x1) else x1 - delta
+    x_previo = x1 - (x2 - x1)
+    k = 1
+
+    puntos = [(x1, funcion(x1)), (x2, funcion(x2))]
+
+    while funcion(x2) < funcion(x1):
+        if abs(x2) > max_x or k > max_iter:
+            warnings.warn("Se alcanzó el límite de iteraciones o crecimiento.", RuntimeWarning)
+            break
+        if funcion.restantes < 1:
+            warnings.warn("Se agotó el presupuesto de evaluaciones.", RuntimeWarning)
+            break
+
+        x_previo, x1 = x1, x2
+        delta *= lambda_
+        x2 = x1 + delta if x2 > x0 else x1 - delta
+        puntos.append((x2, funcion(x2)))
+        k += 1
+
+    # El mínimo queda entre el punto anterior al mejor y el primero que empeora.
+    metricas.iteraciones += k
+    return (min(x_previo, x2), max(x_previo, x2)), puntos, metricas
+
+
+def _estrategia_mitad(a, b, conocido):
+    L = b - a
+    return [a + L / 4, b - L / 4] + ([(a + b) / 2] if conocido is None else [])
+
+
+def _opuesto(izquierdo, derecho, conocido):
+    """De los dos puntos simétricos del intervalo, el que no es `conocido`."""
+    return derecho if abs(conocido - izquierdo) < abs(conocido - derecho) else izquierdo
+
+
+def _estrategia_dorada(a, b, conocido):
+    # Los puntos salen siempre del intervalo actual y no de reflejar el conocido,
+    # así el error de redondeo no se acumula y cada reducción es exactamente 0.618.
+    izquierdo, derecho = b - PHI * (b - a), a + PHI * (b - a)
+    if conocido is None:
+        return [izquierdo, derecho]
+    return [_opuesto(izquierdo, derecho, conocido)]
+
+
+def _estrategia_fibonacci(n, distincion=None):
+    """Puntos de Fibonacci para exactamente `n` evaluaciones.
+
+    Con m evaluaciones por colocar en el intervalo (contando la ya conocida),
+    los puntos están a Fₘ₋₁/Fₘ₊₁ de cada extremo. En la última ambos coinciden
+    en el centro y la nueva se separa `distincion` del conocido.
+    """
+    fib = fibonacci(n + 1)
+    llamadas = 0
+
+    def estrategia(a, b, conocido):
+        nonlocal llamadas
+        m = n - llamadas
+        llamadas += 1
+        if m < 2:
+            return [(a + b) / 2] if conocido is None and m == 1 else []
+        Lk = fib[m - 1] / fib[m + 1] * (b - a)
+        if m > 2:
+            return [a + Lk, b - Lk] if conocido is None else [_opuesto(a + Lk, b - Lk, conocido)]
+        separacion = min(distincion or 1e-6 * (b - a), (b - a) / 4)
+        centro = (a + b) / 2 if conocido is None else conocido
+        return ([centro] if conocido is None else []) + [centro + separacion]
+    return estrategia
+
+
+ESTRATEGIAS = {
+    "mitad": _estrategia_mitad,
+    "dorada": _estrategia_dorada,
+}
+PHI = (np.sqrt(5) - 1) / 2
+
+
+@instrumentado
+def reducir_intervalo(funcion, a, b, epsilon, estrategia="dorada", max_evaluaciones=None, metricas=None):
+    """Motor común de los métodos de eliminación de regiones para funciones unimodales en [a, b].
+
+    En cada iteración la `estrategia` propone puntos interiores a partir del
+    intervalo y del mejor punto ya conocido; se evalúan solo los nuevos (con
+    la caché de `memoizar`), el intervalo se reduce a los vecinos del mejor
+    punto y ese punto se conserva para la siguiente iteración. Se detiene
+    cuando b - a ≤ `epsilon` (si no es None), al agotar `max_evaluaciones` o
+    cuando la estrategia ya no propone puntos nuevos.
+
+    `estrategia` es un nombre de `ESTRATEGIAS` o una función (a, b, conocido)
+    que devuelve la lista de puntos a probar. Devuelve el centro del último
+    intervalo, los puntos evaluados, los intervalos recorridos y las métricas.
+    """
+    x, puntos, intervalos = _reducir(memoizar(funcion, metricas=metricas), a, b, epsilon, estrategia,
+                                     max_evaluaciones, metricas)
+    return x, puntos, intervalos, metricas
+
+
+def _reducir(funcion, a, b, epsilon, estrategia, max_evaluaciones, metricas):
+    proponer = ESTRATEGIAS[estrategia] if isinstance(estrategia, str) else estrategia
+    puntos, intervalos = [], [(a, b)]
+    mejor = None
+
+    while (epsilon is None or b - a > epsilon) and (max_evaluaciones is None or len(puntos) < max_evaluaciones):
+        conocido = None if mejor is None else mejor[0]
+        nuevos = [x for x in proponer(a, b, conocido) if a < x < b and x != conocido]
+        if max_evaluaciones is not None:
+            nuevos = nuevos[:max_evaluaciones - len(puntos)]
+        if not nuevos:
+            break
+
+        evaluados = [(x, funcion(x)) for x in nuevos]
+        puntos.extend(evaluados)
+        candidatos = sorted(evaluados + ([mejor] if mejor else []))
+        i = min(range(len(candidatos)), key=lambda j: candidatos[j][1])
+        a = candidatos[i - 1][0] if i > 0 else a
+        b = candidatos[i + 1][0] if i + 1 < len(candidatos) else b
+        mejor = candidatos[i]
+        intervalos.append((a, b))
+        metricas.iteraciones += 1
+
+    return (a + b) / 2, puntos, intervalos
+
+
+def interval_halving_method(func, a, b, epsilon, max_evaluaciones=None, metricas=None):
+    """Intervalos por la mitad: tres puntos a ¼, ½ y ¾; el central se reutiliza, dos evaluaciones por mitad."""
+    return reducir_intervalo(func, a, b, epsilon, "mitad", max_evaluaciones=max_evaluaciones, metricas=metricas)
+
+
+def fibonacci(n):
+    fib = [0, 1]
+    for _ in range(2, n + 1):
+        fib.append(fib[-1] + fib[-2])
+    return fib
+
+
+def fibonacci_search(a: float, b: float, n: int, epsilon: float, func: callable, metricas=None):
+    """Búsqueda de Fibonacci con exactamente `n` evaluaciones: el intervalo final mide (b - a)/Fₙ₊₁ + ε.
+
+    `n` es el presupuesto y no se corta antes por precisión; `epsilon` es la
+    separación entre las dos últimas evaluaciones, que caerían en el mismo punto.
+    """
+    x, points, intervalos, metricas = reducir_intervalo(func, a, b, None, _estrategia_fibonacci(n, epsilon),
+                                                        max_evaluaciones=n, metricas=metricas)
+    return x, points, intervalos[-1], metricas
+
+
+def golden_section_search(a: float, b: float, epsilon: float, func: callable, max_evaluaciones=None, metricas=None):
+    """Sección dorada: reutiliza un punto interior, una evaluación nueva por cada reducción de 0.618.
+
+    Con `max_evaluaciones` = N y `epsilon` None el intervalo final mide (b - a)·0.618ᴺ⁻¹.
+    """
+    x, points, intervalos, metricas = reducir_intervalo(func, a, b, epsilon, "dorada",
+                                                        max_evaluaciones=max_evaluaciones, metricas=metricas)
+    return x, points, intervalos[-1], metricas
+
+
+@instrumentado
+def brent(funcion, a, b, epsilon, max_iter=500, max_evaluaciones=None, metricas=None):
+    """Método de Brent: interpolación parabólica con pasos de sección dorada como respaldo, sin derivadas.
+
+    Acepta la parábola por los tres mejores puntos solo si cae dentro del
+    intervalo y se mueve menos de la mitad del penúltimo paso; si no, da un
+    paso de sección dorada. Termina cuando el mejor punto está a menos de
+    `epsilon`/2 de ambos extremos del intervalo que contiene al mínimo, o al
+    gastar `max_evaluaciones` (una por iteración, más la inicial).
+    Devuelve el mejor punto, los puntos evaluados, los intervalos y las métricas.
+    """
+    _exigir_presupuesto(max_evaluaciones, 1, "brent")
+    funcion = memoizar(funcion, metricas=metricas)
+    razon = 1 - PHI
+    x = w = v = a + razon * (b - a)
+    fx = fw = fv = funcion(x)
+    puntos, intervalos = [(x, fx)], [(a, b)]
+    d = e = 0.0
+
+    for _ in range(max_iter):
+        medio = (a + b) / 2
+        tol1 = 1.5e-8 * abs(x) + epsilon / 4
+        tol2 = 2 * tol1
+        if abs(x - medio) <= tol2 - (b - a) / 2:
+            break
+        if max_evaluaciones is not None and len(puntos) >= max_evaluaciones:
+            break
+
+        dorado = True
+        if abs(e) > tol1:
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            e_previo, e = e, d
+            if abs(p) < abs(q * e_previo / 2) and q * (a - x) < p < q * (b - x):
+                d = p / q
+                if (x + d) - a < tol2 or b - (x + d) < tol2:
+                    d = tol1 if x < medio else -tol1
+                dorado = False
+        if dorado:
+            e = (a - x) if x >= medio else (b - x)
+            d = razon * e
+
+        u = x + d if abs(d) >= tol1 else x + (tol1 if d > 0 else -tol1)
+        fu = funcion(u)
+        puntos.append((u, fu))
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+        intervalos.append((a, b))
+        metricas.iteraciones += 1
+
+    return x, puntos, intervalos, metricas
+
+
+def _refinar(funcion, a, b, epsilon, metodo, max_evaluaciones=None):
+    """Mejor punto evaluado (x, f(x)) al reducir [a, b] con `metodo`, sin volver a evaluarlo."""
+    if metodo == "brent":
+        _, puntos, _, metricas = brent(funcion, a, b, epsilon, max_evaluaciones=max_evaluaciones)
+    else:
+        _, puntos, _, metricas = reducir_intervalo(funcion, a, b, epsilon, metodo, max_evaluaciones=max_evaluaciones)
+    if not puntos:
+        medio = (a + b) / 2
+        puntos = [(medio, memoizar(funcion, metricas=metricas)(medio))]
+    x, valor = min(puntos, key=lambda punto: punto[1])
+    return x, valor, metricas
+
+
+def minimos_locales(funcion, a, b, n=1000, epsilon=1e-6, metodo="brent", procesos=None, max_evaluaciones=None):
+    """Todos los mínimos locales de `funcion` en [a, b] con un solo barrido y refinamiento en paralelo.
+
+    La malla de n + 1 puntos se evalúa en un lote y cada racha de tríos con
+    f(x[i-1]) ≥ f(x[i]) ≤ f(x[i+1]) da un intervalo; un extremo de [a, b] es
+    mínimo si su vecino vale más. Cada intervalo se reduce hasta `epsilon`
+    con `metodo` ("brent" o una estrategia de `reducir_intervalo`), repartidos
+    en un pool de procesos del tamaño del número de núcleos. Devuelve los
+    mínimos (x, f(x)) ordenados por x, sus intervalos y las métricas sumadas.
+    Con `max_evaluaciones` la malla usa a lo sumo un tercio del presupuesto
+    y el resto se reparte a partes iguales entre los intervalos; hacen falta
+    al menos 10 para una malla de dos particiones y su refinamiento.
+    """
+    _exigir_presupuesto(max_evaluaciones, 10, "minimos_locales")
+    if isinstance(funcion, EvaluadorMemo):
+        funcion = funcion.f
+    metricas = Metricas()
+    with metricas.ejecucion():
+        barrido = memoizar(funcion, metricas=metricas, max_evaluaciones=max_evaluaciones)
+        n = max(min(int(n), (barrido.restantes - 4) // 3), 2)
+        x, fx = _muestrear(barrido, a, b, n)
+        x = x.tolist()
+        tercias = _tercias(fx)
+        inicios = tercias[np.diff(tercias, prepend=-2) > 1]
+        finales = tercias[np.diff(tercias, append=len(fx) + 1) > 1]
+        intervalos = [(x[i - 1], x[j + 1]) for i, j in zip(inicios, finales)]
+        if fx[0] < fx[1]:
+            intervalos.insert(0, (x[0], x[1]))
+        if fx[-1] < fx[-2]:
+            intervalos.append((x[-2], x[-1]))
+        metricas.iteraciones += 1
+
+    if not intervalos:
+        return [], [], metricas
+
+    presupuesto = None if max_evaluaciones is None else (max_evaluaciones - barrido.nfev) // len(intervalos)
+    procesos = min(procesos or os.cpu_count() or 1, len(intervalos))
+    argumentos = ([funcion] * len(intervalos), [i for i, _ in intervalos], [j for _, j in intervalos],
+                  [epsilon] * len(intervalos), [metodo] * len(intervalos), [presupuesto] * len(intervalos))
+    if procesos == 1:
+        resultados = list(map(_refinar, *argumentos))
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(_refinar, *argumentos))
+
+    for _, _, metricas_intervalo in resultados:
+        metricas.acumular(metricas_intervalo)
+    return [(float(x), float(valor)) for x, valor, _ in resultados], intervalos, metricas
+
+
+@instrumentado
+def metodo_newton_raphson(f, x0, epsilon, delta=1e-5, max_iter=100, a=None, b=None, max_evaluaciones=None,
+                          metricas=None):
+    f = memoizar(f, metricas=metricas, max_evaluaciones=max_evaluaciones)
+    puntos = []
+    x = x0
+
+    try:
+        for _ in range(max_iter):
+            metricas.iteraciones += 1
+            fx = f(x)
+            derivada = calcular_derivada(x, delta, f)
+            metricas.ngev += 1
+            puntos.append((x, fx))
+
+            if abs(derivada) < 1e-10:
+                warnings.warn("Derivada muy pequeña. Método detenido.", RuntimeWarning)
+                break
+
+            x_nuevo = x - fx / derivada
+
+            if a is not None:
+                x_nuevo = max(a, x_nuevo)
+            if b is not None:
+                x_nuevo = min(b, x_nuevo)
+
+            if abs(x_nuevo - x) < epsilon or abs(f(x_nuevo)) < epsilon:
+                x = x_nuevo
+                puntos.append((x, f(x)))
+                break
+
+            x = x_nuevo
+    except PresupuestoAgotado as error:
+        warnings.warn(str(error), RuntimeWarning)
+
+    return x, puntos, metricas
+
+
+def calcular_derivada(x, delta, funcion):
+    """Derivada exacta con números duales; diferencia central con paso `delta` si la función no los admite.
+
+    Si `funcion` es un `EvaluadorMemo`, la pasada con duales que termina cuenta como una evaluación más
+    (en `nfev` y en su presupuesto); si falla no gasta nada y solo se pagan las dos de la diferencia central.
+    """
+    try:
+        if isinstance(funcion, EvaluadorMemo):
+            derivada = funcion.evaluar_fuera(lambda: dual.derivada(funcion, x))
+        else:
+            derivada = dual.derivada(funcion, x)
+    except dual.NO_DIFERENCIABLE:
+        derivada = None
+    if derivada is None or not np.isfinite(derivada):
+        derivada = (funcion(x + delta) - funcion(x - delta)) / (2 * delta)
+    return derivada
+
+
+@instrumentado
+def Biseccion(a, b, epsilon, funcion, max_evaluaciones=None, metricas=None):
+    funcion = memoizar(funcion, metricas=metricas, max_evaluaciones=max_evaluaciones)
+    medio = (a + b) / 2
+    puntos_x, puntos_y = [], []
+
+    try:
+        derivada_medio = calcular_derivada(medio, epsilon, funcion)
+        metricas.ngev += 1
+        puntos_x.append(medio)
+        puntos_y.append(funcion(medio))
+
+        while abs(derivada_medio) > epsilon and a < medio < b:
+            if derivada_medio < 0:
+                a = medio
+            else:
+                b = medio
+
+            medio = (a + b) / 2
+            derivada_medio = calcular_derivada(medio, epsilon, funcion)
+            metricas.ngev += 1
+            metricas.iteraciones += 1
+            puntos_x.append(medio)
+            puntos_y.append(funcion(medio))
+    except PresupuestoAgotado as error:
+        warnings.warn(str(error), RuntimeWarning)
+
+    return medio, list(zip(puntos_x, puntos_y)), metricas
+
+
+@instrumentado
+def Secante(a, b, epsilon, funcion, delta=0.01, max_evaluaciones=None, metricas=None):
+    funcion = memoizar(funcion, metricas=metricas, max_evaluaciones=max_evaluaciones)
+    puntos_x, puntos_y = [], []
+
+    try:
+        fa = calcular_derivada(a, delta, funcion)
+        fb = calcular_derivada(b, delta, funcion)
+        metricas.ngev += 2
+
+        puntos_x += [a, b]
+        puntos_y += [funcion(a), funcion(b)]
+
+        while abs(b - a) > epsilon:
+            metricas.iteraciones += 1
+            if fb - fa == 0:
+                warnings.warn("División entre cero en método de la secante. Deteniendo.", RuntimeWarning)
+                break
+
+            x_new = b - fb * (b - a) / (fb - fa)
+
+            derivada_nueva = calcular_derivada(x_new, delta, funcion)
+            metricas.ngev += 1
+            if abs(derivada_nueva) < epsilon:
+                puntos_x.append(x_new)
+                puntos_y.append(funcion(x_new))
+                return x_new, list(zip(puntos_x, puntos_y)), metricas
+
+            a, b = b, x_new
+            fa = fb
+            fb = derivada_nueva
+
+            puntos_x.append(b)
+            puntos_y.append(funcion(b))
+    except PresupuestoAgotado as error:
+        warnings.warn(str(error), RuntimeWarning)
+
+    return b, list(zip(puntos_x, puntos_y)), metricas
+
+
+@instrumentado
+def busqueda_unidireccional(f, a, b, epsilon, max_evaluaciones=None, metricas=None):
+    _exigir_presupuesto(max_evaluaciones, 1, "busqueda_unidireccional")
+    f = memoizar(f, metricas=metricas)
+    # La última evaluación del presupuesto es f en el punto devuelto.
+    presupuesto = None if max_evaluaciones is None else max_evaluaciones - 1
+    x_opt, puntos, _ = _reducir(f, a, b, epsilon, "dorada", presupuesto, metricas)
+    return x_opt, f(x_opt), puntos, metricas
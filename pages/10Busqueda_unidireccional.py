@@ -34,6 +34,7 @@ A continuación, se muestra una implementación sencilla que ejemplifica cómo f
 
 import numpy as np
 import matplotlib.pyplot as plt
+from optimizacion.unidimensional import busqueda_unidireccional
 
 st.subheader("🧪 Ejemplo interactivo")
 
@@ -44,39 +45,23 @@ a = st.number_input("Límite inferior (a)", value=0.0)
 b = st.number_input("Límite superior (b)", value=5.0)
 epsilon = st.number_input("Precisión (ε)", value=0.01)
 
-def busqueda_unidireccional(f, a, b, epsilon):
-    puntos = []
-    while abs(b - a) > epsilon:
-        x1 = a + (b - a) / 3
-        x2 = b - (b - a) / 3
-        f1 = f(x1)
-        f2 = f(x2)
-        puntos.append((x1, f1))
-        puntos.append((x2, f2))
-
-        if f1 < f2:
-            b = x2
-        else:
-            a = x1
-
-    x_opt = (a + b) / 2
-    return x_opt, f(x_opt), puntos
-
 if st.button("▶️ Ejecutar búsqueda"):
-    x_opt, f_opt, puntos = busqueda_unidireccional(funcion, a, b, epsilon)
+    x_opt, f_opt, puntos, metricas = busqueda_unidireccional(funcion, a, b, epsilon)
     st.success(f"Mínimo aproximado: x = {x_opt:.4f}, f(x) = {f_opt:.4f}")
 
-    x_vals = np.linspace(a - 1, b + 1, 400)
-    y_vals = funcion(x_vals)
-    fig, ax = plt.subplots()
-    ax.plot(x_vals, y_vals, label='Función')
-    if puntos:
-        px, py = zip(*puntos)
-        ax.scatter(px, py, color='red', s=30, label='Puntos evaluados')
-    ax.axvline(x_opt, color='green', linestyle='--', label='Óptimo')
-    ax.set_title("Búsqueda unidireccional")
-    ax.set_xlabel("x")
-    ax.set_ylabel("f(x)")
-    ax.grid(True)
-    ax.legend()
-    st.pyplot(fig)
+    with metricas.medir("graficacion"):
+        x_vals = np.linspace(a - 1, b + 1, 400)
+        y_vals = funcion(x_vals)
+        fig, ax = plt.subplots()
+        ax.plot(x_vals, y_vals, label='Función')
+        if puntos:
+            px, py = zip(*puntos)
+            ax.scatter(px, py, color='red', s=30, label='Puntos evaluados')
+        ax.axvline(x_opt, color='green', linestyle='--', label='Óptimo')
+        ax.set_title("Búsqueda unidireccional")
+        ax.set_xlabel("x")
+        ax.set_ylabel("f(x)")
+        ax.grid(True)
+        ax.legend()
+        st.pyplot(fig)
+    st.json(metricas.como_dict())
@@ -1,6 +1,9 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+from optimizacion.funciones import FUNCIONES
+from optimizacion.cache_malla import malla_cacheada
+from optimizacion.directos import nelder_mead
 
 st.markdown("""
     <style>
@@ -11,26 +14,7 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-def rosenbrock(x: np.ndarray) -> float:
-    return np.sum(100*(x[1:] - x[:-1]**2)**2 + (1 - x[:-1])**2)
-
-def meshdata(x_min, x_max, y_min, y_max, function, n_puntos=200):
-    x_vals = np.linspace(x_min, x_max, n_puntos)
-    y_vals = np.linspace(y_min, y_max, n_puntos)
-    X, Y = np.meshgrid(x_vals, y_vals)
-    Z = np.array([function(np.array([x, y])) for x, y in zip(np.ravel(X), np.ravel(Y))])
-    Z = Z.reshape(X.shape)
-    return X, Y, Z
-
-def createSimplex(x0: np.ndarray, alpha: float, N: int):
-    delta1 = ((np.sqrt(N+1) + N - 1) / (N * np.sqrt(2))) * alpha
-    delta2 = ((np.sqrt(N+1) - 1) / (N * np.sqrt(2))) * alpha
-    xn = [np.array([x0[i] + delta1 if i == j else x0[i] + delta2 for i in range(N)]) for j in range(N)]
-    xn.insert(0, x0)
-    return np.array(xn)
-
-def terminar(fx, fc, N, epsilon=0.001):
-    return np.sqrt(np.sum(((fx - fc)**2)/(N+1))) < epsilon
+rosenbrock = FUNCIONES["Rosenbrock"].f
 
 def plotContourWithSimplex(X, Y, Z, simplex, nuevo_punto=None):
     fig, ax = plt.subplots()
@@ -83,41 +67,15 @@ with col2:
 max_iter = st.slider("Máximo de iteraciones", min_value=1, max_value=200, value=100)
 
 if st.button("Ejecutar Nelder-Mead"):
-    N = 2
-    x0 = np.array([x0_0, x0_1])
-    simplex = createSimplex(x0, alpha, N)
-    trayectoria = [simplex.copy()]
-    final = False
-    iteracion = 0
-
-    while not final and iteracion < max_iter:
-        fx = np.array([rosenbrock(x) for x in simplex])
-        indices = np.argsort(fx)
-        i_xl, i_xg, i_xh = indices[0], indices[-2], indices[-1]
-
-        xc = (np.sum(simplex, axis=0) - simplex[i_xh]) / N
-        xr = 2 * xc - simplex[i_xh]
-        fxr = rosenbrock(xr)
-        fxc = rosenbrock(xc)
-        xnew = xr
-
-        if fxr < fx[i_xl]:
-            xnew = (1 + gamma)*xc - gamma*simplex[i_xh]  
-        elif fxr >= fx[i_xh]:
-            xnew = (1 - beta)*xc + beta*simplex[i_xh]  
-        elif fx[i_xg] < fxr < fx[i_xh]:
-            xnew = (1 + beta)*xc - beta*simplex[i_xh] 
-
-        simplex[i_xh] = xnew
-        trayectoria.append(simplex.copy())
-        final = terminar(fx, fxc, N, epsilon)
-        iteracion += 1
-
-    X, Y, Z = meshdata(-2, 2, -1, 3, rosenbrock)
-    fig = plotContourWithSimplex(X, Y, Z, simplex)
-    st.pyplot(fig)
-
-    mejor = simplex[np.argmin([rosenbrock(x) for x in simplex])]
+    mejor, simplex, trayectoria, metricas = nelder_mead(rosenbrock, [x0_0, x0_1], alpha=alpha, gamma=gamma, beta=beta,
+                                                      epsilon=epsilon, max_iter=max_iter)
+
+    with metricas.medir("graficacion"):
+        X, Y, Z = malla_cacheada(-2, 2, -1, 3, rosenbrock)
+        fig = plotContourWithSimplex(X, Y, Z, simplex)
+        st.pyplot(fig)
+
     st.success(f"Punto mínimo encontrado: {np.round(mejor, 6)}")
     st.info(f"Valor de la función: {round(rosenbrock(mejor), 6)}")
-    st.write(f"Iteraciones realizadas: {iteracion}")
+    st.write(f"Iteraciones realizadas: {metricas.iteraciones}")
+    st.json(metricas.como_dict())
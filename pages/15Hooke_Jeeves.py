@@ -1,6 +1,9 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
+from optimizacion.funciones import FUNCIONES
+from optimizacion.cache_malla import malla_cacheada
+from optimizacion.directos import hooke_jeeves
 
 st.markdown("""
     <style>
@@ -10,50 +13,7 @@ st.markdown("""
     }
     </style>
 """, unsafe_allow_html=True)
-def booth(x: np.ndarray) -> float:
-    return (x[0] + 2*x[1] - 7)**2 + (2*x[0] + x[1] - 5)**2
-
-def meshdata(x_min, x_max, y_min, y_max, function, n_puntos=200):
-    x_vals = np.linspace(x_min, x_max, n_puntos)
-    y_vals = np.linspace(y_min, y_max, n_puntos)
-    X, Y = np.meshgrid(x_vals, y_vals)
-    Z = np.array([function(np.array([x, y])) for x, y in zip(np.ravel(X), np.ravel(Y))])
-    Z = Z.reshape(X.shape)
-    return X, Y, Z
-
-def movimiento_exploratorio(x, delta, funcion, N):
-    xc = np.array(x)
-    for i in range(N):
-        x_plus = np.array(x)
-        x_minus = np.array(x)
-        x_plus[i] = x[i] + delta[i]
-        x_minus[i] = x[i] - delta[i]
-        xs = [x_minus, x, x_plus]
-        fx = [funcion(x) for x in xs]
-        x = xs[np.argmin(fx)]
-    if np.allclose(x, xc):
-        return xc, False
-    return x, True
-
-def hooke_jeeves(funcion, x0, delta, epsilon=1e-5, alpha=2.0, N=2, max_iter=100):
-    x = np.array(x0)
-    historial = [x.copy()]
-    for _ in range(max_iter):
-        xn, mov = movimiento_exploratorio(x, delta, funcion, N)
-        if not mov:
-            delta = delta / 2.0
-            if np.all(delta < epsilon):
-                break
-        else:
-            xp = xn + alpha * (xn - x)
-            fxp = funcion(xp)
-            fx = funcion(x)
-            if fxp < fx:
-                x = xp
-            else:
-                x = xn
-        historial.append(x.copy())
-    return x, historial
+booth = FUNCIONES["Booth"].f
 
 def plotContourWithPath(X, Y, Z, path):
     fig, ax = plt.subplots()
@@ -107,12 +67,14 @@ max_iter = st.slider("Máximo de iteraciones", 10, 500, 100)
 if st.button("Ejecutar Hooke-Jeeves"):
     x0 = [x0_0, x0_1]
     delta = np.array([delta_0, delta_1])
-    X, Y, Z = meshdata(-10, 10, -10, 10, booth)
+    sol, path, metricas = hooke_jeeves(booth, x0, delta, epsilon=epsilon, alpha=alpha, N=2, max_iter=max_iter)
 
-    sol, path = hooke_jeeves(booth, x0, delta, epsilon=epsilon, alpha=alpha, N=2, max_iter=max_iter)
-    fig = plotContourWithPath(X, Y, Z, path)
+    with metricas.medir("graficacion"):
+        X, Y, Z = malla_cacheada(-10, 10, -10, 10, booth)
+        fig = plotContourWithPath(X, Y, Z, path)
 
-    st.pyplot(fig)
+        st.pyplot(fig)
 
     st.success(f"Punto mínimo encontrado: {np.round(sol, 6)}")
     st.info(f"Valor de la función en el mínimo: {round(booth(sol), 6)}")
+    st.json(metricas.como_dict())
@@ -1,7 +1,10 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-import math
+import warnings
+from optimizacion.funciones import FUNCIONES
+from optimizacion.gradiente import NewtonOptimizer
+from optimizacion.graficas import graficar_convergencia, graficar_trayectoria
+from optimizacion.metodos import punto_inicial
 st.markdown("""
     <style>
     body { background-color: #f9fafb; }
@@ -10,121 +13,6 @@ st.markdown("""
     }
     </style>
 """, unsafe_allow_html=True)
-def rastrigin(x):
-    A = 10
-    return A * len(x) + sum(xi**2 - A * np.cos(2 * np.pi * xi) for xi in x)
-
-def rosenbrock(x):
-    return sum(100 * (x[i+1] - x[i]**2)**2 + (1 - x[i])**2 for i in range(len(x) - 1))
-
-def ackley(x):
-    a, b, c = 20, 0.2, 2 * np.pi
-    d = len(x)
-    sum1 = sum(xi**2 for xi in x)
-    sum2 = sum(np.cos(c * xi) for xi in x)
-    return -a * np.exp(-b * np.sqrt(sum1 / d)) - np.exp(sum2 / d) + a + np.exp(1)
-
-def sphere(x):
-    return sum(xi**2 for xi in x)
-
-def beale(x):
-    x1, x2 = x[0], x[1]
-    return ((1.5 - x1 + x1*x2)**2 +
-            (2.25 - x1 + x1*x2**2)**2 +
-            (2.625 - x1 + x1*x2**3)**2)
-
-def booth(x):
-    x1, x2 = x[0], x[1]
-    return (x1 + 2*x2 - 7)**2 + (2*x1 + x2 - 5)**2
-
-def himmelblau(x):
-    x1, x2 = x[0], x[1]
-    return (x1**2 + x2 - 11)**2 + (x1 + x2**2 - 7)**2
-
-def mccormick(x):
-    x1, x2 = x[0], x[1]
-    return np.sin(x1 + x2) + (x1 - x2)**2 - 1.5 * x1 + 2.5 * x2 + 1
-
-funciones = {
-    "Rastrigin": rastrigin,
-    "Rosenbrock": rosenbrock,
-    "Ackley": ackley,
-    "Sphere": sphere,
-    "Beale": beale,
-    "Booth": booth,
-    "Himmelblau": himmelblau,
-    "McCormick": mccormick
-}
-
-class Optimizador:
-    def __init__(self, funcion, epsilon1=1e-3, epsilon2=1e-3, max_iter=100):
-        self.funcion = funcion
-        self.epsilon1 = epsilon1
-        self.epsilon2 = epsilon2
-        self.max_iter = max_iter
-        self.ruta = []
-
-    def gradiente(self, x, h=1e-6):
-        grad = np.zeros_like(x)
-        for i in range(len(x)):
-            x_plus = x.copy()
-            x_minus = x.copy()
-            x_plus[i] += h
-            x_minus[i] -= h
-            grad[i] = (self.funcion(x_plus) - self.funcion(x_minus)) / (2 * h)
-        return grad
-
-    def hessiano(self, x, delta=1e-5):
-        fx = self.funcion(x)
-        N = len(x)
-        H = np.zeros((N, N))
-        for i in range(N):
-            for j in range(N):
-                if i == j:
-                    xp = x.copy()
-                    xnn = x.copy()
-                    xp[i] += delta
-                    xnn[i] -= delta
-                    H[i, j] = (self.funcion(xp) - 2 * fx + self.funcion(xnn)) / (delta**2)
-                else:
-                    xpp = x.copy(); xpn = x.copy()
-                    xnp = x.copy(); xnn = x.copy()
-                    xpp[i] += delta; xpp[j] += delta
-                    xpn[i] += delta; xpn[j] -= delta
-                    xnp[i] -= delta; xnp[j] += delta
-                    xnn[i] -= delta; xnn[j] -= delta
-                    H[i, j] = (self.funcion(xpp) - self.funcion(xpn) - self.funcion(xnp) + self.funcion(xnn)) / (4 * delta**2)
-        return H
-
-class NewtonOptimizer(Optimizador):
-    def optimizar(self, x_inicial):
-        xk = x_inicial
-        k = 0
-        self.ruta.append(xk.copy())
-
-        while True:
-            grad = self.gradiente(xk)
-            hess = self.hessiano(xk)
-
-            if np.linalg.norm(grad) < self.epsilon1 or k > self.max_iter:
-                break
-
-            try:
-                hess_inv = np.linalg.inv(hess)
-                xk1 = xk - hess_inv @ grad
-            except np.linalg.LinAlgError:
-                st.warning("⚠️ Hessiano no invertible. Se usó paso pequeño en dirección del gradiente.")
-                xk1 = xk - 0.01 * grad
-
-            if np.linalg.norm(xk1 - xk) / (np.linalg.norm(xk) + 1e-10) < self.epsilon2:
-                break
-
-            xk = xk1
-            self.ruta.append(xk.copy())
-            k += 1
-
-        return xk
-
 st.title("🔎 Método de Newton")
 
 st.markdown(r"""
@@ -139,45 +27,70 @@ $$
 
 Al aprovechar la curvatura de la función (segunda derivada), el método puede converger en pocas iteraciones si el punto inicial está cerca del mínimo.  
 Sin embargo, requiere que la función sea dos veces diferenciable y que la segunda derivada no sea cero.
+
+En varias dimensiones el paso resuelve $H\,p = -\nabla f$ con una factorización de Cholesky. Si el hessiano no es
+definido positivo (por ejemplo, cerca de un punto silla) se factoriza $H + \tau I$, lo que garantiza una dirección
+de descenso. La factorización puede reutilizarse varias iteraciones antes de recalcular el hessiano.
 """)
 
 
 
-funcion_nombre = st.selectbox("Selecciona la función objetivo", list(funciones.keys()))
-funcion_obj = funciones[funcion_nombre]
+funcion_nombre = st.selectbox("Selecciona la función objetivo", list(FUNCIONES.keys()))
+prueba = FUNCIONES[funcion_nombre]
+funcion_obj = prueba.f
 
 col1, col2 = st.columns(2)
 with col1:
     epsilon1 = st.number_input("Tolerancia gradiente (ε₁)", 1e-6, 1e-1, value=0.001, format="%.6f")
     max_iter = st.number_input("Máx. iteraciones", 10, 1000, value=100)
+    dimension = prueba.dimension or st.number_input("Dimensión", 2, 500, value=2)
 with col2:
     epsilon2 = st.number_input("Tolerancia cambio relativo (ε₂)", 1e-6, 1e-1, value=0.001, format="%.6f")
-
-if "x0" not in st.session_state:
-    st.session_state.x0 = float(np.random.uniform(-5, 5))
-if "x1" not in st.session_state:
-    st.session_state.x1 = float(np.random.uniform(-5, 5))
+    refresco = st.number_input("Reusar la factorización del hessiano (iteraciones)", 1, 50, value=1)
 
 st.markdown("### Punto inicial")
-x0 = st.number_input("x₀", value=st.session_state.x0, key="x0_input")
-x1 = st.number_input("x₁", value=st.session_state.x1, key="x1_input")
-
-if st.button("▶️ Ejecutar Newton"):
+error_punto = None
+if dimension == 2:
+    if "x0" not in st.session_state:
+        st.session_state.x0 = float(np.random.uniform(-5, 5))
+    if "x1" not in st.session_state:
+        st.session_state.x1 = float(np.random.uniform(-5, 5))
+    x0 = st.number_input("x₀", value=st.session_state.x0, key="x0_input")
+    x1 = st.number_input("x₁", value=st.session_state.x1, key="x1_input")
     x_inicial = np.array([x0, x1])
-    opt = NewtonOptimizer(funcion_obj, epsilon1=epsilon1, epsilon2=epsilon2, max_iter=max_iter)
-    resultado = opt.optimizar(x_inicial)
-
-    st.success(f"📌 Mínimo encontrado en: {np.round(resultado, 6)}")
-    st.info(f"Valor de la función: {funcion_obj(resultado):.6f}")
+else:
+    if st.session_state.get("dimension") != dimension:
+        st.session_state.dimension = dimension
+        st.session_state.punto = punto_inicial(prueba, dimension)
+    texto = st.text_input("Coordenadas separadas por comas",
+                          ", ".join(f"{v:.4f}" for v in st.session_state.punto))
+    try:
+        x_inicial = np.array([float(v) for v in texto.split(",")])
+    except ValueError:
+        error_punto = "❌ Las coordenadas deben ser números separados por comas, p. ej. 1.5, -2, 0.3."
+    else:
+        if len(x_inicial) != dimension:
+            error_punto = f"❌ Se esperaban {dimension} coordenadas y se dieron {len(x_inicial)}."
+        elif not np.all(np.isfinite(x_inicial)):
+            error_punto = "❌ Las coordenadas deben ser finitas."
 
-    puntos = np.array(opt.ruta)
-    fig, ax = plt.subplots(figsize=(6, 5))
-    ax.plot(puntos[:, 0], puntos[:, 1], marker='o', linestyle='-', markersize=3, color='blue', label='Recorrido')
-    ax.scatter(puntos[0, 0], puntos[0, 1], color='green', s=60, label='Inicio')
-    ax.scatter(puntos[-1, 0], puntos[-1, 1], color='red', s=60, label='Fin')
-    ax.set_title(f"Trayectoria - {funcion_nombre}")
-    ax.set_xlabel("x₀")
-    ax.set_ylabel("x₁")
-    ax.grid(True)
-    ax.legend()
-    st.pyplot(fig)
+if st.button("▶️ Ejecutar Newton"):
+    if error_punto:
+        st.error(error_punto)
+    else:
+        opt = NewtonOptimizer(funcion_obj, epsilon1=epsilon1, epsilon2=epsilon2, max_iter=max_iter, refresco=refresco)
+        with warnings.catch_warnings(record=True) as avisos:
+            warnings.simplefilter("always")
+            resultado, _, metricas = opt.optimizar(x_inicial)
+        for aviso in avisos:
+            st.warning(f"⚠️ {aviso.message}")
+
+        st.success(f"📌 Mínimo encontrado en: {np.round(resultado, 6)}")
+        st.info(f"Valor de la función: {funcion_obj(resultado):.6f}")
+
+        with metricas.medir("graficacion"):
+            if len(x_inicial) == 2:
+                st.pyplot(graficar_trayectoria(funcion_obj, opt.ruta, f"Trayectoria - {funcion_nombre}", etiqueta='Recorrido'))
+            else:
+                st.pyplot(graficar_convergencia(funcion_obj, opt.ruta, f"Convergencia - {funcion_nombre} ({dimension}D)"))
+        st.json(metricas.como_dict())
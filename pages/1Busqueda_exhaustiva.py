@@ -1,39 +1,8 @@
 import streamlit as st
-import math
 import numpy as np
 import matplotlib.pyplot as plt
-
-def lata(r: float) -> float:
-    return 2 * math.pi * r * r + (500 / r)
-
-def caja(l: float) -> float:
-    return -(4 * pow(l, 3) - 60 * l * l + 200 * l)
-
-def funcion_0(x: float) -> float:
-    return x**2 + (54/x)
-
-def funcion_1(x: float) -> float:
-    return x**3 + 2*x - 3
-
-def funcion_2(x: float) -> float:
-    return x**4 + x**2 - 33
-
-def funcion_3(x: float) -> float:
-    return 3*x**4 - 8*x**3 - 6*x**2 + 12*x
-
-
-def busqueda_exhaustiva(a: float, b: float, n: int, funcion: callable) -> tuple[float, float]:
-    delta_x = (b - a) / n
-    x1 = a
-    x2 = x1 + delta_x
-    x3 = x2 + delta_x
-
-    while not (funcion(x1) >= funcion(x2) <= funcion(x3)) and x3 <= b:
-        x1 = x2
-        x2 = x3
-        x3 = x2 + delta_x
-
-    return (x1, x3)
+from optimizacion.funciones import lata, caja, funcion_0, funcion_1, funcion_2, funcion_3
+from optimizacion.unidimensional import busqueda_exhaustiva, minimos_locales
 
 
 st.markdown("""
@@ -80,10 +49,13 @@ funciones = {
 
 opcion_funcion = st.selectbox("📌 Elige la función a evaluar", list(funciones.keys()))
 funcion = funciones[opcion_funcion]
+modo = st.selectbox("🧭 Modo", ["Primer mínimo local", "Todos los mínimos locales"])
 
 a = st.number_input("🔽 Límite inferior", value=0.0)
 b = st.number_input("🔼 Límite superior", value=5.0)
-n = st.slider("📊 Número de particiones", min_value=10, max_value=500, value=100, step=10)
+n = st.number_input("📊 Número de particiones", min_value=10, max_value=10_000_000, value=100, step=10)
+epsilon = st.number_input("🔬 Precisión del refinamiento (ε); 0 evalúa una sola malla", min_value=0.0, max_value=1.0,
+                          value=0.0, step=1e-6, format="%.8f")
 
 if st.button("🚀 Ejecutar Búsqueda Exhaustiva"):
 
@@ -91,26 +63,41 @@ if st.button("🚀 Ejecutar Búsqueda Exhaustiva"):
         st.error("❌ El límite inferior debe ser mayor que 0 para esta función (evita división por cero).")
     else:
         try:
-            intervalo = busqueda_exhaustiva(a, b, n, funcion)
-            x_min = (intervalo[0] + intervalo[1]) / 2
-            y_min = funcion(x_min)
-
-            st.success(f"✅ Intervalo encontrado: {intervalo}")
-            st.info(f"📍 Aproximación del mínimo local:\n\n**x = {x_min:.4f}**, **f(x) = {y_min:.4f}**")
-
-            x_vals = np.linspace(a, b, 1000)
-            y_vals = [funcion(x) for x in x_vals]
-
-            fig, ax = plt.subplots()
-            ax.plot(x_vals, y_vals, label="Función", color='blue')
-            ax.plot(x_min, y_min, marker='o', markersize=8, color='red', label="Mínimo estimado")
-            ax.set_title("Visualización de la función")
-            ax.set_xlabel("x")
-            ax.set_ylabel("f(x)")
-            ax.legend()
-            ax.grid(True)
-
-            st.pyplot(fig)
+            if modo == "Todos los mínimos locales":
+                minimos, intervalos, metricas = minimos_locales(funcion, a, b, n=int(n), epsilon=epsilon or 1e-6)
+                if minimos:
+                    st.success(f"✅ {len(minimos)} mínimo(s) local(es) en [{a}, {b}]")
+                    st.table([{"x": x, "f(x)": valor, "intervalo": f"[{i:.6f}, {j:.6f}]"}
+                              for (x, valor), (i, j) in zip(minimos, intervalos)])
+                else:
+                    st.warning("⚠️ No se encontró ningún mínimo local en la malla.")
+            else:
+                intervalo, metricas = busqueda_exhaustiva(a, b, int(n), funcion, epsilon=epsilon or None)
+                x_min = (intervalo[0] + intervalo[1]) / 2
+                minimos = [(x_min, funcion(x_min))]
+                efectivas = int(n) * (int(n) / 2) ** (metricas.iteraciones - 1)
+
+                st.success(f"✅ Intervalo encontrado: {intervalo}")
+                st.write(f"Niveles de refinamiento: {metricas.iteraciones} "
+                         f"(equivale a una malla de {efectivas:.3g} particiones con {metricas.nfev} evaluaciones)")
+                st.info(f"📍 Aproximación del mínimo local:\n\n**x = {x_min:.4f}**, **f(x) = {minimos[0][1]:.4f}**")
+
+            with metricas.medir("graficacion"):
+                x_vals = np.linspace(a, b, 1000)
+                y_vals = [funcion(x) for x in x_vals]
+
+                fig, ax = plt.subplots()
+                ax.plot(x_vals, y_vals, label="Función", color='blue')
+                ax.plot([x for x, _ in minimos], [valor for _, valor in minimos], 'o', markersize=8, color='red',
+                        label="Mínimo estimado")
+                ax.set_title("Visualización de la función")
+                ax.set_xlabel("x")
+                ax.set_ylabel("f(x)")
+                ax.legend()
+                ax.grid(True)
+
+                st.pyplot(fig)
+            st.json(metricas.como_dict())
 
         except Exception as e:
             st.error(f"⚠️ Ocurrió un error: {e}")
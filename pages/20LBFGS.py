@@ -0,0 +1,81 @@
+import streamlit as st
+import numpy as np
+from optimizacion.funciones import FUNCIONES
+from optimizacion.gradiente import LBFGSOptimizer
+from optimizacion.graficas import graficar_convergencia, graficar_trayectoria
+from optimizacion.metodos import punto_inicial
+st.markdown("""
+    <style>
+    body { background-color: #f9fafb; }
+    .stApp {
+        background: linear-gradient(to bottom, #d9e7f8, #ffffff);
+    }
+    </style>
+""", unsafe_allow_html=True)
+st.title("🪶 Método L-BFGS")
+
+st.markdown(r"""
+**L-BFGS** es la versión de **memoria limitada** de BFGS. En lugar de guardar una matriz de $N \times N$, conserva
+solo los últimos $m$ pares $(s_k, y_k)$ y calcula la dirección $d_k = -H_k \nabla f(x_k)$ con la recursión de dos
+ciclos, en $O(mN)$ operaciones.
+
+Por eso sirve para problemas con cientos o miles de variables, donde guardar o evaluar el hessiano no es viable.
+Como BFGS, usa una búsqueda de línea de **Wolfe** para elegir el tamaño del paso. Valores típicos de $m$ están
+entre 3 y 20.
+""")
+
+funcion_nombre = st.selectbox("Selecciona la función objetivo", list(FUNCIONES.keys()))
+prueba = FUNCIONES[funcion_nombre]
+funcion_obj = prueba.f
+
+col1, col2 = st.columns(2)
+with col1:
+    epsilon1 = st.number_input("Tolerancia gradiente (ε₁)", 1e-8, 1e-1, value=0.001, format="%.8f")
+    max_iter = st.number_input("Máx. iteraciones", 10, 20000, value=1000)
+    dimension = prueba.dimension or st.number_input("Dimensión", 2, 5000, value=2)
+with col2:
+    epsilon2 = st.number_input("Tolerancia cambio relativo (ε₂)", 1e-12, 1e-1, value=0.001, format="%.2e")
+    memoria = st.number_input("Pares guardados (m)", 1, 100, value=10)
+
+st.markdown("### Punto inicial")
+error_punto = None
+if dimension == 2:
+    if "x0" not in st.session_state:
+        st.session_state.x0 = float(np.random.uniform(-5, 5))
+    if "x1" not in st.session_state:
+        st.session_state.x1 = float(np.random.uniform(-5, 5))
+    x0 = st.number_input("x₀", value=st.session_state.x0, key="x0_input")
+    x1 = st.number_input("x₁", value=st.session_state.x1, key="x1_input")
+    x_inicial = np.array([x0, x1])
+else:
+    if st.session_state.get("dimension") != dimension:
+        st.session_state.dimension = dimension
+        st.session_state.punto = punto_inicial(prueba, dimension)
+    texto = st.text_input("Coordenadas separadas por comas",
+                          ", ".join(f"{v:.4f}" for v in st.session_state.punto))
+    try:
+        x_inicial = np.array([float(v) for v in texto.split(",")])
+    except ValueError:
+        error_punto = "❌ Las coordenadas deben ser números separados por comas, p. ej. 1.5, -2, 0.3."
+    else:
+        if len(x_inicial) != dimension:
+            error_punto = f"❌ Se esperaban {dimension} coordenadas y se dieron {len(x_inicial)}."
+        elif not np.all(np.isfinite(x_inicial)):
+            error_punto = "❌ Las coordenadas deben ser finitas."
+
+if st.button("▶️ Ejecutar L-BFGS"):
+    if error_punto:
+        st.error(error_punto)
+    else:
+        opt = LBFGSOptimizer(funcion_obj, epsilon1=epsilon1, epsilon2=epsilon2, max_iter=max_iter, memoria=memoria)
+        resultado, ruta, metricas = opt.optimizar(x_inicial)
+
+        st.success(f"📌 Mínimo encontrado en: {np.round(resultado, 6)}")
+        st.info(f"Valor de la función: {funcion_obj(resultado):.6f}")
+
+        with metricas.medir("graficacion"):
+            if len(x_inicial) == 2:
+                st.pyplot(graficar_trayectoria(funcion_obj, ruta, f"Trayectoria - {funcion_nombre}", etiqueta='Recorrido'))
+            else:
+                st.pyplot(graficar_convergencia(funcion_obj, ruta, f"Convergencia - {funcion_nombre} ({dimension}D)"))
+        st.json(metricas.como_dict())
@@ -0,0 +1,50 @@
+import streamlit as st
+from optimizacion.funciones import lata, caja, funcion_0, funcion_1, funcion_2, funcion_3
+from optimizacion.graficas import graficar_funcion_1d
+from optimizacion.unidimensional import brent, golden_section_search
+
+
+st.set_page_config(page_title="🪄 Brent", layout="centered")
+
+
+st.markdown("""
+    <style>
+    body { background-color: #f9fafb; }
+    .stApp {
+        background: linear-gradient(to bottom, #d9e7f8, #ffffff);
+    }
+    </style>
+""", unsafe_allow_html=True)
+st.title("🪄 Método de Brent")
+
+functions = {
+    'Lata': (lata, 0.1, 10),
+    'Caja': (caja, 2, 3),
+    'Función 1 (x² + 54/x)': (funcion_0, 0.1, 10),
+    'Función 2 (x³ + 2x - 3)': (funcion_1, 0, 5),
+    'Función 3 (x⁴ + x² - 33)': (funcion_2, -2.5, 2.5),
+    'Función 4 (3x⁴ - 8x³ - 6x² + 12x)': (funcion_3, -1.5, 3)
+}
+
+funcion_nombre = st.selectbox("📌 Selecciona la función", list(functions.keys()))
+funcion, default_a, default_b = functions[funcion_nombre]
+
+a = st.number_input("🔽 Límite inferior (a)", value=float(default_a))
+b = st.number_input("🔼 Límite superior (b)", value=float(default_b))
+
+epsilon = st.number_input("⚠️ Precisión (ε)", min_value=0.0001, max_value=1.0, value=0.01, step=0.0001, format="%.4f")
+
+if st.button("▶️ Ejecutar Búsqueda"):
+    if funcion_nombre == 'Función 1 (x² + 54/x)' and (a <= 0 <= b):
+        st.error("❌ El intervalo no puede incluir x=0 para esta función (división por cero).")
+    else:
+        minimo, points, intervalos, metricas = brent(funcion, a, b, epsilon)
+        *_, metricas_dorada = golden_section_search(a, b, epsilon, funcion)
+        st.success(f"✅ Mínimo aproximado en x = {minimo:.6f}")
+        st.write(f"Último intervalo evaluado: {intervalos[-1]}")
+        st.write(f"Evaluaciones de la función: {metricas.nfev} (sección dorada con el mismo ε: {metricas_dorada.nfev})")
+
+        with metricas.medir("graficacion"):
+            fig = graficar_funcion_1d(funcion, a, b, points, f"{funcion_nombre} (ε={epsilon})")
+            st.pyplot(fig)
+        st.json(metricas.como_dict())
@@ -1,71 +1,7 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import math
-
-
-def interval_halving_method(func, a, b, epsilon):
-    points = []
-    intervalos = []   
-    while (b - a) > epsilon:
-        xm = (a + b) / 2
-        L = b - a
-        x1 = a + L / 4
-        x2 = b - L / 4
-        f_xm = func(xm)
-        f_x1 = func(x1)
-        f_x2 = func(x2)
-        
-        points.append((x1, f_x1))
-        points.append((x2, f_x2))
-        intervalos.append((a, b))
-        
-        if f_x1 < f_xm:
-            b = xm
-            xm = x1
-        elif f_x2 < f_xm:
-            a = xm
-            xm = x2
-        else:
-            a, b = x1, x2
-        
-    return (a + b) / 2, points, intervalos
-
-def plot_function_with_points(func, a, b, points, title):
-    x = np.linspace(a, b, 1000)
-    y = [func(xi) for xi in x]
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(x, y, label='Función', color='blue')
-    
-    if points:
-        x_points, y_points = zip(*points)
-        ax.scatter(x_points, y_points, color='red', label='Puntos visitados')
-    
-    ax.set_title(title)
-    ax.set_xlabel('x')
-    ax.set_ylabel('f(x)')
-    ax.legend()
-    ax.grid(True)
-    return fig
-
-def lata(r):
-    return 2 * math.pi * r * r + (500 / r)
-
-def caja(l):
-    return -(4 * l**3 - 60 * l**2 + 200 * l)
-
-def funcion_0(x):
-    return float('inf') if x == 0 else x**2 + (54/x)
-
-def funcion_1(x):
-    return x**3 + 2*x - 3
-
-def funcion_2(x):
-    return x**4 + x**2 - 33
-
-def funcion_3(x):
-    return 3*x**4 - 8*x**3 - 6*x**2 + 12*x
+from optimizacion.funciones import lata, caja, funcion_0, funcion_1, funcion_2, funcion_3
+from optimizacion.graficas import graficar_funcion_1d
+from optimizacion.unidimensional import interval_halving_method
 
 
 st.set_page_config(page_title="🔍 Método de Interval Halving", layout="centered")
@@ -103,9 +39,11 @@ if st.button("🚀 Ejecutar Método"):
     if opcion_funcion == 'Función 1 (x² + 54/x)' and (a <= 0 <= b):
         st.error("❌ El intervalo no puede incluir x=0 para esta función debido a división por cero.")
     else:
-        minimo, points, intervalos = interval_halving_method(funcion, a, b, epsilon)
+        minimo, points, intervalos, metricas = interval_halving_method(funcion, a, b, epsilon)
         st.success(f"✅ Mínimo aproximado en x = {minimo:.6f}")
         st.write(f"Último intervalo evaluado: {intervalos[-1]}")
         
-        fig = plot_function_with_points(funcion, a, b, points, f'{opcion_funcion} (ε={epsilon})')
-        st.pyplot(fig)
+        with metricas.medir("graficacion"):
+            fig = graficar_funcion_1d(funcion, a, b, points, f'{opcion_funcion} (ε={epsilon})', etiqueta='Puntos visitados')
+            st.pyplot(fig)
+        st.json(metricas.como_dict())
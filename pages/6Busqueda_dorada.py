@@ -1,72 +1,7 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import math
-
-
-def lata(r):
-    return 2 * math.pi * r * r + (500 / r)
-
-def caja(l):
-    return -(4 * l**3 - 60 * l**2 + 200 * l)
-
-def funcion_0(x):
-    return float('inf') if x == 0 else x**2 + (54/x)
-
-def funcion_1(x):
-    return x**3 + 2*x - 3
-
-def funcion_2(x):
-    return x**4 + x**2 - 33
-
-def funcion_3(x):
-    return 3*x**4 - 8*x**3 - 6*x**2 + 12*x
-
-def golden_section_search(a: float, b: float, epsilon: float, func: callable):
-    phi = (1 + np.sqrt(5)) / 2 
-    resphi = 2 - phi            
-
-    c = a + resphi * (b - a)
-    d = b - resphi * (b - a)
-    fc = func(c)
-    fd = func(d)
-    
-    points = [(c, fc), (d, fd)]  
-    min_intervalo = (a, b)
-
-    while abs(b - a) > epsilon:
-        if fc < fd:
-            b, d, fd = d, c, fc
-            c = a + resphi * (b - a)
-            fc = func(c)
-        else:
-            a, c, fc = c, d, fd
-            d = b - resphi * (b - a)
-            fd = func(d)
-        
-        points.append((c, fc))
-        points.append((d, fd))
-        min_intervalo = (a, b)
-
-    return (a + b) / 2, points, min_intervalo
-
-def plot_function_with_points(func, a, b, points, title):
-    x = np.linspace(a, b, 1000)
-    y = [func(xi) for xi in x]
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(x, y, label='Función', color='black')
-    
-    if points:
-        x_points, y_points = zip(*points)
-        ax.scatter(x_points, y_points, color='red', label='Puntos evaluados')
-
-    ax.set_title(title)
-    ax.set_xlabel('x')
-    ax.set_ylabel('f(x)')
-    ax.legend()
-    ax.grid(True)
-    return fig
+from optimizacion.funciones import lata, caja, funcion_0, funcion_1, funcion_2, funcion_3
+from optimizacion.graficas import graficar_funcion_1d
+from optimizacion.unidimensional import golden_section_search
 
 
 st.set_page_config(page_title="🔆 Golden Section Search", layout="centered")
@@ -98,14 +33,20 @@ a = st.number_input("🔽 Límite inferior (a)", value=float(default_a))
 b = st.number_input("🔼 Límite superior (b)", value=float(default_b))
 
 epsilon = st.number_input("⚠️ Precisión (ε)", min_value=0.0001, max_value=1.0, value=0.01, step=0.0001, format="%.4f")
+presupuesto = st.number_input("🎯 Presupuesto de evaluaciones (0 = sin límite; si se da, ignora ε)", min_value=0,
+                              max_value=10_000, value=0, step=1)
 
 if st.button("▶️ Ejecutar Búsqueda"):
     if funcion_nombre == 'Función 1 (x² + 54/x)' and (a <= 0 <= b):
         st.error("❌ El intervalo no puede incluir x=0 para esta función (división por cero).")
     else:
-        minimo, points, min_intervalo = golden_section_search(a, b, epsilon, funcion)
+        minimo, points, min_intervalo, metricas = golden_section_search(a, b, None if presupuesto else epsilon, funcion,
+                                                                        max_evaluaciones=presupuesto or None)
         st.success(f"✅ Mínimo aproximado en x = {minimo:.6f}")
         st.write(f"Último intervalo evaluado: {min_intervalo}")
+        st.write(f"Evaluaciones usadas: {metricas.nfev}")
         
-        fig = plot_function_with_points(funcion, a, b, points, f"{funcion_nombre} (ε={epsilon})")
-        st.pyplot(fig)
+        with metricas.medir("graficacion"):
+            fig = graficar_funcion_1d(funcion, a, b, points, f"{funcion_nombre} (ε={epsilon})")
+            st.pyplot(fig)
+        st.json(metricas.como_dict())
@@ -1,7 +1,8 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import math
+import warnings
+from optimizacion.funciones import lata, caja, funcion_0, funcion_1, funcion_2, funcion_3
+from optimizacion.graficas import graficar_funcion_1d
+from optimizacion.unidimensional import metodo_newton_raphson
 
 st.markdown("""
     <style>
@@ -13,59 +14,6 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def metodo_newton_raphson(f, x0, epsilon, delta=1e-5, max_iter=100, a=None, b=None):
-    puntos = []
-    x = x0
-
-    for _ in range(max_iter):
-        fx = f(x)
-        derivada = (f(x + delta) - f(x)) / delta
-        puntos.append((x, fx))
-
-        if abs(derivada) < 1e-10:
-            st.warning("Derivada muy pequeña. Método detenido.")
-            break
-
-        x_nuevo = x - fx / derivada
-
-        if a is not None:
-            x_nuevo = max(a, x_nuevo)
-        if b is not None:
-            x_nuevo = min(b, x_nuevo)
-
-        if abs(x_nuevo - x) < epsilon or abs(f(x_nuevo)) < epsilon:
-            x = x_nuevo
-            puntos.append((x, f(x)))
-            break
-
-        x = x_nuevo
-
-    return x, puntos
-
-def plot_function_with_points(func, a, b, points, title):
-    x = np.linspace(a, b, 1000)
-    y = [func(xi) for xi in x]
-
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(x, y, label='Función', color='black')
-    if points:
-        x_points, y_points = zip(*points)
-        ax.scatter(x_points, y_points, color='red', label='Puntos Visitados')
-    ax.set_title(title)
-    ax.set_xlabel('x')
-    ax.set_ylabel('f(x)')
-    ax.legend()
-    ax.grid(True)
-    return fig
-
-
-def lata(r): return 2 * math.pi * r * r + (500 / r)
-def caja(l): return -(4 * l**3 - 60 * l**2 + 200 * l)
-def funcion_0(x): return float('inf') if x == 0 else x**2 + (54/x)
-def funcion_1(x): return x**3 + 2*x - 3
-def funcion_2(x): return x**4 + x**2 - 33
-def funcion_3(x): return 3*x**4 - 8*x**3 - 6*x**2 + 12*x
-
 functions = {
     'Lata': (lata, 1, 0.1, 10),
     'Caja': (caja, 2, 2, 3),
@@ -92,8 +40,14 @@ if st.button("▶️ Ejecutar Newton-Raphson"):
     if funcion_nombre == 'Función 1 (x^2 + 54/x)' and (a <= 0 <= b):
         st.error("❌ El intervalo no puede incluir x=0 para esta función (división por cero).")
     else:
-        minimo, points = metodo_newton_raphson(funcion, x0, epsilon, delta=delta, a=a, b=b)
+        with warnings.catch_warnings(record=True) as avisos:
+            warnings.simplefilter("always")
+            minimo, points, metricas = metodo_newton_raphson(funcion, x0, epsilon, delta=delta, a=a, b=b)
+        for aviso in avisos:
+            st.warning(str(aviso.message))
         st.success(f"Mínimo aproximado en x = {minimo:.6f}, f(x) = {funcion(minimo):.6f}")
 
-        fig = plot_function_with_points(funcion, a, b, points, f"{funcion_nombre} (ε={epsilon})")
-        st.pyplot(fig)
+        with metricas.medir("graficacion"):
+            fig = graficar_funcion_1d(funcion, a, b, points, f"{funcion_nombre} (ε={epsilon})", etiqueta='Puntos Visitados')
+            st.pyplot(fig)
+        st.json(metricas.como_dict())
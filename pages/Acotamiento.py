@@ -1,53 +1,12 @@
 import math
+import warnings
 import numpy as np
 import matplotlib.pyplot as plt
 import streamlit as st
+from optimizacion.funciones import lata, caja, funcion_00, funcion_0, funcion_1, funcion_2, funcion_3
+from optimizacion.unidimensional import fase_acotamiento
 
 
-def funcion_00(x: float) -> float:
-    return x**2 + 3
-
-def lata(r: float) -> float:
-    return 2 * math.pi * r * r + (500 / r)
-
-def caja(l: float) -> float:
-    return -(4 * pow(l, 3) - 60 * l * l + 200 * l)
-
-def funcion_0(x: float) -> float:
-    return float('inf') if x == 0 else x**2 + (54 / x)
-
-def funcion_1(x: float) -> float:
-    return x**3 + 2 * x - 3
-
-def funcion_2(x: float) -> float:
-    return x**4 + x**2 - 33
-
-def funcion_3(x: float) -> float:
-    return 3 * x**4 - 8 * x**3 - 6 * x**2 + 12 * x
-
-
-def fase_acotamiento(x0, delta, lambda_, funcion, max_iter=1000, max_x=1e6):
-    x1 = x0
-    x2 = x1 + delta if funcion(x1 + delta) < funcion(x1) else x1 - delta
-    k = 1
-
-    valores_x = [x1, x2]
-    valores_y = [funcion(x1), funcion(x2)]
-
-    while funcion(x2) < funcion(x1):
-        if abs(x2) > max_x or k > max_iter:
-            st.warning("Se alcanzó el límite de iteraciones o crecimiento.")
-            break
-
-        x1 = x2
-        delta *= lambda_
-        x2 = x1 + delta if x2 > x0 else x1 - delta
-        valores_x.append(x2)
-        valores_y.append(funcion(x2))
-        k += 1
-
-    return min(x1, x2), max(x1, x2)
-
 def main():
     st.title("Fase de acotamiento 🤖")
     st.markdown("""
@@ -88,18 +47,24 @@ def main():
     lambda_ = st.number_input("Lambda (λ)", value=2.0, min_value=1.01)
 
     if st.button("Ejecutar fase de acotamiento") and funcion_seleccionada:
-        intervalo = fase_acotamiento(x0, delta, lambda_, funcion_seleccionada)
+        with warnings.catch_warnings(record=True) as avisos:
+            warnings.simplefilter("always")
+            intervalo, _, metricas = fase_acotamiento(x0, delta, lambda_, funcion_seleccionada)
+        for aviso in avisos:
+            st.warning(str(aviso.message))
         st.success(f"Intervalo encontrado: [{intervalo[0]:.4f}, {intervalo[1]:.4f}]")
 
-        x_vals = np.linspace(intervalo[0], intervalo[1], 100)
-        y_vals = [funcion_seleccionada(x) for x in x_vals]
-        fig, ax = plt.subplots()
-        ax.plot(x_vals, y_vals, label="f(x)")
-        ax.set_xlabel("x")
-        ax.set_ylabel("f(x)")
-        ax.set_title("Evaluación de la función en el intervalo acotado")
-        ax.grid(True)
-        st.pyplot(fig)
+        with metricas.medir("graficacion"):
+            x_vals = np.linspace(intervalo[0], intervalo[1], 100)
+            y_vals = [funcion_seleccionada(x) for x in x_vals]
+            fig, ax = plt.subplots()
+            ax.plot(x_vals, y_vals, label="f(x)")
+            ax.set_xlabel("x")
+            ax.set_ylabel("f(x)")
+            ax.set_title("Evaluación de la función en el intervalo acotado")
+            ax.grid(True)
+            st.pyplot(fig)
+        st.json(metricas.como_dict())
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,27 @@
+import numpy as np
+
+
+class Contador:
+    """Objetivo que registra en `llamadas` cuántos puntos evalúa de verdad.
+
+    Envuelve `funcion` o, si no se da, la suma de cuadrados, que acepta lotes
+    (n, d) salvo con `vectorizada=False`.
+    """
+
+    def __init__(self, funcion=None, vectorizada=True):
+        self.funcion = funcion
+        self.vectorizada = vectorizada
+        self.llamadas = 0
+
+    def __call__(self, x):
+        if self.funcion is not None:
+            self.llamadas += np.size(x)
+            return self.funcion(x)
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 2:
+            if not self.vectorizada:
+                raise TypeError("solo puntos sueltos")
+            self.llamadas += len(x)
+            return np.sum(x**2, axis=1)
+        self.llamadas += 1
+        return float(np.sum(x**2))
@@ -0,0 +1,43 @@
+import numpy as np
+
+from optimizacion.aleatorio import GeneradorBloques
+
+
+def extraer(generador):
+    """Pedidos de tamaños mezclados que cruzan varias veces el borde de bloque."""
+    partes = []
+    for tam in [None, 3, 5, (2, 3), None, 11, 4, 20]:
+        partes.append(np.ravel(generador.normal(size=tam)))
+        partes.append(np.ravel(generador.uniform(-1, 1, size=tam)))
+    return np.concatenate(partes)
+
+
+def test_misma_semilla_misma_secuencia_entre_bloques():
+    np.testing.assert_array_equal(extraer(GeneradorBloques(42, tam_bloque=7)),
+                                  extraer(GeneradorBloques(42, tam_bloque=7)))
+    np.testing.assert_array_equal(extraer(GeneradorBloques(42, tam_bloque=7)),
+                                  extraer(GeneradorBloques(np.random.SeedSequence(42), tam_bloque=7)))
+
+
+def test_semillas_distintas_dan_secuencias_distintas():
+    assert not np.array_equal(extraer(GeneradorBloques(1)), extraer(GeneradorBloques(2)))
+
+
+def test_un_bloque_equivale_a_pedir_al_generador_de_una_vez():
+    generador = GeneradorBloques(5, tam_bloque=8)
+    muestras = np.concatenate([generador.normal(size=3), generador.normal(size=4)])
+    np.testing.assert_array_equal(muestras, np.random.default_rng(np.random.SeedSequence(5)).standard_normal(8)[:7])
+
+
+def test_spawn_es_reproducible_y_los_flujos_son_independientes():
+    hijos = GeneradorBloques(7, tam_bloque=16).spawn(4)
+    otra_vez = GeneradorBloques(7, tam_bloque=16).spawn(4)
+    flujos = [extraer(hijo) for hijo in hijos]
+    for flujo, repetido in zip(flujos, [extraer(hijo) for hijo in otra_vez]):
+        np.testing.assert_array_equal(flujo, repetido)
+    padre = extraer(GeneradorBloques(7, tam_bloque=16))
+    for i, flujo in enumerate(flujos):
+        assert not np.array_equal(flujo, padre)
+        for otro in flujos[i + 1:]:
+            assert not np.array_equal(flujo, otro)
+            assert abs(np.corrcoef(flujo, otro)[0, 1]) < 0.5
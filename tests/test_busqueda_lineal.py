@@ -0,0 +1,24 @@
+import pytest
+
+from optimizacion import busqueda_lineal
+
+
+def test_wolfe_sin_acotar_devuelve_el_ultimo_paso_evaluado():
+    evaluados = {}
+
+    def phi(a):
+        evaluados[a] = -a
+        return -a
+
+    alpha, f_alpha = busqueda_lineal.wolfe_fuerte(phi, lambda a: -1.0, 0.0, -1.0, alpha=1e-6, max_iter=5)
+    assert alpha in evaluados
+    assert f_alpha == evaluados[alpha]
+
+
+@pytest.mark.parametrize("nombre", list(busqueda_lineal.BUSQUEDAS))
+def test_busquedas_en_una_parabola(nombre):
+    phi = lambda a: (a - 2.0)**2
+    dphi = lambda a: 2 * (a - 2.0)
+    alpha, f_alpha = busqueda_lineal.BUSQUEDAS[nombre](phi, dphi, phi(0.0), dphi(0.0), 1.0)
+    assert f_alpha == pytest.approx(phi(alpha))
+    assert f_alpha < phi(0.0)
@@ -0,0 +1,70 @@
+import os
+
+import numpy as np
+
+from optimizacion.cache_malla import CacheMallas, clave_funcion
+
+
+def paraboloide(x):
+    return np.sum(np.asarray(x)**2, axis=-1)
+
+
+def otra_forma(x):
+    return np.sum(np.abs(np.asarray(x)), axis=-1)
+
+
+def obtener(cache, funcion, desplazamiento=0.0):
+    return cache.obtener(-1 + desplazamiento, 1 + desplazamiento, -1, 1, funcion, n_puntos=5)[2]
+
+
+def test_lru_en_memoria_descarta_la_malla_menos_usada():
+    cache = CacheMallas(capacidad=2, directorio=None)
+    for desplazamiento in (0, 1, 2):
+        obtener(cache, paraboloide, desplazamiento)
+    assert len(cache._memoria) == 2 and cache.fallos == 3
+    obtener(cache, paraboloide, 0)
+    assert cache.fallos == 4
+    obtener(cache, paraboloide, 2)
+    assert cache.aciertos == 1
+
+
+def test_malla_guardada_en_disco_se_recarga_con_mmap(tmp_path):
+    Z = obtener(CacheMallas(directorio=str(tmp_path)), paraboloide)
+    otra = CacheMallas(directorio=str(tmp_path))
+    recargada = obtener(otra, paraboloide)
+    assert otra.aciertos == 1 and otra.fallos == 0
+    assert isinstance(recargada, np.memmap)
+    np.testing.assert_array_equal(recargada, Z)
+
+
+def test_el_disco_conserva_solo_los_archivos_mas_recientes(tmp_path):
+    cache = CacheMallas(directorio=str(tmp_path), capacidad_disco=3)
+    archivos = []
+    for desplazamiento in range(3):
+        antes = set(tmp_path.iterdir())
+        obtener(cache, paraboloide, desplazamiento)
+        (nuevo,) = set(tmp_path.iterdir()) - antes
+        os.utime(nuevo, ns=(desplazamiento * 10**9,) * 2)
+        archivos.append(nuevo)
+    cache.vaciar()
+    obtener(cache, paraboloide, 0)
+    obtener(cache, paraboloide, 5)
+    restantes = {ruta.name for ruta in tmp_path.glob("*.npy")}
+    assert len(restantes) == 3
+    assert archivos[0].name in restantes and archivos[1].name not in restantes
+
+
+def test_cambiar_el_cuerpo_de_la_funcion_invalida_la_clave(tmp_path, monkeypatch):
+    monkeypatch.setattr(otra_forma, "__qualname__", paraboloide.__qualname__)
+    assert clave_funcion(otra_forma) != clave_funcion(paraboloide)
+    cache = CacheMallas(directorio=str(tmp_path))
+    cuadrado = obtener(cache, paraboloide)
+    absoluto = obtener(cache, otra_forma)
+    assert cache.fallos == 2 and cache.aciertos == 0
+    assert not np.array_equal(cuadrado, absoluto)
+
+
+def test_lambdas_no_se_guardan(tmp_path):
+    cache = CacheMallas(directorio=str(tmp_path))
+    obtener(cache, lambda x: np.sum(np.asarray(x)**2, axis=-1))
+    assert cache.fallos == 0 and not list(tmp_path.iterdir())
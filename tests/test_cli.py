@@ -0,0 +1,28 @@
+import json
+
+import pytest
+
+from optimizacion.__main__ import main
+
+
+@pytest.mark.parametrize("argumentos", [
+    ["brent", "Rastrigin"],
+    ["nada", "Rosenbrock"],
+    ["cauchy", "Nada"],
+    ["cauchy", "Rosenbrock", "-o", "foo=1"],
+    ["cauchy", "Rosenbrock", "-o", "max_iter"],
+    ["cauchy", "Rosenbrock", "-o", "x0=[1, 2]"],
+    ["cauchy", "Rosenbrock", "--x0", "[1, 2, 3]"],
+])
+def test_errores_de_uso_salen_por_argparse(argumentos, capsys):
+    with pytest.raises(SystemExit) as salida:
+        main(argumentos)
+    assert salida.value.code == 2
+    assert "error:" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("metodo", ["brent", "dorada", "newton_raphson", "acotamiento"])
+def test_x0_solo_llega_a_los_metodos_1d_que_lo_aceptan(metodo, capsys):
+    main([metodo, "x² + 54/x", "--x0", "2.5"])
+    resultado = json.loads(capsys.readouterr().out)
+    assert resultado["metodo"] == metodo and len(resultado["x"]) == 1
@@ -0,0 +1,27 @@
+import numpy as np
+
+from optimizacion import diferencias, dual
+
+
+def objetivo(x):
+    return np.sum(x**3) + x[0] * x[1] * x[2] + np.sin(x[0] * x[2])
+
+
+def test_plantilla_compartida_usa_n2_mas_n_mas_1_puntos():
+    for n in (1, 2, 3, 10):
+        assert len(diferencias.plantilla_derivadas(np.zeros(n))) == n**2 + n + 1
+
+
+def test_gradiente_y_hessiano_coinciden_con_los_exactos():
+    x = np.array([0.3, -0.7, 1.1])
+    grad, H = diferencias.gradiente_hessiano(objetivo, x, delta=1e-4)
+    np.testing.assert_allclose(grad, dual.gradiente(objetivo, x), atol=1e-6)
+    np.testing.assert_allclose(H, dual.hessiano(objetivo, x), atol=1e-6)
+    np.testing.assert_array_equal(H, H.T)
+
+
+def test_esquemas_de_gradiente():
+    x = np.array([0.3, -0.7, 1.1])
+    exacto = dual.gradiente(objetivo, x)
+    for esquema in diferencias.ESQUEMAS:
+        np.testing.assert_allclose(diferencias.gradiente(objetivo, x, 1e-6, esquema), exacto, atol=1e-4)
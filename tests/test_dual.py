@@ -0,0 +1,31 @@
+import math
+
+import numpy as np
+import pytest
+
+from optimizacion import dual
+from optimizacion.evaluador import EvaluadorMemo
+from optimizacion.gradiente import NewtonOptimizer, Optimizador
+from optimizacion.unidimensional import Biseccion, calcular_derivada
+
+
+def test_derivadas_exactas_con_duales():
+    np.testing.assert_allclose(dual.gradiente(lambda x: x[0]**2 * np.sin(x[1]), [2.0, 0.5]),
+                               [4 * np.sin(0.5), 4 * np.cos(0.5)])
+    assert dual.derivada(lambda x: math.exp(2 * x), 0.0) == pytest.approx(2.0)
+
+
+def test_objetivo_sin_soporte_dual_recurre_a_diferencias_finitas():
+    optimizador = Optimizador(lambda x: x.dot(x))
+    np.testing.assert_allclose(optimizador.gradiente(np.array([1.0, 2.0])), [2.0, 4.0], rtol=1e-6)
+    assert optimizador.automatica is False
+
+    x = NewtonOptimizer(lambda x: x.dot(x)).optimizar([1.0, 2.0])[0]
+    np.testing.assert_allclose(x, [0.0, 0.0], atol=1e-6)
+
+
+def test_derivada_1d_de_objetivo_sin_soporte_dual():
+    f = EvaluadorMemo(lambda x: x.conjugate()**2)
+    assert calcular_derivada(3.0, 1e-5, f) == pytest.approx(6.0, rel=1e-6)
+    x, _, _ = Biseccion(-1.0, 2.0, 1e-6, lambda x: x.conjugate()**2 - 2 * x)
+    assert x == pytest.approx(1.0, abs=1e-5)
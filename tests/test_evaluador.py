@@ -0,0 +1,59 @@
+import numpy as np
+from conftest import Contador
+
+from optimizacion.evaluador import EvaluadorMemo, memoizar
+from optimizacion.metricas import Metricas
+
+
+def test_aciertos_de_cache_no_cuentan_como_evaluaciones():
+    metricas = Metricas()
+    f = EvaluadorMemo(Contador(), metricas=metricas)
+    assert f([1.0, 2.0]) == 5.0
+    assert f([1.0, 2.0]) == 5.0
+    f([0.0, 1.0])
+    assert (f.nfev, f.aciertos, metricas.nfev, f.f.llamadas) == (2, 1, 2, 2)
+
+
+def test_lote_con_cache_evalua_solo_los_puntos_nuevos():
+    f = EvaluadorMemo(Contador())
+    f([1.0, 1.0])
+    valores = f.evaluar_lote(np.array([[1.0, 1.0], [2.0, 0.0], [2.0, 0.0], [0.0, 3.0]]))
+    np.testing.assert_allclose(valores, [2.0, 4.0, 4.0, 9.0])
+    assert f.nfev == f.f.llamadas
+
+
+def test_la_prueba_de_vectorizacion_cuenta_lo_que_cuesta():
+    for vectorizada in (True, False):
+        objetivo = Contador(vectorizada=vectorizada)
+        f = EvaluadorMemo(objetivo)
+        puntos = np.random.default_rng(0).random((10, 2))
+        np.testing.assert_allclose(f.evaluar_lote_directo(puntos), np.sum(puntos**2, axis=1))
+        assert f.vectorizada is vectorizada
+        assert f.nfev == 13
+        assert objetivo.llamadas <= f.nfev
+
+
+def test_memoizar_reutiliza_un_evaluador_existente():
+    f = EvaluadorMemo(Contador())
+    assert memoizar(f) is f
+
+
+def test_el_pool_de_procesos_se_crea_una_vez_y_se_cierra():
+    from optimizacion.funciones import rosenbrock
+
+    puntos = np.random.default_rng(0).normal(size=(6, 2))
+    with EvaluadorMemo(rosenbrock, vectorizada=False, procesos=2) as f:
+        primero = f.evaluar_lote_directo(puntos)
+        pool = f.pool
+        segundo = f.evaluar_lote_directo(puntos + 1)
+        assert f.pool is pool
+        assert np.allclose(primero, [rosenbrock(p) for p in puntos])
+        assert np.allclose(segundo, [rosenbrock(p) for p in puntos + 1])
+    assert f._pool is None
+
+
+def test_memoizar_respeta_procesos_sobre_un_evaluador_existente():
+    base = EvaluadorMemo(Contador(), procesos=None)
+    vista = memoizar(base, procesos=3)
+    assert vista is not base and vista.procesos == 3 and base.procesos is None
+    assert memoizar(base, metricas=Metricas()).procesos is None
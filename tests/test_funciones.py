@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from optimizacion import dual
+from optimizacion.funciones import FUNCIONES
+
+CASOS = [(nombre, d) for nombre, prueba in FUNCIONES.items() if prueba.gradiente is not None
+         for d in ([prueba.dimension] if prueba.dimension else [2, 3])]
+
+
+def puntos(prueba, d, n=5):
+    limites = prueba.limites_en(d)
+    return np.random.default_rng(len(prueba.nombre) + d).uniform(limites[:, 0], limites[:, 1], size=(n, d))
+
+
+@pytest.mark.parametrize("nombre, d", CASOS)
+def test_derivadas_analiticas_coinciden_con_duales(nombre, d):
+    prueba = FUNCIONES[nombre]
+    X = puntos(prueba, d)
+    gradientes = prueba.gradiente(X)
+    hessianos = prueba.hessiano(X)
+    assert gradientes.shape == (len(X), d) and hessianos.shape == (len(X), d, d)
+    for x, g, H in zip(X, gradientes, hessianos):
+        _, g_ad, H_ad = dual.segundo_orden(prueba.f, x)
+        escala = 1 + np.abs(H_ad).max()
+        np.testing.assert_allclose(g, g_ad, rtol=1e-10, atol=1e-10 * escala)
+        np.testing.assert_allclose(H, H_ad, rtol=1e-10, atol=1e-10 * escala)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from optimizacion.funciones import FUNCIONES
+from optimizacion.gradiente import BFGSOptimizer, CauchyOptimizer, LBFGSOptimizer, NewtonOptimizer
+
+
+@pytest.mark.parametrize("clase", [CauchyOptimizer, NewtonOptimizer, BFGSOptimizer, LBFGSOptimizer])
+def test_todos_los_optimizadores_devuelven_punto_ruta_y_metricas(clase):
+    x, ruta, metricas = clase(FUNCIONES["Booth"].f, max_iter=200).optimizar([0.0, 0.0])
+    np.testing.assert_allclose(x, [1.0, 3.0], atol=1e-2)
+    np.testing.assert_array_equal(ruta[0], [0.0, 0.0])
+    np.testing.assert_array_equal(ruta[-1], x)
+    assert metricas.nfev > 0
+
+
+def test_newton_conserva_el_punto_si_ningun_paso_mejora():
+    x0 = np.array([1.0, 1.0])
+
+    def f(x):
+        return 0.0 if np.array_equal(x, x0) else float(x @ x) + 10
+
+    x, ruta, metricas = NewtonOptimizer(f, gradiente=lambda x: 2 * x, hessiano=lambda x: 2 * np.eye(2)).optimizar(x0)
+    np.testing.assert_array_equal(x, x0)
+    assert len(ruta) == 1 and metricas.iteraciones == 0
+
+
+@pytest.mark.parametrize("busqueda", ["dorada", "armijo", "wolfe"])
+def test_cauchy_con_cada_busqueda(busqueda):
+    x, _, _ = CauchyOptimizer(FUNCIONES["Sphere"].f, busqueda=busqueda).optimizar([1.0, -2.0])
+    np.testing.assert_allclose(x, [0.0, 0.0], atol=1e-2)
+
+
+def test_newton_en_paralelo_reutiliza_un_solo_pool():
+    from functools import partial
+
+    from optimizacion.funciones import rosenbrock
+
+    # Sin derivadas registradas ni duales, el hessiano sale de diferencias finitas.
+    rosenbrock = partial(rosenbrock)
+    serial = NewtonOptimizer(rosenbrock, automatica=False).optimizar(np.array([-1.2, 1.0]))
+    with NewtonOptimizer(rosenbrock, automatica=False, procesos=2) as optimizador:
+        paralelo = optimizador.optimizar(np.array([-1.2, 1.0]))
+        assert optimizador.funcion._pool is not None
+    assert np.allclose(serial[0], paralelo[0])
+    assert serial[2].nfev == paralelo[2].nfev
+
+
+def test_cada_pasada_de_duales_cuenta_como_evaluacion():
+    llamadas = []
+
+    def cuadratica(x):
+        llamadas.append(1)
+        return x[0]**2 + 3 * x[1]**2
+
+    optimizador = NewtonOptimizer(cuadratica)
+    x, _, metricas = optimizador.optimizar(np.array([1.0, -2.0]))
+    assert np.allclose(x, 0, atol=1e-6)
+    assert metricas.nfev == len(llamadas)
+    assert metricas.nhev >= 1
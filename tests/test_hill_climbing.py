@@ -0,0 +1,25 @@
+import numpy as np
+
+from optimizacion.funciones import FUNCIONES
+from optimizacion.hill_climbing import multiarranque
+
+
+def test_multiarranque_serial_y_en_paralelo_coinciden_con_la_misma_semilla():
+    prueba = FUNCIONES["Sphere"]
+    limites = prueba.limites_en(2)
+    serial = multiarranque(prueba.f, limites, arranques=4, pasos=200, semilla=7, procesos=1)
+    paralelo = multiarranque(prueba.f, limites, arranques=4, pasos=200, semilla=7, procesos=2)
+
+    np.testing.assert_array_equal(serial["inicios"], paralelo["inicios"])
+    np.testing.assert_array_equal(serial["finales"], paralelo["finales"])
+    np.testing.assert_array_equal(serial["valores"], paralelo["valores"])
+    assert serial["indice_mejor"] == paralelo["indice_mejor"]
+    assert serial["metricas"].nfev == paralelo["metricas"].nfev
+
+
+def test_multiarranque_cambia_con_la_semilla():
+    prueba = FUNCIONES["Sphere"]
+    limites = prueba.limites_en(2)
+    uno = multiarranque(prueba.f, limites, arranques=2, pasos=50, semilla=1, procesos=1)
+    otro = multiarranque(prueba.f, limites, arranques=2, pasos=50, semilla=2, procesos=1)
+    assert not np.array_equal(uno["inicios"], otro["inicios"])
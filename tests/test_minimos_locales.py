@@ -0,0 +1,34 @@
+import pytest
+from conftest import Contador
+
+from optimizacion.funciones import funcion_3
+from optimizacion.unidimensional import _refinar, brent, minimos_locales, reducir_intervalo
+
+
+def test_encuentra_los_dos_minimos_de_funcion_3():
+    minimos, intervalos, _ = minimos_locales(funcion_3, -1.5, 3, procesos=1)
+    assert [x for x, _ in minimos] == pytest.approx([-0.8019377, 2.2469796], abs=1e-5)
+    assert [valor for _, valor in minimos] == pytest.approx([-8.1152931, -17.6135642], abs=1e-6)
+    assert all(a <= x <= b for (x, _), (a, b) in zip(minimos, intervalos))
+
+
+@pytest.mark.parametrize("metodo", ["brent", "dorada", "mitad"])
+def test_el_refinamiento_no_reevalua_el_mejor_punto(metodo):
+    objetivo = Contador(funcion_3)
+    minimos, _, metricas = minimos_locales(objetivo, -1.5, 3, n=50, metodo=metodo, procesos=1)
+    assert len(minimos) == 2
+    assert metricas.nfev == objetivo.llamadas
+
+    if metodo == "brent":
+        _, puntos, _, solo = brent(funcion_3, 2.0, 2.5, 1e-6)
+    else:
+        _, puntos, _, solo = reducir_intervalo(funcion_3, 2.0, 2.5, 1e-6, metodo)
+    x, valor, refinado = _refinar(funcion_3, 2.0, 2.5, 1e-6, metodo)
+    assert refinado.nfev == solo.nfev
+    assert (x, valor) == min(puntos, key=lambda punto: punto[1])
+
+
+def test_refinamiento_en_paralelo_igual_al_serial():
+    serial = minimos_locales(funcion_3, -1.5, 3, procesos=1)[0]
+    paralelo = minimos_locales(funcion_3, -1.5, 3, procesos=2)[0]
+    assert serial == paralelo
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from optimizacion.funciones import FUNCIONES
+from optimizacion.recocido import RecocidoSimulado, escalera_temperaturas
+
+RASTRIGIN = FUNCIONES["Rastrigin"].f
+
+
+def recocido(semilla, cadenas=4, **opciones):
+    return RecocidoSimulado(RASTRIGIN, [2.5, -1.5], sigma=0.3, max_iter=30, w=10, cadenas=cadenas,
+                            intercambio=3, semilla=semilla, **opciones)
+
+
+def test_misma_semilla_mismo_resultado_con_varias_cadenas():
+    uno, otro = recocido(11), recocido(11)
+    x_uno, f_uno, metricas_uno = uno.optimizar()
+    x_otro, f_otro, metricas_otro = otro.optimizar()
+    np.testing.assert_array_equal(x_uno, x_otro)
+    assert f_uno == f_otro and metricas_uno.nfev == metricas_otro.nfev
+    np.testing.assert_array_equal(uno.mejores_cadenas, otro.mejores_cadenas)
+    np.testing.assert_array_equal(uno.trayectoria.datos, otro.trayectoria.datos)
+    assert (uno.intercambios_propuestos, uno.intercambios_aceptados) == \
+        (otro.intercambios_propuestos, otro.intercambios_aceptados)
+    assert 0 < uno.intercambios_aceptados <= uno.intercambios_propuestos
+
+
+def test_semillas_distintas_recorren_caminos_distintos():
+    assert not np.array_equal(recocido(1).optimizar()[0], recocido(2).optimizar()[0])
+
+
+def test_escalera_geometrica_entre_1_y_t_max():
+    T = escalera_temperaturas(5, 1.0, 16.0)
+    np.testing.assert_allclose(T, [1, 2, 4, 8, 16])
+    np.testing.assert_array_equal(escalera_temperaturas(1, 1.0, 16.0), [1.0])
+
+
+@pytest.mark.parametrize("paridad, esperado", [(0, [1, 0, 3, 2, 4]), (1, [0, 2, 1, 4, 3])])
+def test_intercambios_solo_entre_temperaturas_vecinas(paridad, esperado):
+    algoritmo = recocido(0, cadenas=5)
+    X = np.arange(5.0)[:, None].repeat(2, axis=1)
+    # La cadena más fría tiene el peor valor: todo intercambio propuesto se acepta.
+    fX = np.array([50.0, 40.0, 30.0, 20.0, 10.0])
+    algoritmo.intercambiar(X, fX, escalera_temperaturas(5, 1.0, 16.0), paridad)
+    np.testing.assert_array_equal(X[:, 0], esperado)
+    np.testing.assert_array_equal(fX, 50.0 - 10 * np.array(esperado))
+    assert algoritmo.intercambios_propuestos == algoritmo.intercambios_aceptados == 2
+
+
+def test_intercambio_que_empeora_mucho_la_cadena_fria_se_rechaza():
+    algoritmo = recocido(0, cadenas=2)
+    X = np.array([[0.0, 0.0], [1.0, 1.0]])
+    fX = np.array([0.0, 1e4])
+    algoritmo.intercambiar(X, fX, escalera_temperaturas(2, 1.0, 10.0), 0)
+    np.testing.assert_array_equal(X[:, 0], [0, 1])
+    assert algoritmo.intercambios_propuestos == 1 and algoritmo.intercambios_aceptados == 0
+
+
+def test_escalera_mas_caliente_acepta_mas_intercambios():
+    def tasa(t_max):
+        algoritmo = recocido(3, cadenas=6, t_max=t_max)
+        algoritmo.optimizar()
+        return algoritmo.intercambios_aceptados / algoritmo.intercambios_propuestos
+
+    assert tasa(1.5) > tasa(1000.0)
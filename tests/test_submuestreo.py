@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from optimizacion.submuestreo import lttb, reducir_trayectoria, submuestrear
+from optimizacion.trayectoria import Trayectoria
+
+
+def serie(m=1000, semilla=0):
+    t = np.arange(m, dtype=float)
+    y = np.sin(t / 50) + 0.1 * np.random.default_rng(semilla).normal(size=m)
+    return np.column_stack([t, y])
+
+
+@pytest.mark.parametrize("n", [2, 3, 10, 137, 999])
+def test_lttb_devuelve_n_indices_ordenados_con_los_extremos(n):
+    indices = lttb(serie(), n)
+    assert len(indices) == n
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+
+
+@pytest.mark.parametrize("n", [50, 50_000])
+def test_sin_mas_puntos_que_los_pedidos_se_devuelve_todo(n):
+    np.testing.assert_array_equal(lttb(serie(50), n), np.arange(50))
+    np.testing.assert_array_equal(submuestrear(serie(50), n), np.arange(50))
+
+
+def test_un_pico_sobrevive_al_submuestreo():
+    puntos = serie()
+    puntos[417, 1] = 25.0
+    assert 417 in lttb(puntos, 40)
+
+
+def test_submuestrear_conserva_los_obligatorios_sin_pasarse():
+    obligatorios = [0, 5, 321, 998, 999]
+    indices = submuestrear(serie(), 30, obligatorios)
+    assert len(indices) <= 30
+    assert set(obligatorios) <= set(indices)
+
+
+def test_reducir_trayectoria_conserva_las_mejoras_del_valor():
+    trayectoria = Trayectoria(2)
+    rng = np.random.default_rng(3)
+    for i in range(5000):
+        trayectoria.registrar(rng.normal(size=2), 1.0 if i != 2500 else 0.5)
+    datos = reducir_trayectoria(trayectoria, 100)
+    assert len(datos) <= 100
+    assert 0.5 in datos[:, 2]
+    np.testing.assert_array_equal(datos[[0, -1]], trayectoria.datos[[0, -1]])
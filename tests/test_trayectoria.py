@@ -0,0 +1,54 @@
+import numpy as np
+
+from optimizacion.trayectoria import Trayectoria
+
+
+def llenar(trayectoria, n, aceptados=None):
+    for i in range(n):
+        aceptado = True if aceptados is None else aceptados[i]
+        trayectoria.registrar([i, -i], 10.0 * i, aceptado=aceptado)
+    return trayectoria
+
+
+def test_crece_al_doble_pasada_la_capacidad():
+    trayectoria = Trayectoria(2, capacidad=2)
+    nbytes = trayectoria.nbytes()
+    llenar(trayectoria, 5)
+    assert len(trayectoria) == 5 and trayectoria.nbytes() == 4 * nbytes
+    np.testing.assert_array_equal(trayectoria.puntos[:, 0], range(5))
+    np.testing.assert_array_equal(trayectoria.columna("valor"), [0, 10, 20, 30, 40])
+
+
+def test_anillo_conserva_las_ultimas_filas_en_orden():
+    trayectoria = llenar(Trayectoria(2, anillo=3), 7)
+    assert len(trayectoria) == 3 and trayectoria.pasos == 7
+    np.testing.assert_array_equal(trayectoria.puntos, [[4, -4], [5, -5], [6, -6]])
+    assert trayectoria.nbytes() == 3 * 3 * 8
+
+
+def test_anillo_sin_vuelta_completa():
+    trayectoria = llenar(Trayectoria(2, anillo=4), 2)
+    np.testing.assert_array_equal(trayectoria.puntos[:, 0], [0, 1])
+
+
+def test_cada_k_pasos_y_cerrar_recupera_el_ultimo():
+    trayectoria = llenar(Trayectoria(2, cada=3), 8)
+    np.testing.assert_array_equal(trayectoria.puntos[:, 0], [0, 3, 6])
+    trayectoria.cerrar()
+    np.testing.assert_array_equal(trayectoria.puntos[:, 0], [0, 3, 6, 7])
+    trayectoria.cerrar()
+    assert len(trayectoria) == 4
+
+
+def test_cerrar_no_duplica_un_ultimo_paso_guardado():
+    trayectoria = llenar(Trayectoria(2, cada=3), 7)
+    trayectoria.cerrar()
+    np.testing.assert_array_equal(trayectoria.puntos[:, 0], [0, 3, 6])
+
+
+def test_solo_aceptados_guarda_el_primero_y_los_aceptados():
+    aceptados = [False, True, False, False, True, False]
+    trayectoria = llenar(Trayectoria(2, solo_aceptados=True), 6, aceptados)
+    np.testing.assert_array_equal(trayectoria.puntos[:, 0], [0, 1, 4])
+    trayectoria.cerrar()
+    np.testing.assert_array_equal(trayectoria.puntos[:, 0], [0, 1, 4, 5])
@@ -0,0 +1,115 @@
+import warnings
+
+import numpy as np
+import pytest
+from conftest import Contador
+
+from optimizacion import unidimensional
+from optimizacion.evaluador import EvaluadorMemo, memoizar
+from optimizacion.funciones import FUNCIONES_1D, funcion_0
+from optimizacion.metodos import METODOS_1D
+from optimizacion.metricas import Metricas
+
+PRUEBA = FUNCIONES_1D["x² + 54/x"]
+# Presupuesto mínimo de los métodos con un costo fijo de arranque.
+MINIMOS = {"exhaustiva": 7, "acotamiento": 3, "brent": 1, "unidireccional": 1}
+
+
+def correr(metodo, presupuesto):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return METODOS_1D[metodo](PRUEBA, max_evaluaciones=presupuesto)
+
+
+@pytest.mark.parametrize("metodo", list(METODOS_1D))
+@pytest.mark.parametrize("presupuesto", [0, 1, 2, 3, 5, 7, 12, 40])
+def test_ningun_metodo_excede_el_presupuesto(metodo, presupuesto):
+    if presupuesto < MINIMOS.get(metodo, 0):
+        with pytest.raises(ValueError, match="presupuesto"):
+            correr(metodo, presupuesto)
+        return
+    x, metricas = correr(metodo, presupuesto)
+    assert np.isfinite(x)
+    assert metricas.nfev <= presupuesto
+
+
+@pytest.mark.parametrize("presupuesto", [0, 3, 9])
+def test_minimos_locales_rechaza_presupuestos_que_no_alcanzan(presupuesto):
+    with pytest.raises(ValueError, match="presupuesto"):
+        unidimensional.minimos_locales(funcion_0, 0.1, 10, max_evaluaciones=presupuesto, procesos=1)
+
+
+@pytest.mark.parametrize("presupuesto", [10, 25, 100])
+def test_minimos_locales_respeta_el_presupuesto(presupuesto):
+    minimos, _, metricas = unidimensional.minimos_locales(funcion_0, 0.1, 10, max_evaluaciones=presupuesto,
+                                                          procesos=1)
+    assert minimos and metricas.nfev <= presupuesto
+
+
+@pytest.mark.parametrize("n", [2, 3, 5, 10, 20, 30])
+def test_fibonacci_reduce_a_l0_entre_f_n_mas_1(n):
+    epsilon = 1e-9
+    _, puntos, (a, b), metricas = unidimensional.fibonacci_search(0.1, 10, n, epsilon, funcion_0)
+    fib = unidimensional.fibonacci(n + 1)
+    assert metricas.nfev == len(puntos) == n
+    assert b - a <= 9.9 / fib[n + 1] + epsilon + 1e-12
+
+
+@pytest.mark.parametrize("n", [2, 3, 5, 10, 20, 30, 40])
+def test_dorada_reduce_0618_por_evaluacion(n):
+    _, puntos, (a, b), metricas = unidimensional.golden_section_search(0.1, 10, None, funcion_0, max_evaluaciones=n)
+    assert metricas.nfev == len(puntos) == n
+    assert b - a == pytest.approx(9.9 * unidimensional.PHI ** (n - 1), rel=1e-9)
+
+
+def test_brent_usa_menos_evaluaciones_que_la_dorada():
+    *_, brent = unidimensional.brent(funcion_0, 0.1, 10, 1e-5)
+    *_, dorada = unidimensional.golden_section_search(0.1, 10, 1e-5, funcion_0)
+    assert brent.nfev < dorada.nfev / 2
+
+
+def test_derivada_con_duales_cuenta_una_evaluacion():
+    f = EvaluadorMemo(funcion_0)
+    assert unidimensional.calcular_derivada(3.0, 1e-5, f) == pytest.approx(0.0, abs=1e-12)
+    assert f.nfev == 1
+
+
+def test_derivada_sin_duales_solo_gasta_la_diferencia_central():
+    objetivo = Contador(lambda x: x.conjugate()**2)
+    f = EvaluadorMemo(objetivo, max_evaluaciones=2)
+    assert unidimensional.calcular_derivada(3.0, 1e-5, f) == pytest.approx(6.0, rel=1e-6)
+    assert f.nfev == objetivo.llamadas == 2
+
+
+@pytest.mark.parametrize("metodo", ["newton_raphson", "biseccion", "secante"])
+def test_metodos_con_derivada_cuentan_llamadas_reales(metodo):
+    objetivo = Contador(funcion_0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        _, metricas = METODOS_1D[metodo](PRUEBA.__class__(**{**PRUEBA.__dict__, "f": objetivo}), max_evaluaciones=9)
+    assert metricas.nfev == objetivo.llamadas <= 9
+
+
+def test_memoizar_no_modifica_un_evaluador_ajeno():
+    propias = Metricas()
+    f = EvaluadorMemo(funcion_0, metricas=propias, max_evaluaciones=50)
+    f(1.0)
+    unidimensional.golden_section_search(0.1, 10, 1e-3, f)
+    assert f.metricas is propias and f.max_evaluaciones == 50
+    assert propias.nfev == f.nfev > 1
+
+    vista = memoizar(f, metricas=Metricas(), max_evaluaciones=3)
+    vista(1.0)
+    assert vista.nfev == 0
+    vista(2.0)
+    assert vista.nfev == 1 and f.nfev == propias.nfev
+    assert memoizar(f) is f
+
+
+def test_funcion_0_es_vectorizada_y_conserva_el_polo():
+    x = np.array([0.0, 1.0, 3.0])
+    assert np.array_equal(funcion_0(x), [np.inf, 55.0, 27.0])
+    assert funcion_0(0.0) == np.inf
+    f = EvaluadorMemo(funcion_0)
+    f.evaluar_lote_directo(np.linspace(0, 10, 50))
+    assert f.vectorizada